@@ -1,7 +1,32 @@
 """The artifact definition."""
 
+import copy
+
+from artifacts import definitions
 from artifacts import errors
-from artifacts import registry
+
+# The artifact definitions registry class, which is imported on first use.
+_registry_class = None
+
+
+def _GetRegistryClass():
+    """Retrieves the artifact definitions registry class.
+
+    The registry module is imported on first use, since importing the artifact
+    module should not require the registry module.
+
+    Returns:
+      type: artifact definitions registry class.
+    """
+    global _registry_class  # pylint: disable=global-statement
+
+    if _registry_class is None:
+        # pylint: disable=import-outside-toplevel
+        from artifacts.registry import ArtifactDefinitionsRegistry
+
+        _registry_class = ArtifactDefinitionsRegistry
+
+    return _registry_class
 
 
 class ArtifactDefinition:
@@ -16,6 +41,18 @@ class ArtifactDefinition:
       urls (list[str]): URLs with more information about the artifact definition.
     """
 
+    # The attributes are stored in slots to reduce memory usage, while __dict__
+    # keeps supporting additional attributes set by users of the definitions.
+    __slots__ = (
+        "__dict__",
+        "aliases",
+        "description",
+        "name",
+        "sources",
+        "supported_os",
+        "urls",
+    )
+
     def __init__(self, name, aliases=None, description=None):
         """Initializes an artifact definition.
 
@@ -32,7 +69,7 @@ class ArtifactDefinition:
         self.supported_os = []
         self.urls = []
 
-    def AppendSource(self, type_indicator, attributes):
+    def AppendSource(self, type_indicator, attributes, validate=True):
         """Appends a source.
 
         If you want to implement your own source type you should create a subclass
@@ -43,11 +80,14 @@ class ArtifactDefinition:
         Args:
           type_indicator (str): source type indicator.
           attributes (dict[str, object]): source attributes.
+          validate (Optional[bool]): True if the source attributes should be
+              validated, False if they are known to be valid.
 
         Returns:
           SourceType: a source type.
 
         Raises:
+          AttributeError: if the artifact definition was compacted.
           FormatError: if the type indicator is not set or unsupported,
               or if required attributes are missing.
         """
@@ -55,8 +95,8 @@ class ArtifactDefinition:
             raise errors.FormatError("Missing type indicator.")
 
         try:
-            source_object = registry.ArtifactDefinitionsRegistry.CreateSourceType(
-                type_indicator, attributes
+            source_object = _GetRegistryClass().CreateSourceType(
+                type_indicator, attributes, validate=validate
             )
         except (AttributeError, TypeError) as exception:
             raise errors.FormatError(
@@ -82,7 +122,7 @@ class ArtifactDefinition:
                 "attributes": source.AsDict(),
             }
             if source.supported_os:
-                source_definition["supported_os"] = source.supported_os
+                source_definition["supported_os"] = list(source.supported_os)
             sources.append(source_definition)
 
         artifact_definition = {
@@ -91,9 +131,266 @@ class ArtifactDefinition:
             "sources": sources,
         }
         if self.aliases:
-            artifact_definition["aliases"] = self.aliases
+            artifact_definition["aliases"] = list(self.aliases)
         if self.supported_os:
-            artifact_definition["supported_os"] = self.supported_os
+            artifact_definition["supported_os"] = list(self.supported_os)
         if self.urls:
-            artifact_definition["urls"] = self.urls
+            artifact_definition["urls"] = list(self.urls)
+        return artifact_definition
+
+    def FilterByOS(self, operating_systems):
+        """Filters the artifact definition by operating systems.
+
+        A source applies to an operating system if it is supported by the
+        source, or if the source does not define supported operating systems,
+        by the artifact definition. Sources without supported operating systems
+        of an artifact definition without supported operating systems apply to
+        all operating systems, except for source types that only apply to
+        Windows, such as Windows Registry keys.
+
+        Args:
+          operating_systems (set[str]): operating systems, such as "Linux".
+
+        Returns:
+          ArtifactDefinition: the artifact definition if all its sources apply
+              to the operating systems, a copy with only the sources that apply,
+              or None if no source applies.
+        """
+        if self.supported_os and operating_systems.isdisjoint(self.supported_os):
+            return None
+
+        sources = []
+        for source in self.sources:
+            source_supported_os = source.supported_os or self.supported_os
+            if source.type_indicator in definitions.WINDOWS_ONLY_TYPE_INDICATORS:
+                if definitions.SUPPORTED_OS_WINDOWS not in operating_systems:
+                    continue
+
+                if (
+                    source_supported_os
+                    and definitions.SUPPORTED_OS_WINDOWS not in source_supported_os
+                ):
+                    continue
+
+            elif source_supported_os and operating_systems.isdisjoint(
+                source_supported_os
+            ):
+                continue
+
+            sources.append(source)
+
+        if not sources:
+            return None
+
+        if len(sources) == len(self.sources):
+            return self
+
+        artifact_definition = copy.copy(self)
+        artifact_definition.sources = type(self.sources)(sources)
+        return artifact_definition
+
+    def Compact(self):
+        """Converts the artifact definition into a compact representation.
+
+        The lists of the artifact definition and its sources are replaced by
+        tuples, which use less memory. Sources can no longer be appended to a
+        compacted artifact definition.
+        """
+        self.aliases = tuple(self.aliases)
+        self.supported_os = tuple(self.supported_os)
+        self.urls = tuple(self.urls)
+
+        for source in self.sources:
+            source.Compact()
+
+        self.sources = tuple(self.sources)
+
+    def GetCompactCopy(self):
+        """Retrieves a copy of the artifact definition in compact representation.
+
+        The artifact definition and its sources are copied before they are
+        compacted, hence the artifact definition itself is left unchanged.
+
+        Returns:
+          ArtifactDefinition: compacted copy of the artifact definition.
+        """
+        artifact_definition = copy.copy(self)
+        artifact_definition.sources = [copy.copy(source) for source in self.sources]
+        artifact_definition.Compact()
+        return artifact_definition
+
+
+class LeanArtifactDefinition(ArtifactDefinition):
+    """Artifact definition with deferred description and URLs.
+
+    The description and URLs are not read until they are first requested, when
+    they are read from the document of the artifact definition in the
+    definitions file and from then on kept in memory, unless they were
+    explicitly set.
+    """
+
+    __slots__ = (
+        "_artifacts_reader",
+        "_deferred_attributes_loaded",
+        "_document_offset",
+        "_document_size",
+        "_filename",
+    )
+
+    def __init__(self, name, artifacts_reader, filename, offset, size, aliases=None):
+        """Initializes a lean artifact definition.
+
+        Args:
+          name (str): name that uniquely identifiers the artifact definition.
+          artifacts_reader (YamlArtifactsReader): artifacts reader to read
+              the document of the artifact definition with.
+          filename (str): name of the definitions file.
+          offset (int): offset of the document of the artifact definition
+              relative to the start of the definitions file.
+          size (int): size of the document of the artifact definition.
+          aliases (Optional[str]): aliases that identify the artifact definition.
+        """
+        super().__init__(name, aliases=aliases)
+        self._artifacts_reader = artifacts_reader
+        self._deferred_attributes_loaded = False
+        self._document_offset = offset
+        self._document_size = size
+        self._filename = filename
+        ArtifactDefinition.urls.__set__(self, None)
+
+    def __getstate__(self):
+        """Retrieves the state of the artifact definition for pickling.
+
+        Returns:
+          tuple[dict[str, object], dict[str, object]]: additional attributes
+              and values of the slots of the artifact definition, without
+              reading the description and URLs.
+        """
+        slots_state = {}
+        for cls in type(self).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                if name != "__dict__":
+                    descriptor = vars(cls)[name]
+                    slots_state[name] = descriptor.__get__(self)
+
+        return vars(self), slots_state
+
+    def __setstate__(self, state):
+        """Sets the state of the artifact definition after unpickling.
+
+        Args:
+          state (tuple[dict[str, object], dict[str, object]]): additional
+              attributes and values of the slots of the artifact definition.
+        """
+        attributes, slots_state = state
+        if attributes:
+            vars(self).update(attributes)
+
+        for cls in type(self).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                if name != "__dict__":
+                    descriptor = vars(cls)[name]
+                    descriptor.__set__(self, slots_state[name])
+
+    @property
+    def description(self):
+        """str: description."""
+        if not self._deferred_attributes_loaded:
+            self._LoadDeferredAttributes()
+        return ArtifactDefinition.description.__get__(self)
+
+    @description.setter
+    def description(self, value):
+        """Sets the description.
+
+        Args:
+          value (str): description.
+        """
+        ArtifactDefinition.description.__set__(self, value)
+
+    @property
+    def urls(self):
+        """list[str]: URLs with more information about the artifact definition."""
+        if not self._deferred_attributes_loaded:
+            self._LoadDeferredAttributes()
+        return ArtifactDefinition.urls.__get__(self)
+
+    @urls.setter
+    def urls(self, value):
+        """Sets the URLs.
+
+        Args:
+          value (list[str]): URLs with more information about the artifact
+              definition.
+        """
+        ArtifactDefinition.urls.__set__(self, value)
+
+    def _LoadDeferredAttributes(self):
+        """Loads the description and URLs that were not explicitly set.
+
+        Raises:
+          FormatError: if the document no longer contains the artifact
+              definition.
+        """
+        description = ArtifactDefinition.description.__get__(self)
+        urls = ArtifactDefinition.urls.__get__(self)
+
+        if description is None or urls is None:
+            artifact_definition = self._ReadDocument()
+
+            if description is None:
+                ArtifactDefinition.description.__set__(
+                    self, artifact_definition.description
+                )
+
+            if urls is None:
+                urls = artifact_definition.urls
+                # The URLs of a compacted artifact definition are stored as
+                # a tuple.
+                if isinstance(self.sources, tuple):
+                    urls = tuple(urls)
+                ArtifactDefinition.urls.__set__(self, urls)
+
+        self._deferred_attributes_loaded = True
+
+    def _ReadDocument(self):
+        """Reads the artifact definition from its document.
+
+        Returns:
+          ArtifactDefinition: artifact definition read from the document.
+
+        Raises:
+          FormatError: if the document no longer contains the artifact
+              definition.
+        """
+        # The reader module depends on the artifact module, hence it is imported
+        # here.
+        from artifacts import reader  # pylint: disable=import-outside-toplevel
+
+        index_entry = reader.DocumentIndexEntry(
+            self._filename, self._document_offset, self._document_size, self.name
+        )
+        artifact_definition = self._artifacts_reader.ReadDocument(index_entry)
+        if artifact_definition.name != self.name:
+            raise errors.FormatError(
+                f"Document of artifact definition: {self.name:s} in: "
+                f"{self._filename:s} has changed."
+            )
+
         return artifact_definition
+
+    def Compact(self):
+        """Converts the artifact definition into a compact representation.
+
+        The lists of the artifact definition and its sources are replaced by
+        tuples, which use less memory. Sources can no longer be appended to a
+        compacted artifact definition. URLs that are not resident remain so.
+        """
+        urls = ArtifactDefinition.urls.__get__(self)
+        ArtifactDefinition.urls.__set__(self, ())
+
+        super().Compact()
+
+        if urls is not None:
+            urls = tuple(urls)
+        ArtifactDefinition.urls.__set__(self, urls)
@@ -0,0 +1,843 @@
+"""The binary artifact definitions format.
+
+The binary format stores a set of artifact definitions in a form that can be
+memory mapped and read without parsing the whole file, so that processes on
+the same host can share the artifact definitions through the page cache.
+
+The format consists of:
+* a header, with the offsets and number of entries of the tables;
+* a string table, with the offset and size of every unique UTF-8 string;
+* a definitions table, with a fixed-size record per artifact definition;
+* a sources table, with a fixed-size record per source;
+* an attributes table, with a fixed-size record per source attribute;
+* a values table, with 32-bit values used by lists, such as paths and keys,
+  and key and value pairs;
+* name and alias indexes, with records sorted by lower case name or alias.
+
+All integers are stored in little-endian.
+"""
+
+import mmap
+import struct
+import sys
+
+from artifacts import artifact
+from artifacts import errors
+from artifacts import registry
+from artifacts import writer
+
+
+class BinaryFormatDefinitions:
+    """Binary format definitions."""
+
+    SIGNATURE = b"ARTIFBIN"
+
+    FORMAT_VERSION = 1
+
+    # Value to indicate a string is not set.
+    NO_STRING = 0xFFFFFFFF
+
+    ATTRIBUTE_VALUE_NONE = 0
+    ATTRIBUTE_VALUE_STRING = 1
+    ATTRIBUTE_VALUE_STRING_LIST = 2
+    ATTRIBUTE_VALUE_DICT_LIST = 3
+
+    # signature, format version, then number of entries and offset of:
+    # strings, string data, definitions, sources, attributes, values, name
+    # index and alias index.
+    HEADER = struct.Struct("<8sI16I")
+
+    # offset and size of the string data.
+    STRING = struct.Struct("<II")
+
+    # name, description, aliases values offset and count, supported
+    # operating systems values offset and count, URLs values offset and count,
+    # first source index and number of sources.
+    DEFINITION = struct.Struct("<10I")
+
+    # type indicator, supported operating systems values offset and count,
+    # first attribute index and number of attributes.
+    SOURCE = struct.Struct("<5I")
+
+    # key, value type and value data, where the value data is a string index or
+    # a values offset and count.
+    ATTRIBUTE = struct.Struct("<4I")
+
+    VALUE = struct.Struct("<I")
+
+    # lower case name or alias string index and definition index.
+    INDEX = struct.Struct("<II")
+
+
+class BinaryArtifactsWriter(writer.ArtifactWriter):
+    """Binary artifacts writer."""
+
+    def __init__(self):
+        """Initializes a binary artifacts writer."""
+        super().__init__()
+        self._attributes = []
+        self._definitions = []
+        self._sources = []
+        self._strings = []
+        self._string_indexes = {}
+        self._values = []
+
+    def _AddAttribute(self, key, value):
+        """Adds a source attribute to the attributes table.
+
+        Args:
+          key (str): attribute key.
+          value (object): attribute value.
+
+        Raises:
+          FormatError: if the attribute value type is not supported.
+        """
+        if value is None:
+            attribute_record = (
+                self._AddString(key),
+                BinaryFormatDefinitions.ATTRIBUTE_VALUE_NONE,
+                0,
+                0,
+            )
+
+        elif isinstance(value, str):
+            attribute_record = (
+                self._AddString(key),
+                BinaryFormatDefinitions.ATTRIBUTE_VALUE_STRING,
+                self._AddString(value),
+                0,
+            )
+
+        elif isinstance(value, (list, tuple)) and all(
+            isinstance(item, str) for item in value
+        ):
+            values_offset, number_of_values = self._AddStringList(value)
+            attribute_record = (
+                self._AddString(key),
+                BinaryFormatDefinitions.ATTRIBUTE_VALUE_STRING_LIST,
+                values_offset,
+                number_of_values,
+            )
+
+        elif isinstance(value, (list, tuple)) and all(
+            isinstance(item, dict) for item in value
+        ):
+            values_offset = len(self._values)
+            for item in value:
+                self._values.append(len(item))
+                for item_key, item_value in item.items():
+                    if not isinstance(item_value, str):
+                        raise errors.FormatError(
+                            f"Unsupported value type of attribute: {key:s}."
+                        )
+
+                    self._values.append(self._AddString(item_key))
+                    self._values.append(self._AddString(item_value))
+
+            attribute_record = (
+                self._AddString(key),
+                BinaryFormatDefinitions.ATTRIBUTE_VALUE_DICT_LIST,
+                values_offset,
+                len(value),
+            )
+
+        else:
+            raise errors.FormatError(f"Unsupported value type of attribute: {key:s}.")
+
+        self._attributes.append(attribute_record)
+
+    def _AddDefinition(self, artifact_definition):
+        """Adds an artifact definition to the definitions table.
+
+        Args:
+          artifact_definition (ArtifactDefinition): artifact definition.
+
+        Raises:
+          FormatError: if an attribute value type is not supported.
+        """
+        first_source_index = len(self._sources)
+        for source in artifact_definition.sources:
+            first_attribute_index = len(self._attributes)
+            source_attributes = source.AsDict()
+            for key, value in source_attributes.items():
+                self._AddAttribute(key, value)
+
+            self._sources.append(
+                (
+                    self._AddString(source.type_indicator),
+                    *self._AddStringList(source.supported_os),
+                    first_attribute_index,
+                    len(source_attributes),
+                )
+            )
+
+        self._definitions.append(
+            (
+                self._AddString(artifact_definition.name),
+                self._AddString(artifact_definition.description),
+                *self._AddStringList(artifact_definition.aliases),
+                *self._AddStringList(artifact_definition.supported_os),
+                *self._AddStringList(artifact_definition.urls),
+                first_source_index,
+                len(artifact_definition.sources),
+            )
+        )
+
+    def _AddString(self, string):
+        """Adds a string to the string table.
+
+        Args:
+          string (str): string or None if not set.
+
+        Returns:
+          int: index of the string in the string table.
+        """
+        if string is None:
+            return BinaryFormatDefinitions.NO_STRING
+
+        string_index = self._string_indexes.get(string, None)
+        if string_index is None:
+            string_index = len(self._strings)
+            self._string_indexes[string] = string_index
+            self._strings.append(string)
+
+        return string_index
+
+    def _AddStringList(self, strings):
+        """Adds a list of strings to the values table.
+
+        Args:
+          strings (list[str]): strings.
+
+        Returns:
+          tuple[int, int]: offset of the first value and number of strings.
+        """
+        values_offset = len(self._values)
+        self._values.extend([self._AddString(string) for string in strings])
+        return values_offset, len(strings)
+
+    def FormatArtifacts(self, artifacts):
+        """Formats artifacts to desired output format.
+
+        Args:
+          artifacts (list[ArtifactDefinition]): artifact definitions.
+
+        Returns:
+          bytes: binary formatted artifact definitions.
+
+        Raises:
+          FormatError: if an attribute value type is not supported.
+        """
+        self._attributes = []
+        self._definitions = []
+        self._sources = []
+        self._strings = []
+        self._string_indexes = {}
+        self._values = []
+
+        name_index = []
+        alias_index = []
+        for definition_index, artifact_definition in enumerate(artifacts):
+            self._AddDefinition(artifact_definition)
+
+            name_index.append((artifact_definition.name.lower(), definition_index))
+            for alias in artifact_definition.aliases:
+                alias_index.append((alias.lower(), definition_index))
+
+        name_index = [
+            (self._AddString(name), definition_index)
+            for name, definition_index in sorted(name_index)
+        ]
+        alias_index = [
+            (self._AddString(alias), definition_index)
+            for alias, definition_index in sorted(alias_index)
+        ]
+
+        string_data = []
+        string_records = []
+        string_data_size = 0
+        for string in self._strings:
+            encoded_string = string.encode("utf-8")
+            string_records.append((string_data_size, len(encoded_string)))
+            string_data.append(encoded_string)
+            string_data_size += len(encoded_string)
+
+        tables = [
+            (BinaryFormatDefinitions.STRING, string_records),
+            (None, string_data),
+            (BinaryFormatDefinitions.DEFINITION, self._definitions),
+            (BinaryFormatDefinitions.SOURCE, self._sources),
+            (BinaryFormatDefinitions.ATTRIBUTE, self._attributes),
+            (BinaryFormatDefinitions.VALUE, [(value,) for value in self._values]),
+            (BinaryFormatDefinitions.INDEX, name_index),
+            (BinaryFormatDefinitions.INDEX, alias_index),
+        ]
+
+        header_values = []
+        table_data = []
+        offset = BinaryFormatDefinitions.HEADER.size
+        for table_struct, records in tables:
+            if table_struct:
+                data = b"".join([table_struct.pack(*record) for record in records])
+            else:
+                data = b"".join(records)
+
+            header_values.extend([len(records), offset])
+            table_data.append(data)
+            offset += len(data)
+
+            # Keep the tables 4-byte aligned.
+            if offset % 4:
+                padding_size = 4 - (offset % 4)
+                table_data.append(b"\x00" * padding_size)
+                offset += padding_size
+
+        header_data = BinaryFormatDefinitions.HEADER.pack(
+            BinaryFormatDefinitions.SIGNATURE,
+            BinaryFormatDefinitions.FORMAT_VERSION,
+            *header_values,
+        )
+        return b"".join([header_data, *table_data])
+
+    def WriteArtifactsFile(self, artifacts, filename):
+        """Writes artifact definitions to a file.
+
+        Args:
+          artifacts (list[ArtifactDefinition]): artifact definitions to be written.
+          filename (str): name of the file to write artifacts to.
+
+        Raises:
+          FormatError: if an attribute value type is not supported.
+        """
+        with open(filename, "wb") as file_object:
+            file_object.write(self.FormatArtifacts(artifacts))
+
+
+class BinaryArtifactDefinitions:
+    """Read-only artifact definitions backed by binary formatted data.
+
+    Artifact definitions are built from the binary formatted data when they are
+    first retrieved, hence the cost of opening the data does not depend on the
+    number of artifact definitions it contains.
+    """
+
+    _TABLE_NAMES = [
+        "strings",
+        "string_data",
+        "definitions",
+        "sources",
+        "attributes",
+        "values",
+        "name_index",
+        "alias_index",
+    ]
+
+    _TABLE_STRUCTS = {
+        "alias_index": BinaryFormatDefinitions.INDEX,
+        "attributes": BinaryFormatDefinitions.ATTRIBUTE,
+        "definitions": BinaryFormatDefinitions.DEFINITION,
+        "name_index": BinaryFormatDefinitions.INDEX,
+        "sources": BinaryFormatDefinitions.SOURCE,
+        "strings": BinaryFormatDefinitions.STRING,
+        "values": BinaryFormatDefinitions.VALUE,
+    }
+
+    def __init__(self):
+        """Initializes binary formatted artifact definitions."""
+        super().__init__()
+        self._artifact_definitions = {}
+        self._buffer = None
+        self._tables = {}
+
+    def _GetDefinition(self, definition_index):
+        """Retrieves an artifact definition.
+
+        Args:
+          definition_index (int): index of the artifact definition.
+
+        Returns:
+          ArtifactDefinition: an artifact definition.
+
+        Raises:
+          FormatError: if the artifact definition cannot be read.
+        """
+        artifact_definition = self._artifact_definitions.get(definition_index, None)
+        if artifact_definition:
+            return artifact_definition
+
+        (
+            name_index,
+            description_index,
+            aliases_offset,
+            number_of_aliases,
+            supported_os_offset,
+            number_of_supported_os,
+            urls_offset,
+            number_of_urls,
+            first_source_index,
+            number_of_sources,
+        ) = self._ReadRecord("definitions", definition_index)
+
+        artifact_definition = artifact.ArtifactDefinition(
+            self._GetString(name_index),
+            aliases=self._GetStringList(aliases_offset, number_of_aliases),
+            description=self._GetString(description_index),
+        )
+        artifact_definition.supported_os = self._GetStringList(
+            supported_os_offset, number_of_supported_os
+        )
+        artifact_definition.urls = self._GetStringList(urls_offset, number_of_urls)
+
+        for source_index in range(
+            first_source_index, first_source_index + number_of_sources
+        ):
+            (
+                type_indicator_index,
+                supported_os_offset,
+                number_of_supported_os,
+                first_attribute_index,
+                number_of_attributes,
+            ) = self._ReadRecord("sources", source_index)
+
+            attributes = {}
+            for attribute_index in range(
+                first_attribute_index, first_attribute_index + number_of_attributes
+            ):
+                key_index, value_type, value_data1, value_data2 = self._ReadRecord(
+                    "attributes", attribute_index
+                )
+                attributes[self._GetString(key_index)] = self._GetAttributeValue(
+                    value_type, value_data1, value_data2
+                )
+
+            # The binary formatted data is written from artifact definitions
+            # that were validated when they were read, hence the attributes of
+            # the sources do not need to be validated again.
+            type_indicator = self._GetString(type_indicator_index)
+            source = artifact_definition.AppendSource(
+                type_indicator, attributes, validate=False
+            )
+            source.supported_os = self._GetStringList(
+                supported_os_offset, number_of_supported_os
+            )
+
+        self._artifact_definitions[definition_index] = artifact_definition
+        return artifact_definition
+
+    def _GetAttributeValue(self, value_type, value_data1, value_data2):
+        """Retrieves a source attribute value.
+
+        Args:
+          value_type (int): value type.
+          value_data1 (int): first value data.
+          value_data2 (int): second value data.
+
+        Returns:
+          object: attribute value.
+
+        Raises:
+          FormatError: if the value type is not supported.
+        """
+        if value_type == BinaryFormatDefinitions.ATTRIBUTE_VALUE_NONE:
+            return None
+
+        if value_type == BinaryFormatDefinitions.ATTRIBUTE_VALUE_STRING:
+            return self._GetString(value_data1)
+
+        if value_type == BinaryFormatDefinitions.ATTRIBUTE_VALUE_STRING_LIST:
+            return self._GetStringList(value_data1, value_data2)
+
+        if value_type == BinaryFormatDefinitions.ATTRIBUTE_VALUE_DICT_LIST:
+            values_offset = value_data1
+            items = []
+            for _ in range(value_data2):
+                (number_of_pairs,) = self._ReadRecord("values", values_offset)
+                pair_values = self._GetStringList(
+                    values_offset + 1, number_of_pairs * 2
+                )
+                items.append(dict(zip(pair_values[0::2], pair_values[1::2])))
+                values_offset += 1 + (number_of_pairs * 2)
+
+            return items
+
+        raise errors.FormatError(f"Unsupported attribute value type: {value_type:d}.")
+
+    def _GetIndexedDefinition(self, index_table, key):
+        """Retrieves an artifact definition from a sorted index.
+
+        Args:
+          index_table (str): name of the index table.
+          key (str): lower case name or alias.
+
+        Returns:
+          ArtifactDefinition: an artifact definition or None if not available.
+        """
+        number_of_entries, _ = self._tables[index_table]
+
+        lower_bound = 0
+        upper_bound = number_of_entries
+        while lower_bound < upper_bound:
+            middle = (lower_bound + upper_bound) // 2
+            string_index, definition_index = self._ReadRecord(index_table, middle)
+            middle_key = self._GetString(string_index)
+            if middle_key == key:
+                return self._GetDefinition(definition_index)
+
+            if middle_key < key:
+                lower_bound = middle + 1
+            else:
+                upper_bound = middle
+
+        return None
+
+    def _GetString(self, string_index):
+        """Retrieves a string from the string table.
+
+        Args:
+          string_index (int): index of the string.
+
+        Returns:
+          str: string or None if not set.
+        """
+        if string_index == BinaryFormatDefinitions.NO_STRING:
+            return None
+
+        string_offset, string_size = self._ReadRecord("strings", string_index)
+
+        _, string_data_offset = self._tables["string_data"]
+        string_offset += string_data_offset
+
+        string_data = self._buffer[string_offset : string_offset + string_size]
+        return bytes(string_data).decode("utf-8")
+
+    def _GetStringList(self, values_offset, number_of_values):
+        """Retrieves a list of strings.
+
+        Args:
+          values_offset (int): offset of the first value in the values table.
+          number_of_values (int): number of values.
+
+        Returns:
+          list[str]: strings.
+        """
+        return [
+            self._GetString(self._ReadRecord("values", value_index)[0])
+            for value_index in range(values_offset, values_offset + number_of_values)
+        ]
+
+    def _ReadRecord(self, table_name, record_index):
+        """Reads a record from a table.
+
+        Args:
+          table_name (str): name of the table.
+          record_index (int): index of the record.
+
+        Returns:
+          tuple[int, ...]: record values.
+
+        Raises:
+          FormatError: if the record index is out of bounds.
+        """
+        number_of_records, table_offset = self._tables[table_name]
+        if record_index < 0 or record_index >= number_of_records:
+            raise errors.FormatError(
+                f"Record index: {record_index:d} out of bounds of table: "
+                f"{table_name:s}."
+            )
+
+        table_struct = self._TABLE_STRUCTS[table_name]
+        return table_struct.unpack_from(
+            self._buffer, table_offset + (record_index * table_struct.size)
+        )
+
+    def _SetBuffer(self, buffer):
+        """Sets the buffer with the binary formatted data.
+
+        Args:
+          buffer (object): object that supports the buffer protocol, such as
+              bytes, mmap.mmap or memoryview.
+
+        Raises:
+          FormatError: if the binary formatted data is not supported.
+        """
+        buffer_size = len(buffer)
+        if buffer_size < BinaryFormatDefinitions.HEADER.size:
+            raise errors.FormatError("Binary formatted data too small.")
+
+        header_values = BinaryFormatDefinitions.HEADER.unpack_from(buffer, 0)
+        if header_values[0] != BinaryFormatDefinitions.SIGNATURE:
+            raise errors.FormatError("Unsupported binary format signature.")
+
+        if header_values[1] != BinaryFormatDefinitions.FORMAT_VERSION:
+            raise errors.FormatError(
+                f"Unsupported binary format version: {header_values[1]:d}."
+            )
+
+        tables = {}
+        for table_index, table_name in enumerate(self._TABLE_NAMES):
+            number_of_records = header_values[2 + (table_index * 2)]
+            table_offset = header_values[3 + (table_index * 2)]
+
+            table_struct = self._TABLE_STRUCTS.get(table_name, None)
+            record_size = table_struct.size if table_struct else 0
+            if table_offset + (number_of_records * record_size) > buffer_size:
+                raise errors.FormatError(
+                    f"Table: {table_name:s} exceeds binary formatted data."
+                )
+
+            tables[table_name] = (number_of_records, table_offset)
+
+        self._artifact_definitions = {}
+        self._buffer = buffer
+        self._tables = tables
+
+    def GetDefinitionByAlias(self, alias):
+        """Retrieves a specific artifact definition by alias.
+
+        Args:
+          alias (str): alias of the artifact definition.
+
+        Returns:
+          ArtifactDefinition: an artifact definition or None if not available.
+        """
+        if not alias:
+            return None
+
+        return self._GetIndexedDefinition("alias_index", alias.lower())
+
+    def GetDefinitionByName(self, name):
+        """Retrieves a specific artifact definition by name.
+
+        Args:
+          name (str): name of the artifact definition.
+
+        Returns:
+          ArtifactDefinition: an artifact definition or None if not available.
+        """
+        if not name:
+            return None
+
+        return self._GetIndexedDefinition("name_index", name.lower())
+
+    def GetDefinitions(self):
+        """Retrieves the artifact definitions.
+
+        Yields:
+          ArtifactDefinition: artifact definition.
+        """
+        number_of_definitions, _ = self._tables["definitions"]
+        for definition_index in range(number_of_definitions):
+            yield self._GetDefinition(definition_index)
+
+    def GetNumberOfDefinitions(self):
+        """Retrieves the number of artifact definitions.
+
+        Returns:
+          int: number of artifact definitions.
+        """
+        number_of_definitions, _ = self._tables["definitions"]
+        return number_of_definitions
+
+    def GetUndefinedArtifacts(self):
+        """Retrieves the names of undefined artifacts used by artifact groups.
+
+        Returns:
+          set[str]: undefined artifacts names.
+        """
+        artifact_registry = registry.ArtifactDefinitionsRegistry()
+        for artifact_definition in self.GetDefinitions():
+            artifact_registry.RegisterDefinition(artifact_definition)
+
+        return artifact_registry.GetUndefinedArtifacts()
+
+
+class BinaryArtifactDefinitionsFile(BinaryArtifactDefinitions):
+    """Read-only artifact definitions backed by a memory mapped binary file."""
+
+    def __init__(self):
+        """Initializes a binary artifact definitions file."""
+        super().__init__()
+        self._file_object = None
+        self._mmap = None
+
+    def Close(self):
+        """Closes the binary artifact definitions file."""
+        self._artifact_definitions = {}
+        self._buffer = None
+        self._tables = {}
+
+        if self._mmap:
+            self._mmap.close()
+            self._mmap = None
+
+        if self._file_object:
+            self._file_object.close()
+            self._file_object = None
+
+    def Open(self, filename):
+        """Opens a binary artifact definitions file.
+
+        Args:
+          filename (str): name of the file.
+
+        Raises:
+          FormatError: if the binary formatted data is not supported.
+        """
+        file_object = open(filename, "rb")  # pylint: disable=consider-using-with
+        try:
+            mapped_file = mmap.mmap(file_object.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            file_object.close()
+            raise errors.FormatError("Unable to map empty binary formatted data.")
+
+        try:
+            self._SetBuffer(mapped_file)
+        except errors.FormatError:
+            mapped_file.close()
+            file_object.close()
+            raise
+
+        self._file_object = file_object
+        self._mmap = mapped_file
+
+
+class BinaryArtifactDefinitionsSharedMemory(BinaryArtifactDefinitions):
+    """Read-only artifact definitions backed by a shared memory block.
+
+    The process that creates the shared memory block publishes the binary
+    formatted artifact definitions once, after which other processes, such as
+    the workers of a multiprocessing pool, can open the shared memory block by
+    name. Every process only builds the artifact definitions it retrieves.
+
+    The process that created the shared memory block should unlink it once
+    it is no longer needed. Before Python 3.13, a process that opens the shared
+    memory block registers it with the multiprocessing resource tracker, which
+    unlinks it when the process exits, unless the process shares the resource
+    tracker of the process that created the block, like the workers of
+    a multiprocessing pool do.
+
+    Attributes:
+      name (str): name of the shared memory block.
+    """
+
+    def __init__(self):
+        """Initializes binary artifact definitions in shared memory."""
+        super().__init__()
+        self._shared_memory = None
+        self.name = None
+
+    def _SetSharedMemory(self, shared_memory):
+        """Sets the shared memory block with the binary formatted data.
+
+        Args:
+          shared_memory (multiprocessing.shared_memory.SharedMemory): shared
+              memory block.
+
+        Raises:
+          FormatError: if the binary formatted data is not supported.
+        """
+        try:
+            self._SetBuffer(shared_memory.buf)
+        except errors.FormatError:
+            shared_memory.close()
+            raise
+
+        self._shared_memory = shared_memory
+        self.name = shared_memory.name
+
+    def Close(self):
+        """Closes the shared memory block.
+
+        The shared memory block remains available to other processes until it
+        is unlinked.
+        """
+        self._artifact_definitions = {}
+        self._buffer = None
+        self._tables = {}
+
+        if self._shared_memory:
+            self._shared_memory.close()
+            self._shared_memory = None
+
+    def Create(self, artifact_definitions, name=None):
+        """Creates a shared memory block with artifact definitions.
+
+        Args:
+          artifact_definitions (iterable[ArtifactDefinition]): artifact
+              definitions to publish, such as those of an artifact definitions
+              registry.
+          name (Optional[str]): name of the shared memory block, where None
+              represents a unique name chosen by the operating system.
+
+        Returns:
+          str: name of the shared memory block, which other processes pass to
+              Open.
+
+        Raises:
+          FileExistsError: if a shared memory block with the name already
+              exists.
+          FormatError: if an attribute value type is not supported.
+        """
+        # pylint: disable=import-outside-toplevel
+        from multiprocessing import shared_memory
+
+        artifact_writer = BinaryArtifactsWriter()
+        binary_data = artifact_writer.FormatArtifacts(list(artifact_definitions))
+
+        shared_memory_block = shared_memory.SharedMemory(
+            name=name, create=True, size=len(binary_data)
+        )
+        try:
+            shared_memory_block.buf[: len(binary_data)] = binary_data
+
+            self._SetSharedMemory(shared_memory_block)
+
+        except Exception:
+            # The shared memory block was created by this process, hence it is
+            # destroyed so that it does not outlive the process.
+            shared_memory_block.close()
+            shared_memory_block.unlink()
+            raise
+
+        return self.name
+
+    def Open(self, name):
+        """Opens an existing shared memory block with artifact definitions.
+
+        Args:
+          name (str): name of the shared memory block.
+
+        Raises:
+          FileNotFoundError: if the shared memory block does not exist.
+          FormatError: if the binary formatted data is not supported.
+        """
+        # pylint: disable=import-outside-toplevel
+        from multiprocessing import shared_memory
+
+        if sys.version_info >= (3, 13):
+            # The process that created the shared memory block owns it.
+            # pylint: disable=unexpected-keyword-arg
+            shared_memory_block = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            shared_memory_block = shared_memory.SharedMemory(name=name)
+
+        self._SetSharedMemory(shared_memory_block)
+
+    def Unlink(self):
+        """Unlinks the shared memory block.
+
+        The shared memory block is destroyed once every process has closed it.
+
+        Raises:
+          FileNotFoundError: if the shared memory block no longer exists.
+        """
+        if self._shared_memory:
+            self._shared_memory.unlink()
+
+        elif self.name:
+            # pylint: disable=import-outside-toplevel
+            from multiprocessing import shared_memory
+
+            shared_memory_block = shared_memory.SharedMemory(name=self.name)
+            shared_memory_block.close()
+            shared_memory_block.unlink()
@@ -0,0 +1,247 @@
+"""The artifact definitions cache."""
+
+import hashlib
+import os
+import pickle
+import stat
+import tempfile
+
+import artifacts
+
+from artifacts import registry
+
+
+class ArtifactDefinitionsCache:
+    """Persistent cache of validated artifact definitions.
+
+    The cache stores the artifact definitions read from a definitions file
+    together with the modification time, size and SHA-256 digest of the file.
+    A cache entry is only used if all of these still match the file, which
+    allows a warm start to skip parsing and validation of the definitions.
+
+    Since unpickling a cache entry can run arbitrary code, cache entries are
+    only read if they and the cache directory are owned by the current user
+    and not writable by others.
+    """
+
+    _FORMAT_VERSION = 4
+
+    def __init__(self, path):
+        """Initializes an artifact definitions cache.
+
+        Args:
+          path (str): path of the directory to store the cache entries in.
+        """
+        super().__init__()
+        self._path = path
+
+    def _GetEntryPath(self, artifacts_reader, filename):
+        """Retrieves the path of the cache entry of a definitions file.
+
+        Args:
+          artifacts_reader (ArtifactsReader): an artifacts reader.
+          filename (str): name of the definitions file.
+
+        Returns:
+          str: path of the cache entry.
+        """
+        # Definitions read with a differently configured reader can differ,
+        # hence the reader configuration is part of the cache key, as is the
+        # layout of the classes of the pickled artifact definitions.
+        reader_identifier = artifacts_reader.GetConfigurationIdentifier()
+        schema_identifier = registry.ArtifactDefinitionsRegistry.GetSchemaIdentifier()
+        entry_identifier = "\x00".join(
+            [os.path.abspath(filename), reader_identifier, schema_identifier]
+        )
+        entry_digest = hashlib.sha256(entry_identifier.encode("utf-8")).hexdigest()
+        return os.path.join(self._path, f"{entry_digest:s}.pickle")
+
+    def _GetFileDigest(self, filename):
+        """Retrieves the status and digest of a definitions file.
+
+        Args:
+          filename (str): name of the definitions file.
+
+        Returns:
+          tuple[tuple[int, int], str]: status of the file, which consists of its
+              modification time in nanoseconds and size, and SHA-256 digest of
+              its content.
+        """
+        file_hash = hashlib.sha256()
+        with open(filename, "rb") as file_object:
+            stat_object = os.fstat(file_object.fileno())
+            file_hash.update(file_object.read())
+
+        return (stat_object.st_mtime_ns, stat_object.st_size), file_hash.hexdigest()
+
+    def _IsTrusted(self, stat_object):
+        """Determines if a cache file or directory can be trusted.
+
+        Args:
+          stat_object (os.stat_result): status of the file or directory.
+
+        Returns:
+          bool: True if the file or directory is owned by the current user and
+              not writable by the group or others.
+        """
+        if hasattr(os, "geteuid") and stat_object.st_uid != os.geteuid():
+            return False
+
+        return not stat_object.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+    def _ReadEntry(self, entry_path):
+        """Reads a cache entry.
+
+        Args:
+          entry_path (str): path of the cache entry.
+
+        Returns:
+          dict[str, object]: cache entry or None if not available, unreadable
+              or not trusted.
+        """
+        try:
+            if not self._IsTrusted(os.stat(self._path)):
+                return None
+
+            with open(entry_path, "rb") as file_object:
+                if not self._IsTrusted(os.fstat(file_object.fileno())):
+                    return None
+
+                cache_entry = pickle.load(file_object)
+
+        # A corrupted or truncated entry can cause unpickling to raise almost
+        # any exception, which is handled as a cache miss.
+        except Exception:  # pylint: disable=broad-exception-caught
+            return None
+
+        if not isinstance(cache_entry, dict):
+            return None
+
+        if cache_entry.get("format_version") != self._FORMAT_VERSION:
+            return None
+
+        if cache_entry.get("artifacts_version") != artifacts.__version__:
+            return None
+
+        return cache_entry
+
+    def _WriteEntry(self, entry_path, cache_entry):
+        """Writes a cache entry.
+
+        The entry is written to a temporary file that replaces the previous
+        entry, so that concurrent readers never see a partially written entry.
+
+        Args:
+          entry_path (str): path of the cache entry.
+          cache_entry (dict[str, object]): cache entry.
+        """
+        os.makedirs(self._path, mode=0o700, exist_ok=True)
+
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            dir=self._path, suffix=".tmp"
+        )
+        try:
+            with os.fdopen(file_descriptor, "wb") as file_object:
+                pickle.dump(cache_entry, file_object, protocol=pickle.HIGHEST_PROTOCOL)
+
+            os.replace(temporary_path, entry_path)
+
+        finally:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+    def Clear(self):
+        """Removes all cache entries."""
+        if not os.path.isdir(self._path):
+            return
+
+        for entry_name in os.listdir(self._path):
+            if entry_name.endswith(".pickle"):
+                os.remove(os.path.join(self._path, entry_name))
+
+    def ReadDirectory(self, artifacts_reader, path, extension="yaml"):
+        """Reads artifact definitions from a directory using the cache.
+
+        This function does not recurse sub directories.
+
+        Args:
+          artifacts_reader (ArtifactsReader): an artifacts reader.
+          path (str): path of the directory to read from.
+          extension (Optional[str]): extension of the filenames to read.
+
+        Yields:
+          ArtifactDefinition: an artifact definition.
+
+        Raises:
+          FormatError: if the format of an artifact definition is not set
+              or incorrect.
+        """
+        for filename in artifacts_reader.GetDirectoryFilenames(
+            path, extension=extension
+        ):
+            yield from self.ReadFile(artifacts_reader, filename)
+
+    def ReadFile(self, artifacts_reader, filename):
+        """Reads artifact definitions from a file using the cache.
+
+        If the cache has no valid entry for the file, the definitions are read
+        with the artifacts reader and the cache entry is (re)populated. The
+        names of the artifact definitions the reader filtered out are stored
+        in the cache entry as well and added to those of the reader on reuse.
+
+        Args:
+          artifacts_reader (ArtifactsReader): an artifacts reader.
+          filename (str): name of the file to read from.
+
+        Returns:
+          list[ArtifactDefinition]: artifact definitions.
+
+        Raises:
+          FormatError: if the format of an artifact definition is not set
+              or incorrect.
+        """
+        file_status, file_digest = self._GetFileDigest(filename)
+        modification_time, size = file_status
+
+        entry_path = self._GetEntryPath(artifacts_reader, filename)
+        cache_entry = self._ReadEntry(entry_path)
+        if (
+            cache_entry
+            and cache_entry.get("modification_time") == modification_time
+            and cache_entry.get("size") == size
+            and cache_entry.get("digest") == file_digest
+        ):
+            artifacts_reader.filtered_artifact_names.update(
+                cache_entry["filtered_artifact_names"]
+            )
+            return cache_entry["artifact_definitions"]
+
+        previous_filtered_artifact_names = set(artifacts_reader.filtered_artifact_names)
+        # The definitions are read with the reader's own file reading, which
+        # for example creates lean artifact definitions in lean mode.
+        artifact_definitions = list(artifacts_reader.ReadFile(filename))
+        filtered_artifact_names = (
+            artifacts_reader.filtered_artifact_names - previous_filtered_artifact_names
+        )
+
+        # The entry is not written if the file changed while it was read, since
+        # the definitions then may not correspond with the digest.
+        if (file_status, file_digest) != self._GetFileDigest(filename):
+            return artifact_definitions
+
+        cache_entry = {
+            "artifact_definitions": artifact_definitions,
+            "artifacts_version": artifacts.__version__,
+            "digest": file_digest,
+            "filtered_artifact_names": filtered_artifact_names,
+            "format_version": self._FORMAT_VERSION,
+            "modification_time": modification_time,
+            "size": size,
+        }
+        try:
+            self._WriteEntry(entry_path, cache_entry)
+        except OSError:
+            # A cache that cannot be written should not prevent reading.
+            pass
+
+        return artifact_definitions
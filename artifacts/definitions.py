@@ -43,3 +43,12 @@ TOP_LEVEL_KEYS = frozenset(
         "urls",
     ]
 )
+
+# Source types that only apply to Windows, independent of their supported_os.
+WINDOWS_ONLY_TYPE_INDICATORS = frozenset(
+    [
+        TYPE_INDICATOR_WINDOWS_REGISTRY_KEY,
+        TYPE_INDICATOR_WINDOWS_REGISTRY_VALUE,
+        TYPE_INDICATOR_WMI_QUERY,
+    ]
+)
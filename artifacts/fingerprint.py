@@ -0,0 +1,266 @@
+"""The artifact definitions content fingerprint.
+
+The fingerprint is a hash tree of the artifact definitions in a directory.
+The leaves are the SHA-256 digests of the canonical JSON representation of
+the individual artifact definitions, the next level the digests of the
+definitions files and the root the digest of the directory. The digest of
+a definitions file only depends on the artifact definitions in the file,
+hence changes to comments or formatting do not change the fingerprint.
+"""
+
+import hashlib
+import json
+import os
+
+
+class FileFingerprint:
+    """Fingerprint of a definitions file.
+
+    Attributes:
+      content_digest (str): SHA-256 digest of the content of the file.
+      definition_digests (dict[str, str]): SHA-256 digest of the canonical
+          representation per name of artifact definition in the file.
+      digest (str): SHA-256 digest of the artifact definitions in the file.
+      filename (str): name of the definitions file, without the path of the
+          directory.
+    """
+
+    __slots__ = ("content_digest", "definition_digests", "digest", "filename")
+
+    def __init__(self, filename, content_digest, definition_digests, digest):
+        """Initializes a definitions file fingerprint.
+
+        Args:
+          filename (str): name of the definitions file, without the path of the
+              directory.
+          content_digest (str): SHA-256 digest of the content of the file.
+          definition_digests (dict[str, str]): SHA-256 digest of the canonical
+              representation per name of artifact definition in the file.
+          digest (str): SHA-256 digest of the artifact definitions in the file.
+        """
+        super().__init__()
+        self.content_digest = content_digest
+        self.definition_digests = definition_digests
+        self.digest = digest
+        self.filename = filename
+
+
+class FingerprintDifferences:
+    """Differences between two artifact definitions fingerprints.
+
+    Attributes:
+      added (set[str]): names of artifact definitions that were added.
+      changed (set[str]): names of artifact definitions that were changed.
+      removed (set[str]): names of artifact definitions that were removed.
+    """
+
+    __slots__ = ("added", "changed", "removed")
+
+    def __init__(self, added, changed, removed):
+        """Initializes artifact definitions fingerprint differences.
+
+        Args:
+          added (set[str]): names of artifact definitions that were added.
+          changed (set[str]): names of artifact definitions that were changed.
+          removed (set[str]): names of artifact definitions that were removed.
+        """
+        super().__init__()
+        self.added = added
+        self.changed = changed
+        self.removed = removed
+
+    def __bool__(self):
+        """Determines if there are differences.
+
+        Returns:
+          bool: True if artifact definitions were added, changed or removed.
+        """
+        return bool(self.added or self.changed or self.removed)
+
+
+class ArtifactDefinitionsFingerprint:
+    """Content fingerprint of the artifact definitions in a directory.
+
+    Attributes:
+      digest (str): SHA-256 digest of the artifact definitions in the
+          directory or None if not computed.
+      file_fingerprints (dict[str, FileFingerprint]): fingerprint per name of
+          definitions file, without the path of the directory.
+      reader_configuration (str): configuration identifier of the artifacts
+          reader the artifact definitions were read with.
+    """
+
+    # Size of the blocks in which the content of a file is hashed.
+    _READ_SIZE = 1024 * 1024
+
+    def __init__(self):
+        """Initializes an artifact definitions fingerprint."""
+        super().__init__()
+        self.digest = None
+        self.file_fingerprints = {}
+        self.reader_configuration = None
+
+    def _GetContentDigest(self, filename):
+        """Retrieves the digest of the content of a file.
+
+        The file is read in blocks, hence large files are not read into
+        memory at once.
+
+        Args:
+          filename (str): name of the file.
+
+        Returns:
+          str: SHA-256 digest of the content of the file.
+        """
+        content_hash = hashlib.sha256()
+        with open(filename, "rb") as file_object:
+            data = file_object.read(self._READ_SIZE)
+            while data:
+                content_hash.update(data)
+                data = file_object.read(self._READ_SIZE)
+
+        return content_hash.hexdigest()
+
+    def _GetDefinitionDigest(self, artifact_definition):
+        """Retrieves the digest of an artifact definition.
+
+        Args:
+          artifact_definition (ArtifactDefinition): an artifact definition.
+
+        Returns:
+          str: SHA-256 digest of the canonical JSON representation of the
+              artifact definition.
+        """
+        json_string = json.dumps(
+            artifact_definition.AsDict(),
+            ensure_ascii=False,
+            separators=(",", ":"),
+            sort_keys=True,
+        )
+        return hashlib.sha256(json_string.encode("utf-8")).hexdigest()
+
+    def _GetNodeDigest(self, child_digests):
+        """Retrieves the digest of a node in the hash tree.
+
+        Args:
+          child_digests (dict[str, str]): digest per name of the children of
+              the node.
+
+        Returns:
+          str: SHA-256 digest of the names and digests of the children, sorted
+              by name, so that the digest does not depend on their order.
+        """
+        node_hash = hashlib.sha256()
+        for name, digest in sorted(child_digests.items()):
+            node_hash.update(f"{name:s}\x00{digest:s}\n".encode("utf-8"))
+
+        return node_hash.hexdigest()
+
+    def Compute(
+        self, artifacts_reader, path, extension="yaml", previous_fingerprint=None
+    ):
+        """Computes the fingerprint of the artifact definitions in a directory.
+
+        This function does not recurse sub directories.
+
+        Args:
+          artifacts_reader (ArtifactsReader): an artifacts reader.
+          path (str): path of the directory with the definitions files.
+          extension (Optional[str]): extension of the filenames, where None
+              represents all files.
+          previous_fingerprint (Optional[ArtifactDefinitionsFingerprint]):
+              fingerprint of a previous computation, of which the digests of
+              the artifact definitions are reused for definitions files with
+              the same content, so that only changed files are read.
+
+        Raises:
+          FormatError: if the format of an artifact definition is not set
+              or incorrect.
+        """
+        reader_configuration = artifacts_reader.GetConfigurationIdentifier()
+
+        previous_file_fingerprints = {}
+        if (
+            previous_fingerprint
+            and previous_fingerprint.reader_configuration == reader_configuration
+        ):
+            previous_file_fingerprints = previous_fingerprint.file_fingerprints
+
+        file_fingerprints = {}
+        for filename in artifacts_reader.GetDirectoryFilenames(
+            path, extension=extension
+        ):
+            basename = os.path.basename(filename)
+            content_digest = self._GetContentDigest(filename)
+
+            file_fingerprint = previous_file_fingerprints.get(basename, None)
+            if file_fingerprint and file_fingerprint.content_digest != content_digest:
+                file_fingerprint = None
+
+            if not file_fingerprint:
+                definition_digests = {
+                    artifact_definition.name: self._GetDefinitionDigest(
+                        artifact_definition
+                    )
+                    for artifact_definition in artifacts_reader.ReadFile(filename)
+                }
+                file_fingerprint = FileFingerprint(
+                    basename,
+                    content_digest,
+                    definition_digests,
+                    self._GetNodeDigest(definition_digests),
+                )
+
+            file_fingerprints[basename] = file_fingerprint
+
+        self.digest = self._GetNodeDigest(
+            {
+                basename: file_fingerprint.digest
+                for basename, file_fingerprint in file_fingerprints.items()
+            }
+        )
+        self.file_fingerprints = file_fingerprints
+        self.reader_configuration = reader_configuration
+
+    def Diff(self, other):
+        """Determines the differences with another fingerprint.
+
+        Artifact definitions that moved to another definitions file without
+        other changes are not considered changed.
+
+        Args:
+          other (ArtifactDefinitionsFingerprint): fingerprint to compare with,
+              such as that of a later computation.
+
+        Returns:
+          FingerprintDifferences: artifact definitions that were added in,
+              changed in or removed from the other fingerprint.
+        """
+        if self.digest is not None and self.digest == other.digest:
+            return FingerprintDifferences(set(), set(), set())
+
+        definition_digests = self.GetDefinitionDigests()
+        other_definition_digests = other.GetDefinitionDigests()
+
+        names = set(definition_digests)
+        other_names = set(other_definition_digests)
+
+        changed = {
+            name
+            for name in names & other_names
+            if definition_digests[name] != other_definition_digests[name]
+        }
+        return FingerprintDifferences(other_names - names, changed, names - other_names)
+
+    def GetDefinitionDigests(self):
+        """Retrieves the digests of the artifact definitions.
+
+        Returns:
+          dict[str, str]: SHA-256 digest of the canonical representation per
+              name of artifact definition.
+        """
+        definition_digests = {}
+        for file_fingerprint in self.file_fingerprints.values():
+            definition_digests.update(file_fingerprint.definition_digests)
+
+        return definition_digests
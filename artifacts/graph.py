@@ -0,0 +1,354 @@
+"""The graph of the references between artifact groups.
+
+The nodes of the graph are the artifact definitions and the edges the
+references of artifact group sources to the names of their members. The
+strongly connected components of the graph are determined with an iterative
+version of Tarjan's algorithm, hence deeply nested artifact groups do not
+run into the recursion limit. The graph is updated incrementally when single
+artifact definitions are added or removed.
+"""
+
+from artifacts import definitions
+
+
+class ArtifactGroupsAnalysis:
+    """Analysis of the references between artifact groups.
+
+    Attributes:
+      components (list[list[str]]): names of the artifact definitions per
+          strongly connected component of the graph, which includes the
+          components of single artifact definitions.
+      cycles (list[list[str]]): names of the artifact definitions per strongly
+          connected component that contains a cycle.
+      dangling_references (dict[str, list[str]]): names of the undefined
+          members per name of artifact group.
+      unreachable_groups (list[str]): names of the artifact groups from which
+          no artifact definition with sources other than artifact groups can
+          be reached, hence that expand to nothing.
+    """
+
+    __slots__ = ("components", "cycles", "dangling_references", "unreachable_groups")
+
+    def __init__(self):
+        """Initializes an analysis of the references between artifact groups."""
+        super().__init__()
+        self.components = []
+        self.cycles = []
+        self.dangling_references = {}
+        self.unreachable_groups = []
+
+
+class ArtifactGroupsGraph:
+    """Graph of the references between artifact groups.
+
+    Artifact definitions are identified by their lower case name, like in the
+    artifact definitions registry.
+    """
+
+    def __init__(self):
+        """Initializes a graph of the references between artifact groups."""
+        super().__init__()
+        # Strongly connected component per node.
+        self._components = {}
+        self._leaf_nodes = set()
+        # Names of the members per node.
+        self._member_names = {}
+        # Members per node, without duplicates.
+        self._members = {}
+        self._names = {}
+        # Nodes from which a leaf node can be reached.
+        self._productive_nodes = set()
+        # Nodes that reference a, possibly undefined, node.
+        self._referrers = {}
+
+    def _AddNode(self, artifact_definition):
+        """Adds the node of an artifact definition without analyzing it.
+
+        Args:
+          artifact_definition (ArtifactDefinition): an artifact definition.
+
+        Returns:
+          str: node of the artifact definition.
+
+        Raises:
+          KeyError: if the artifact definition was already added.
+        """
+        node = artifact_definition.name.lower()
+        if node in self._names:
+            raise KeyError(
+                f"Artifact definition: {artifact_definition.name:s} already added."
+            )
+
+        member_names = []
+        for source in artifact_definition.sources:
+            if source.type_indicator == definitions.TYPE_INDICATOR_ARTIFACT_GROUP:
+                member_names.extend(source.names)
+            else:
+                self._leaf_nodes.add(node)
+
+        members = tuple(dict.fromkeys(name.lower() for name in member_names))
+        for member in members:
+            self._referrers.setdefault(member, set()).add(node)
+
+        self._member_names[node] = tuple(member_names)
+        self._members[node] = members
+        self._names[node] = artifact_definition.name
+        return node
+
+    def _GetReachableNodes(self, node, adjacent_nodes):
+        """Retrieves the defined nodes that can be reached from a node.
+
+        Args:
+          node (str): node to start from.
+          adjacent_nodes (dict[str, Iterable[str]]): adjacent nodes per node,
+              such as the members or the referrers.
+
+        Returns:
+          set[str]: reachable nodes, including the node itself.
+        """
+        reachable_nodes = {node}
+        stack = [node]
+        while stack:
+            for adjacent_node in adjacent_nodes.get(stack.pop(), ()):
+                if (
+                    adjacent_node in self._names
+                    and adjacent_node not in reachable_nodes
+                ):
+                    reachable_nodes.add(adjacent_node)
+                    stack.append(adjacent_node)
+
+        return reachable_nodes
+
+    def _PropagateProductiveNodes(self, nodes, candidate_nodes):
+        """Marks nodes and the candidate nodes that reference them as productive.
+
+        Args:
+          nodes (Iterable[str]): productive nodes.
+          candidate_nodes (set[str]): nodes that could become productive, where
+              None represents all nodes that are not productive.
+        """
+        stack = list(nodes)
+        self._productive_nodes.update(stack)
+        while stack:
+            for referrer in self._referrers.get(stack.pop(), ()):
+                if referrer in self._productive_nodes or referrer not in self._names:
+                    continue
+
+                if candidate_nodes is not None and referrer not in candidate_nodes:
+                    continue
+
+                self._productive_nodes.add(referrer)
+                stack.append(referrer)
+
+    def _SetStronglyConnectedComponents(self, nodes):
+        """Determines the strongly connected components of a subgraph.
+
+        This function uses an iterative version of Tarjan's algorithm, which
+        runs in linear time of the number of nodes and edges of the subgraph.
+
+        Args:
+          nodes (set[str]): nodes of the subgraph.
+        """
+        indexes = {}
+        low_links = {}
+        component_stack = []
+        on_component_stack = set()
+
+        for root_node in nodes:
+            if root_node in indexes:
+                continue
+
+            indexes[root_node] = low_links[root_node] = len(indexes)
+            component_stack.append(root_node)
+            on_component_stack.add(root_node)
+            call_stack = [(root_node, iter(self._members[root_node]))]
+
+            while call_stack:
+                node, members = call_stack[-1]
+
+                for member in members:
+                    if member not in nodes:
+                        continue
+
+                    if member not in indexes:
+                        indexes[member] = low_links[member] = len(indexes)
+                        component_stack.append(member)
+                        on_component_stack.add(member)
+                        call_stack.append((member, iter(self._members[member])))
+                        break
+
+                    if member in on_component_stack:
+                        low_links[node] = min(low_links[node], indexes[member])
+
+                else:
+                    call_stack.pop()
+                    if call_stack:
+                        parent_node = call_stack[-1][0]
+                        low_links[parent_node] = min(
+                            low_links[parent_node], low_links[node]
+                        )
+
+                    if low_links[node] == indexes[node]:
+                        component = []
+                        while True:
+                            component_node = component_stack.pop()
+                            on_component_stack.discard(component_node)
+                            component.append(component_node)
+                            if component_node == node:
+                                break
+
+                        component = frozenset(component)
+                        for component_node in component:
+                            self._components[component_node] = component
+
+    def AddDefinition(self, artifact_definition):
+        """Adds an artifact definition.
+
+        Only the part of the graph that can reach or be reached from the
+        artifact definition is analyzed again.
+
+        Args:
+          artifact_definition (ArtifactDefinition): an artifact definition.
+
+        Raises:
+          KeyError: if the artifact definition was already added.
+        """
+        node = self._AddNode(artifact_definition)
+
+        # A new cycle must contain the new node, hence consists of the nodes
+        # that can both be reached from and reach the new node.
+        component = {node}
+        if self._members[node] and self._referrers.get(node, None):
+            component = self._GetReachableNodes(node, self._members)
+            component.intersection_update(
+                self._GetReachableNodes(node, self._referrers)
+            )
+
+        component = frozenset(component)
+        for component_node in component:
+            self._components[component_node] = component
+
+        if node in self._leaf_nodes or any(
+            member in self._productive_nodes for member in self._members[node]
+        ):
+            self._PropagateProductiveNodes([node], None)
+
+    def Build(self, artifact_definitions):
+        """Builds the graph from artifact definitions.
+
+        Args:
+          artifact_definitions (Iterable[ArtifactDefinition]): artifact
+              definitions.
+
+        Raises:
+          KeyError: if an artifact definition was already added.
+        """
+        for artifact_definition in artifact_definitions:
+            self._AddNode(artifact_definition)
+
+        self._SetStronglyConnectedComponents(set(self._names))
+
+        self._productive_nodes = set()
+        self._PropagateProductiveNodes(self._leaf_nodes, None)
+
+    def GetAnalysis(self, ignored_names=None):
+        """Retrieves the analysis of the graph.
+
+        Args:
+          ignored_names (Optional[set[str]]): lower case names of undefined
+              members that should not be reported as dangling references, such
+              as artifact definitions that were filtered out.
+
+        Returns:
+          ArtifactGroupsAnalysis: analysis of the graph.
+        """
+        analysis = ArtifactGroupsAnalysis()
+
+        # The components are ordered by the first artifact definition added.
+        components = {}
+        for node in self._names:
+            components.setdefault(self._components[node], node)
+
+        for component in components:
+            names = sorted(self._names[node] for node in component)
+            analysis.components.append(names)
+
+            if len(component) > 1:
+                analysis.cycles.append(names)
+            else:
+                node = next(iter(component))
+                if node in self._members[node]:
+                    analysis.cycles.append(names)
+
+        for node, member_names in self._member_names.items():
+            dangling_names = [
+                member_name
+                for member_name in member_names
+                if member_name.lower() not in self._names
+                and (not ignored_names or member_name.lower() not in ignored_names)
+            ]
+            if dangling_names:
+                analysis.dangling_references[self._names[node]] = dangling_names
+
+            if member_names and node not in self._productive_nodes:
+                analysis.unreachable_groups.append(self._names[node])
+
+        return analysis
+
+    def RemoveDefinition(self, artifact_definition):
+        """Removes an artifact definition.
+
+        Only the part of the graph that can reach or be reached from the
+        artifact definition is analyzed again.
+
+        Args:
+          artifact_definition (ArtifactDefinition): an artifact definition.
+
+        Raises:
+          KeyError: if the artifact definition was not added.
+        """
+        node = artifact_definition.name.lower()
+        if node not in self._names:
+            raise KeyError(
+                f"Artifact definition: {artifact_definition.name:s} not added."
+            )
+
+        # Productive nodes that can reach the node could depend on it.
+        dependent_nodes = set()
+        if node in self._productive_nodes:
+            dependent_nodes = {
+                referrer
+                for referrer in self._GetReachableNodes(node, self._referrers)
+                if referrer in self._productive_nodes
+            }
+
+        for member in self._members[node]:
+            referrers = self._referrers[member]
+            referrers.discard(node)
+            if not referrers:
+                del self._referrers[member]
+
+        del self._member_names[node]
+        del self._members[node]
+        del self._names[node]
+        self._leaf_nodes.discard(node)
+
+        # Removing a node can split its strongly connected component.
+        component = self._components.pop(node)
+        if len(component) > 1:
+            self._SetStronglyConnectedComponents(set(component - {node}))
+
+        dependent_nodes.discard(node)
+        self._productive_nodes.discard(node)
+        self._productive_nodes.difference_update(dependent_nodes)
+
+        productive_nodes = [
+            dependent_node
+            for dependent_node in dependent_nodes
+            if dependent_node in self._leaf_nodes
+            or any(
+                member in self._productive_nodes
+                for member in self._members[dependent_node]
+            )
+        ]
+        self._PropagateProductiveNodes(productive_nodes, dependent_nodes)
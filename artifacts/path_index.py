@@ -0,0 +1,296 @@
+"""The reverse index of the paths of artifact definitions.
+
+The index is a trie of the segments of the paths of the file, path and
+directory sources. Literal segments are looked up by value, other segments
+are wildcard edges:
+* a segment with glob characters, such as "*.log", matches one segment;
+* a segment with only a path variable, such as "%%users.homedir%%", matches
+  one or more segments, since the value of the variable is a path itself;
+* a segment with a path variable and other characters, such as
+  "%%users.username%%.log", matches one segment;
+* a recursive glob, "**" or "**N", matches zero up to 10 or N segments.
+
+Matching a path only follows the edges that match its segments, hence the
+cost of a lookup depends on the depth of the path and not on the number of
+indexed paths.
+"""
+
+import fnmatch
+import re
+
+from artifacts import definitions
+
+
+class PathIndexNode:
+    """Node in the trie of the path index.
+
+    Attributes:
+      glob_edges (dict[str, tuple[re.Pattern, PathIndexNode]]): regular
+          expression and child node per glob segment.
+      literal_edges (dict[str, PathIndexNode]): child node per literal segment.
+      matches (list[tuple[ArtifactDefinition, SourceType, str]]): artifact
+          definitions, sources and paths that end at the node.
+      recursive_edges (dict[int, PathIndexNode]): child node per maximum
+          number of segments of a recursive glob.
+      variable_edge (PathIndexNode): child node of path variable segments.
+    """
+
+    __slots__ = (
+        "glob_edges",
+        "literal_edges",
+        "matches",
+        "recursive_edges",
+        "variable_edge",
+    )
+
+    def __init__(self):
+        """Initializes a node in the trie of the path index."""
+        super().__init__()
+        self.glob_edges = {}
+        self.literal_edges = {}
+        self.matches = []
+        self.recursive_edges = {}
+        self.variable_edge = None
+
+
+class PathIndex:
+    """Reverse index from paths to the artifact definitions that cover them.
+
+    There is a trie per path segment separator. Paths with the Windows path
+    segment separator and paths of artifact definitions that only support
+    Windows are matched case-insensitive.
+    """
+
+    # Maximum number of segments matched by "**" without a number.
+    _DEFAULT_RECURSION_DEPTH = 10
+
+    _GLOB_CHARACTERS = frozenset("*?[")
+
+    _RECURSIVE_GLOB_RE = re.compile(r"^\*\*([0-9]*)$")
+
+    _SOURCE_TYPE_INDICATORS = frozenset(
+        [
+            definitions.TYPE_INDICATOR_DIRECTORY,
+            definitions.TYPE_INDICATOR_FILE,
+            definitions.TYPE_INDICATOR_PATH,
+        ]
+    )
+
+    # Number of segments a path variable can match.
+    _UNBOUNDED = -1
+
+    # Determines if a segment with only a path variable matches one or more
+    # segments, instead of one segment.
+    _VARIABLE_MATCHES_SEGMENTS = True
+
+    _VARIABLE_RE = re.compile(r"%%[^%]+%%")
+
+    def __init__(self):
+        """Initializes a path index."""
+        super().__init__()
+        # Root node per path segment separator and case-insensitivity.
+        self._root_nodes = {}
+
+    def _AddPath(self, root_node, path, separator, case_insensitive, match):
+        """Adds a path to a trie.
+
+        Args:
+          root_node (PathIndexNode): root node of the trie.
+          path (str): path.
+          separator (str): path segment separator.
+          case_insensitive (bool): True if the path is case-insensitive.
+          match (tuple[ArtifactDefinition, SourceType, str]): artifact
+              definition, source and path to return when the path matches.
+        """
+        node = root_node
+        for segment in self._GetSegments(path, separator):
+            if case_insensitive:
+                segment = segment.lower()
+
+            if segment == "%%" or not (
+                self._VARIABLE_RE.search(segment)
+                or self._GLOB_CHARACTERS.intersection(segment)
+            ):
+                node = node.literal_edges.setdefault(segment, PathIndexNode())
+                continue
+
+            if self._VARIABLE_MATCHES_SEGMENTS and self._VARIABLE_RE.fullmatch(segment):
+                if not node.variable_edge:
+                    node.variable_edge = PathIndexNode()
+                node = node.variable_edge
+                continue
+
+            recursive_glob_match = self._RECURSIVE_GLOB_RE.match(segment)
+            if recursive_glob_match:
+                depth = recursive_glob_match.group(1)
+                depth = int(depth, 10) if depth else self._DEFAULT_RECURSION_DEPTH
+                node = node.recursive_edges.setdefault(depth, PathIndexNode())
+                continue
+
+            glob_edge = node.glob_edges.get(segment, None)
+            if not glob_edge:
+                glob_re = self._CompileGlob(segment, case_insensitive)
+                glob_edge = (glob_re, PathIndexNode())
+                node.glob_edges[segment] = glob_edge
+
+            node = glob_edge[1]
+
+        node.matches.append(match)
+
+    def _CompileGlob(self, segment, case_insensitive):
+        """Compiles a glob segment into a regular expression.
+
+        A path variable within the segment matches like the "*" glob.
+
+        Args:
+          segment (str): glob segment, such as "*.log".
+          case_insensitive (bool): True if the segment is case-insensitive.
+
+        Returns:
+          re.Pattern: regular expression that matches the segment.
+        """
+        glob_pattern = self._VARIABLE_RE.sub("*", segment)
+        flags = re.IGNORECASE if case_insensitive else 0
+        return re.compile(fnmatch.translate(glob_pattern), flags)
+
+    def _GetSegments(self, path, separator):
+        """Splits a path into segments.
+
+        Args:
+          path (str): path.
+          separator (str): path segment separator.
+
+        Returns:
+          list[str]: path segments, where an empty first segment represents
+              the root of an absolute path.
+        """
+        segments = path.split(separator)
+        return segments[:1] + [segment for segment in segments[1:] if segment]
+
+    def _GetStates(self, node, remaining_segments, states):
+        """Adds a state and the states reachable without consuming segments.
+
+        Args:
+          node (PathIndexNode): node of the state.
+          remaining_segments (int): number of segments the state can consume
+              while remaining at the node, where 0 represents none and
+              _UNBOUNDED any number.
+          states (dict[tuple[PathIndexNode, int], None]): states, in the order
+              they were reached, so that the matches are ordered consistently.
+        """
+        state = (node, remaining_segments)
+        if state in states:
+            return
+
+        states[state] = None
+        for depth, child_node in node.recursive_edges.items():
+            self._GetStates(child_node, depth, states)
+
+    def _MatchSegments(self, root_node, segments):
+        """Matches path segments against a trie.
+
+        Args:
+          root_node (PathIndexNode): root node of the trie.
+          segments (list[str]): path segments.
+
+        Returns:
+          list[PathIndexNode]: nodes at which the path segments end.
+        """
+        states = {}
+        self._GetStates(root_node, 0, states)
+
+        for segment in segments:
+            next_states = {}
+            for node, remaining_segments in states:
+                if remaining_segments == self._UNBOUNDED:
+                    next_states[(node, remaining_segments)] = None
+                elif remaining_segments > 0:
+                    self._GetStates(node, remaining_segments - 1, next_states)
+
+                child_node = node.literal_edges.get(segment, None)
+                if child_node:
+                    self._GetStates(child_node, 0, next_states)
+
+                for glob_re, child_node in node.glob_edges.values():
+                    if glob_re.match(segment):
+                        self._GetStates(child_node, 0, next_states)
+
+                if node.variable_edge:
+                    self._GetStates(node.variable_edge, self._UNBOUNDED, next_states)
+
+            states = next_states
+            if not states:
+                break
+
+        return [node for node, _ in states]
+
+    def AddDefinition(self, artifact_definition):
+        """Adds the paths of an artifact definition to the index.
+
+        Args:
+          artifact_definition (ArtifactDefinition): an artifact definition.
+        """
+        for source in artifact_definition.sources:
+            if source.type_indicator not in self._SOURCE_TYPE_INDICATORS:
+                continue
+
+            supported_os = source.supported_os or artifact_definition.supported_os
+            case_insensitive = source.separator == "\\" or (
+                list(supported_os) == [definitions.SUPPORTED_OS_WINDOWS]
+            )
+
+            lookup_key = (source.separator, case_insensitive)
+            root_node = self._root_nodes.get(lookup_key, None)
+            if not root_node:
+                root_node = PathIndexNode()
+                self._root_nodes[lookup_key] = root_node
+
+            for path in source.paths:
+                match = (artifact_definition, source, path)
+                self._AddPath(
+                    root_node, path, source.separator, case_insensitive, match
+                )
+
+    def Build(self, artifact_definitions):
+        """Builds the index from artifact definitions.
+
+        Args:
+          artifact_definitions (Iterable[ArtifactDefinition]): artifact
+              definitions.
+        """
+        for artifact_definition in artifact_definitions:
+            self.AddDefinition(artifact_definition)
+
+    def GetMatches(self, path, separator="/"):
+        """Retrieves the artifact definitions that cover a path.
+
+        Args:
+          path (str): path, such as "/home/alice/.bash_history".
+          separator (Optional[str]): path segment separator of the path, which
+              is matched against the paths with the same separator.
+
+        Returns:
+          list[tuple[ArtifactDefinition, SourceType, str]]: artifact
+              definitions, sources and paths that match the path.
+        """
+        segments = self._GetSegments(path, separator)
+
+        matches = {}
+        for case_insensitive in (False, True):
+            root_node = self._root_nodes.get((separator, case_insensitive), None)
+            if not root_node:
+                continue
+
+            if case_insensitive:
+                lookup_segments = [segment.lower() for segment in segments]
+            else:
+                lookup_segments = segments
+
+            for node in self._MatchSegments(root_node, lookup_segments):
+                for match in node.matches:
+                    artifact_definition, source, path = match
+                    matches.setdefault(
+                        (id(artifact_definition), id(source), path), match
+                    )
+
+        return list(matches.values())
@@ -1,16 +1,71 @@
 """The artifact reader objects."""
 
 import abc
+import codecs
 import glob
+import io
+import itertools
 import os
 import json
-import yaml
+import sys
 
 from artifacts import artifact
 from artifacts import definitions
 from artifacts import errors
 
 
+def _ReadFileInWorker(artifacts_reader, filename):
+    """Reads artifact definitions from a file in a worker process.
+
+    Args:
+      artifacts_reader (ArtifactsReader): an artifacts reader.
+      filename (str): name of the file to read from.
+
+    Returns:
+      tuple[list[ArtifactDefinition], set[str]]: artifact definitions and
+          names of the artifact definitions that were filtered out, since
+          the worker process has its own copy of the artifacts reader.
+
+    Raises:
+      FormatError: if the format of an artifact definition is not set
+          or incorrect.
+    """
+    artifact_definitions = list(artifacts_reader.ReadFile(filename))
+    return artifact_definitions, artifacts_reader.filtered_artifact_names
+
+
+class DocumentIndexEntry:
+    """Entry of an index of the documents in a definitions file.
+
+    Attributes:
+      aliases (list[str]): aliases of the artifact definition in the document.
+      filename (str): name of the definitions file.
+      name (str): name of the artifact definition in the document.
+      offset (int): offset of the document relative to the start of the file.
+      size (int): size of the document.
+    """
+
+    __slots__ = ("aliases", "filename", "name", "offset", "size")
+
+    def __init__(self, filename, offset, size, name, aliases=None):
+        """Initializes a document index entry.
+
+        Args:
+          filename (str): name of the definitions file.
+          offset (int): offset of the document relative to the start of the file.
+          size (int): size of the document.
+          name (str): name of the artifact definition in the document.
+          aliases (Optional[list[str]]): aliases of the artifact definition in
+              the document.
+        """
+        super().__init__()
+        self.aliases = aliases or []
+        self.filename = filename
+        self.name = name
+        self.offset = offset
+        self.size = size
+
+
 class BaseArtifactsReader:
     """Artifacts reader interface.
 
@@ -40,7 +95,7 @@ class BaseArtifactsReader:
         """
 
     @abc.abstractmethod
-    def ReadDirectory(self, path, extension=None):
+    def ReadDirectory(self, path, extension=None, number_of_workers=None):
         """Reads artifact definitions from a directory.
 
         This function does not recurse sub directories.
@@ -48,6 +103,9 @@ class BaseArtifactsReader:
         Args:
           path (str): path of the directory to read from.
           extension (Optional[str]): extension of the filenames to read.
+          number_of_workers (Optional[int]): number of worker processes to parse
+              the files with, where None or 1 represents parsing the files in
+              the current process.
 
         Yields:
           ArtifactDefinition: an artifact definition.
@@ -83,11 +141,105 @@ class BaseArtifactsReader:
 class ArtifactsReader(BaseArtifactsReader):
     """Artifacts reader common functionality."""
 
-    def __init__(self):
-        """Initializes an artifacts reader."""
+    def __init__(
+        self, compact=False, intern_strings=False, operating_systems=None, trusted=False
+    ):
+        """Initializes an artifacts reader.
+
+        Args:
+          compact (Optional[bool]): True if the artifact definitions should be
+              converted into their compact representation, which uses less
+              memory but can no longer be modified.
+          intern_strings (Optional[bool]): True if the names, aliases, supported
+              operating systems and source type attributes should be interned,
+              so that recurring strings are stored only once. This reduces the
+              memory usage of long-lived artifact definitions at the cost of
+              additional work while reading, hence it is disabled by default.
+          operating_systems (Optional[set[str]]): operating systems, such as
+              "Linux", to read the artifact definitions for, where None
+              represents all operating systems. Artifact definitions and
+              sources that do not apply to these operating systems are skipped.
+          trusted (Optional[bool]): True if the artifact definitions are known
+              to be valid, for example because they were previously validated,
+              in which case the artifact definitions are read without checking
+              their format.
+        """
         super().__init__()
+        self._compact = compact
+        self._intern_strings = intern_strings
+        self._supported_os_tuples = {}
+        self._trusted = trusted
+        self.filtered_artifact_names = set()
+        self.operating_systems = None
         self.supported_os = set(definitions.SUPPORTED_OS)
 
+        if operating_systems is not None:
+            self.operating_systems = frozenset(operating_systems)
+
+    def _FilterArtifactDefinition(self, artifact_definition):
+        """Filters an artifact definition by the operating systems to read.
+
+        Args:
+          artifact_definition (ArtifactDefinition): an artifact definition.
+
+        Returns:
+          ArtifactDefinition: the artifact definition with only the sources that
+              apply to the operating systems, or None if no source applies, in
+              which case the name of the artifact definition is added to the
+              filtered artifact names.
+        """
+        filtered_definition = artifact_definition.FilterByOS(self.operating_systems)
+        if not filtered_definition:
+            self.filtered_artifact_names.add(artifact_definition.name)
+
+        return filtered_definition
+
+    def _GetSupportedOS(self, supported_os):
+        """Retrieves the supported operating systems to store in a definition.
+
+        Args:
+          supported_os (list[str]): supported operating systems.
+
+        Returns:
+          list[str]|tuple[str]: supported operating systems, which are interned
+              if configured and a shared tuple in compact mode.
+        """
+        if self._intern_strings:
+            supported_os = self._InternValues(supported_os)
+
+        if self._compact:
+            # Compact supported operating systems are immutable, hence a single
+            # tuple can be shared by all definitions with the same values.
+            supported_os = self._supported_os_tuples.setdefault(
+                tuple(supported_os), tuple(supported_os)
+            )
+
+        return supported_os
+
+    def _InternValues(self, values):
+        """Interns the strings in artifact definition values.
+
+        Args:
+          values (object): artifact definition values, such as a string or
+              a list or dictionary of values.
+
+        Returns:
+          object: artifact definition values with interned strings.
+        """
+        if isinstance(values, str):
+            return sys.intern(values)
+
+        if isinstance(values, list):
+            return [self._InternValues(value) for value in values]
+
+        if isinstance(values, dict):
+            return {
+                self._InternValues(key): self._InternValues(value)
+                for key, value in values.items()
+            }
+
+        return values
+
     # Pylint fails on detecting the type of definition_object based on
     # the docstring.
     # pylint: disable=missing-type-doc
@@ -117,7 +269,7 @@ class ArtifactsReader(BaseArtifactsReader):
                 f"system: {undefined_supported_os:s}."
             )
 
-        definition_object.supported_os = supported_os
+        definition_object.supported_os = self._GetSupportedOS(supported_os)
 
     def _ReadSources(self, artifact_definition_values, artifact_definition, name):
         """Reads the artifact definition sources.
@@ -146,6 +298,9 @@ class ArtifactsReader(BaseArtifactsReader):
                 )
 
             attributes = source.get("attributes", None)
+            if self._intern_strings:
+                type_indicator = self._InternValues(type_indicator)
+                attributes = self._InternValues(attributes)
 
             try:
                 source_type = artifact_definition.AppendSource(
@@ -173,6 +328,58 @@ class ArtifactsReader(BaseArtifactsReader):
                         f"supported_os."
                     )
 
+    def _ReadTrustedArtifactDefinitionValues(self, artifact_definition_values):
+        """Reads an artifact definition from a dictionary without checks.
+
+        Args:
+          artifact_definition_values (dict[str, object]): artifact definition
+              values, which are known to be valid.
+
+        Returns:
+          ArtifactDefinition: an artifact definition or None if it does not
+              apply to the operating systems to read.
+        """
+        name = artifact_definition_values.get("name", None)
+        aliases = artifact_definition_values.get("aliases", None)
+        if self._intern_strings:
+            name = self._InternValues(name)
+            aliases = self._InternValues(aliases)
+
+        artifact_definition = artifact.ArtifactDefinition(
+            name,
+            aliases=aliases,
+            description=artifact_definition_values.get("doc", None),
+        )
+        artifact_definition.supported_os = self._GetSupportedOS(
+            artifact_definition_values.get("supported_os", [])
+        )
+        artifact_definition.urls = artifact_definition_values.get("urls", [])
+
+        for source in artifact_definition_values.get("sources", []):
+            type_indicator = source.get("type", None)
+            attributes = source.get("attributes", None) or {}
+            if self._intern_strings:
+                type_indicator = self._InternValues(type_indicator)
+                attributes = self._InternValues(attributes)
+
+            source_type = artifact_definition.AppendSource(
+                type_indicator, attributes, validate=False
+            )
+
+            source_type.supported_os = self._GetSupportedOS(
+                source.get("supported_os", [])
+            )
+
+        if self.operating_systems is not None:
+            artifact_definition = self._FilterArtifactDefinition(artifact_definition)
+            if not artifact_definition:
+                return None
+
+        if self._compact:
+            artifact_definition.Compact()
+
+        return artifact_definition
+
     def ReadArtifactDefinitionValues(self, artifact_definition_values):
         """Reads an artifact definition from a dictionary.
 
@@ -181,7 +388,8 @@ class ArtifactsReader(BaseArtifactsReader):
               values.
 
         Returns:
-          ArtifactDefinition: an artifact definition.
+          ArtifactDefinition: an artifact definition or None if it does not
+              apply to the operating systems to read.
 
         Raises:
           FormatError: if the format of the artifact definition is not set
@@ -190,6 +398,9 @@ class ArtifactsReader(BaseArtifactsReader):
         if not artifact_definition_values:
             raise errors.FormatError("Missing artifact definition values.")
 
+        if self._trusted:
+            return self._ReadTrustedArtifactDefinitionValues(artifact_definition_values)
+
         different_keys = set(artifact_definition_values) - definitions.TOP_LEVEL_KEYS
         if different_keys:
             different_keys = ", ".join(different_keys)
@@ -207,6 +418,9 @@ class ArtifactsReader(BaseArtifactsReader):
             )
 
         aliases = artifact_definition_values.get("aliases", None)
+        if self._intern_strings:
+            name = self._InternValues(name)
+            aliases = self._InternValues(aliases)
 
         artifact_definition = artifact.ArtifactDefinition(
             name, aliases=aliases, description=description
@@ -227,27 +441,124 @@ class ArtifactsReader(BaseArtifactsReader):
         artifact_definition.urls = urls
         self._ReadSources(artifact_definition_values, artifact_definition, name)
 
+        if self.operating_systems is not None:
+            artifact_definition = self._FilterArtifactDefinition(artifact_definition)
+            if not artifact_definition:
+                return None
+
+        if self._compact:
+            artifact_definition.Compact()
+
         return artifact_definition
 
-    def ReadDirectory(self, path, extension="yaml"):
-        """Reads artifact definitions from a directory.
+    def GetConfigurationIdentifier(self):
+        """Retrieves an identifier of the reader and its configuration.
+
+        Artifact definitions read by readers with the same configuration
+        identifier are the same.
+
+        Returns:
+          str: configuration identifier.
+        """
+        reader_class = type(self)
+        reader_name = f"{reader_class.__module__:s}.{reader_class.__qualname__:s}"
+        supported_os = ",".join(sorted(self.supported_os))
+        operating_systems = ",".join(sorted(self.operating_systems or []))
+        return (
+            f"{reader_name:s}:{supported_os:s}:compact={self._compact!s}:"
+            f"intern_strings={self._intern_strings!s}:"
+            f"operating_systems={operating_systems:s}:trusted={self._trusted!s}"
+        )
+
+    def GetDirectoryFilenames(self, path, extension="yaml"):
+        """Retrieves the names of the artifact definitions files in a directory.
 
         This function does not recurse sub directories.
 
+        Args:
+          path (str): path of the directory.
+          extension (Optional[str]): extension of the filenames to retrieve.
+
+        Returns:
+          list[str]: names of the artifact definitions files, sorted by name.
+        """
+        if extension:
+            glob_spec = os.path.join(path, f"*.{extension:s}")
+        else:
+            glob_spec = os.path.join(path, "*")
+
+        return sorted(glob.glob(glob_spec))
+
+    def ReadDirectory(self, path, extension="yaml", number_of_workers=None):
+        """Reads artifact definitions from a directory.
+
+        This function does not recurse sub directories. The files are read in
+        order of their name, also when they are parsed by worker processes.
+
         Args:
           path (str): path of the directory to read from.
           extension (Optional[str]): extension of the filenames to read.
+          number_of_workers (Optional[int]): number of worker processes to parse
+              the files with, where None or 1 represents parsing the files in
+              the current process.
 
         Yields:
           ArtifactDefinition: an artifact definition.
+
+        Raises:
+          FormatError: if the format of an artifact definition is not set
+              or incorrect.
         """
-        if extension:
-            glob_spec = os.path.join(path, f"*.{extension:s}")
+        artifact_files = self.GetDirectoryFilenames(path, extension=extension)
+
+        if not number_of_workers or number_of_workers <= 1 or len(artifact_files) <= 1:
+            for artifact_file in artifact_files:
+                yield from self.ReadFile(artifact_file)
+
         else:
-            glob_spec = os.path.join(path, "*")
+            yield from self._ReadFilesInWorkers(artifact_files, number_of_workers)
+
+    def _ReadFilesInWorkers(self, artifact_files, number_of_workers):
+        """Reads artifact definitions from files using worker processes.
+
+        Args:
+          artifact_files (list[str]): names of the files to read from.
+          number_of_workers (int): number of worker processes.
+
+        Yields:
+          ArtifactDefinition: an artifact definition.
+
+        Raises:
+          FormatError: if the format of an artifact definition is not set
+              or incorrect.
+        """
+        import concurrent.futures  # pylint: disable=import-outside-toplevel
+
+        number_of_workers = min(number_of_workers, len(artifact_files))
+        chunk_size = max(1, len(artifact_files) // (number_of_workers * 4))
+
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=number_of_workers
+        ) as executor:
+            # Executor.map() returns the results in the order of the files,
+            # independent of the order in which the workers complete them.
+            results = executor.map(
+                _ReadFileInWorker,
+                itertools.repeat(self),
+                artifact_files,
+                chunksize=chunk_size,
+            )
+            try:
+                for artifact_definitions, filtered_artifact_names in results:
+                    self.filtered_artifact_names.update(filtered_artifact_names)
+                    yield from artifact_definitions
 
-        for artifact_file in glob.glob(glob_spec):
-            yield from self.ReadFile(artifact_file)
+            except BaseException:
+                # Cancel the files that are not yet being parsed. The files
+                # that are being parsed are waited for, so that no worker
+                # processes are left behind.
+                executor.shutdown(wait=True, cancel_futures=True)
+                raise
 
     def ReadFile(self, filename):
         """Reads artifact definitions from a file.
@@ -261,6 +572,36 @@ class ArtifactsReader(BaseArtifactsReader):
         with open(filename, encoding="utf-8") as file_object:
             yield from self.ReadFileObject(file_object)
 
+    async def ReadFileAsync(self, filename, executor=None):
+        """Reads artifact definitions from a file without blocking the event loop.
+
+        The file is read and parsed by an executor.
+
+        Args:
+          filename (str): name of the file to read from.
+          executor (Optional[concurrent.futures.Executor]): executor to read
+              the file with, such as a thread or process pool, where None
+              represents the default executor of the event loop.
+
+        Returns:
+          list[ArtifactDefinition]: artifact definitions.
+
+        Raises:
+          FormatError: if the format of an artifact definition is not set
+              or incorrect.
+        """
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        event_loop = asyncio.get_running_loop()
+        artifact_definitions, filtered_artifact_names = (
+            await event_loop.run_in_executor(
+                executor, _ReadFileInWorker, self, filename
+            )
+        )
+        # A process pool reads the file with a copy of the artifacts reader.
+        self.filtered_artifact_names.update(filtered_artifact_names)
+        return artifact_definitions
+
     @abc.abstractmethod
     def ReadFileObject(self, file_object):
         """Reads artifact definitions from a file-like object.
@@ -280,6 +621,136 @@ class ArtifactsReader(BaseArtifactsReader):
 class JsonArtifactsReader(ArtifactsReader):
     """JSON artifacts reader."""
 
+    # Maximum size of the data of a single JSON array element that is buffered
+    # while reading in streaming mode.
+    _STREAMING_MAXIMUM_ELEMENT_SIZE = 4 * 1024 * 1024
+
+    _STREAMING_READ_SIZE = 64 * 1024
+
+    def __init__(self, streaming=False, **kwargs):
+        """Initializes a JSON artifacts reader.
+
+        Args:
+          streaming (Optional[bool]): True if the elements of the top-level JSON
+              array should be decoded one at a time, which keeps the memory
+              usage independent of the size of the file.
+          kwargs (dict[str, object]): keyword arguments of the artifacts reader.
+        """
+        super().__init__(**kwargs)
+        self._streaming = streaming
+
+    def _ReadJsonArrayElements(self, file_object):
+        """Reads the elements of a top-level JSON array incrementally.
+
+        Args:
+          file_object (file): file-like object to read from.
+
+        Yields:
+          object: JSON array element.
+
+        Raises:
+          FormatError: if the JSON data is not a valid top-level array, is
+              followed by other data than whitespace or contains an element
+              that exceeds the maximum element size.
+        """
+        json_decoder = json.JSONDecoder()
+        text_decoder = codecs.getincrementaldecoder("utf-8")()
+
+        buffer = ""
+        buffer_offset = 0
+        end_of_array = False
+        end_of_file = False
+        in_array = False
+        allow_end_of_array = True
+        expect_separator = False
+
+        while True:
+            while buffer_offset < len(buffer) and buffer[buffer_offset].isspace():
+                buffer_offset += 1
+
+            read_data = buffer_offset >= len(buffer)
+            if end_of_array:
+                # The data after the end of the array is read until the end of
+                # the file, so that trailing data is rejected as by json.loads().
+                if not read_data:
+                    raise errors.FormatError(
+                        "Invalid JSON data, unexpected data after end of array."
+                    )
+
+                if end_of_file:
+                    return
+
+            if not read_data and in_array and not expect_separator:
+                if buffer[buffer_offset] != "]" or not allow_end_of_array:
+                    try:
+                        json_value, end_offset = json_decoder.raw_decode(
+                            buffer, buffer_offset
+                        )
+                    except json.JSONDecodeError as exception:
+                        if end_of_file:
+                            raise errors.FormatError(
+                                f"Unable to decode JSON data with error: "
+                                f"{exception!s}"
+                            )
+
+                        end_offset = None
+
+                    # A value that ends at the end of the buffer could be
+                    # incomplete, such as a number, hence more data is read
+                    # before decoding it again.
+                    read_data = end_offset is None or (
+                        end_offset >= len(buffer) and not end_of_file
+                    )
+
+            if read_data:
+                if end_of_file:
+                    raise errors.FormatError("Unexpected end of JSON data.")
+
+                if len(buffer) - buffer_offset > self._STREAMING_MAXIMUM_ELEMENT_SIZE:
+                    raise errors.FormatError(
+                        f"Invalid JSON data, array element exceeds maximum size: "
+                        f"{self._STREAMING_MAXIMUM_ELEMENT_SIZE:d}."
+                    )
+
+                data = file_object.read(self._STREAMING_READ_SIZE)
+                if isinstance(data, bytes):
+                    data = text_decoder.decode(data, final=not data)
+
+                end_of_file = not data
+                buffer = buffer[buffer_offset:] + data
+                buffer_offset = 0
+                continue
+
+            character = buffer[buffer_offset]
+            if not in_array:
+                if character != "[":
+                    raise errors.FormatError("JSON data is not an array.")
+
+                buffer_offset += 1
+                in_array = True
+
+            elif character == "]" and allow_end_of_array:
+                buffer_offset += 1
+                end_of_array = True
+
+            elif expect_separator:
+                if character != ",":
+                    raise errors.FormatError(
+                        f"Invalid JSON data, expected separator at: {character:s}"
+                    )
+
+                buffer_offset += 1
+                allow_end_of_array = False
+                expect_separator = False
+
+            else:
+                yield json_value
+
+                buffer = buffer[end_offset:]
+                buffer_offset = 0
+                allow_end_of_array = True
+                expect_separator = True
+
     def ReadFileObject(self, file_object):
         """Reads artifact definitions from a file-like object.
 
@@ -293,27 +764,392 @@ class JsonArtifactsReader(ArtifactsReader):
           FormatError: if the format of the JSON artifact definition is not set
               or incorrect.
         """
-        # TODO: add try, except?
-        json_definitions = json.loads(file_object.read())
+        if self._streaming:
+            json_definitions = self._ReadJsonArrayElements(file_object)
+        else:
+            try:
+                json_definitions = json.loads(file_object.read())
+            except ValueError as exception:
+                raise errors.FormatError(
+                    f"Unable to decode JSON data with error: {exception!s}"
+                )
+
+        last_artifact_definition = None
+        try:
+            for json_definition in json_definitions:
+                artifact_definition = self.ReadArtifactDefinitionValues(json_definition)
+                if not artifact_definition:
+                    continue
+
+                yield artifact_definition
+                last_artifact_definition = artifact_definition
+
+        except errors.FormatError as exception:
+            error_location = "At start"
+            if last_artifact_definition:
+                error_location = f"After: {last_artifact_definition.name:s}"
+
+            raise errors.FormatError(f"{error_location:s} {exception!s}")
+
+
+class JsonLinesArtifactsReader(ArtifactsReader):
+    """JSON Lines artifacts reader.
+
+    The JSON Lines format stores one JSON encoded artifact definition per line.
+    """
+
+    def _ReadLines(self, lines):
+        """Reads artifact definitions from JSON Lines.
 
+        Args:
+          lines (iterable[bytes|str]): lines to read from.
+
+        Yields:
+          ArtifactDefinition: an artifact definition.
+
+        Raises:
+          FormatError: if the format of the JSON artifact definition is not set
+              or incorrect.
+        """
         last_artifact_definition = None
-        for json_definition in json_definitions:
+        for line in lines:
+            if not line.strip():
+                continue
+
             try:
+                json_definition = json.loads(line)
                 artifact_definition = self.ReadArtifactDefinitionValues(json_definition)
-            except errors.FormatError as exception:
+
+            except (errors.FormatError, ValueError) as exception:
                 error_location = "At start"
                 if last_artifact_definition:
                     error_location = f"After: {last_artifact_definition.name:s}"
 
                 raise errors.FormatError(f"{error_location:s} {exception!s}")
 
+            if not artifact_definition:
+                continue
+
             yield artifact_definition
             last_artifact_definition = artifact_definition
 
+    def _ReadLinesInRange(self, file_object, offset, end_offset):
+        """Reads the lines that start before the end of a range.
+
+        Args:
+          file_object (file): file-like object positioned at the start of a line.
+          offset (int): offset of the current position in the file.
+          end_offset (int): offset of the end of the range.
+
+        Yields:
+          bytes: line.
+        """
+        while offset < end_offset:
+            line = file_object.readline()
+            if not line:
+                break
+
+            yield line
+            offset += len(line)
+
+    def GetFileRanges(self, filename, number_of_ranges):
+        """Splits a file into byte ranges of roughly equal size.
+
+        The ranges can be read independently, for example by different workers,
+        with ReadFileRange.
+
+        Args:
+          filename (str): name of the file.
+          number_of_ranges (int): number of ranges.
+
+        Returns:
+          list[tuple[int, int]]: start and end offset of each range.
+        """
+        file_size = os.path.getsize(filename)
+        number_of_ranges = max(1, min(number_of_ranges, file_size))
+
+        range_size, remainder = divmod(file_size, number_of_ranges)
+
+        file_ranges = []
+        start_offset = 0
+        for range_index in range(number_of_ranges):
+            end_offset = start_offset + range_size
+            if range_index < remainder:
+                end_offset += 1
+
+            file_ranges.append((start_offset, end_offset))
+            start_offset = end_offset
+
+        return file_ranges
+
+    def ReadFileObject(self, file_object):
+        """Reads artifact definitions from a file-like object.
+
+        Args:
+          file_object (file): file-like object to read from.
+
+        Yields:
+          ArtifactDefinition: an artifact definition.
+
+        Raises:
+          FormatError: if the format of the JSON artifact definition is not set
+              or incorrect.
+        """
+        yield from self._ReadLines(file_object)
+
+    def ReadFileRange(self, filename, start_offset, end_offset):
+        """Reads artifact definitions from a byte range of a file.
+
+        A line belongs to the range in which it starts, hence reading adjacent
+        ranges reads every artifact definition exactly once.
+
+        Args:
+          filename (str): name of the file to read from.
+          start_offset (int): offset of the start of the range.
+          end_offset (int): offset of the end of the range, which is excluded
+              from the range.
+
+        Yields:
+          ArtifactDefinition: an artifact definition.
+
+        Raises:
+          FormatError: if the format of the JSON artifact definition is not set
+              or incorrect.
+        """
+        with open(filename, "rb") as file_object:
+            offset = 0
+            if start_offset > 0:
+                # Skip the remainder of the line that starts in the previous range.
+                file_object.seek(start_offset - 1, os.SEEK_SET)
+                offset = start_offset - 1 + len(file_object.readline())
+
+            yield from self._ReadLines(
+                self._ReadLinesInRange(file_object, offset, end_offset)
+            )
+
 
 class YamlArtifactsReader(ArtifactsReader):
     """YAML artifacts reader."""
 
+    # Top-level keys that are read when indexing the documents in a file.
+    _INDEX_KEYS = frozenset([b"aliases", b"name"])
+
+    def __init__(self, lean=False, use_libyaml=True, **kwargs):
+        """Initializes a YAML artifacts reader.
+
+        Args:
+          lean (Optional[bool]): True if the artifact definitions read from files
+              should not keep their description and URLs in memory, but read
+              them from the file when requested.
+          use_libyaml (Optional[bool]): True if the libyaml-backed (C) YAML loader
+              should be used when PyYAML was built with libyaml support. If not
+              available, the pure Python YAML loader is used.
+          kwargs (dict[str, object]): keyword arguments of the artifacts reader.
+        """
+        import yaml  # pylint: disable=import-outside-toplevel
+
+        super().__init__(**kwargs)
+        self._lean = lean
+        self._yaml_loader = yaml.SafeLoader
+
+        if use_libyaml and getattr(yaml, "__with_libyaml__", False):
+            self._yaml_loader = yaml.CSafeLoader
+
+    def _ReadDocumentIndexEntry(self, filename, offset, lines):
+        """Reads the index entry of a single document.
+
+        Only the top-level name and aliases keys of the document are parsed.
+
+        Args:
+          filename (str): name of the definitions file.
+          offset (int): offset of the document relative to the start of the file.
+          lines (list[bytes]): lines of the document.
+
+        Returns:
+          DocumentIndexEntry: document index entry or None if the document is
+              empty.
+
+        Raises:
+          FormatError: if the document does not define a name.
+        """
+        size = sum(len(line) for line in lines)
+
+        has_content = False
+        index_key = None
+        index_lines = []
+        for line in lines:
+            stripped_line = line.strip()
+            if not stripped_line or stripped_line.startswith(b"#"):
+                continue
+
+            has_content = True
+            # Indented lines and indentless block sequences continue the value of
+            # the preceding top-level key.
+            if line[:1] in (b" ", b"\t", b"-"):
+                if index_key:
+                    index_lines.append(line)
+                continue
+
+            key, _, _ = line.partition(b":")
+            index_key = key.strip() in self._INDEX_KEYS
+            if index_key:
+                index_lines.append(line)
+
+        if not has_content:
+            return None
+
+        import yaml  # pylint: disable=import-outside-toplevel
+
+        index_values = yaml.load(b"".join(index_lines), Loader=self._yaml_loader)
+        if not isinstance(index_values, dict) or not index_values.get("name"):
+            raise errors.FormatError(
+                f"Invalid artifact definition missing name in: {filename:s} at "
+                f"offset: {offset:d}."
+            )
+
+        return DocumentIndexEntry(
+            filename,
+            offset,
+            size,
+            index_values["name"],
+            aliases=index_values.get("aliases", None),
+        )
+
+    def GetConfigurationIdentifier(self):
+        """Retrieves an identifier of the reader and its configuration.
+
+        Artifact definitions read by readers with the same configuration
+        identifier are the same.
+
+        Returns:
+          str: configuration identifier.
+        """
+        configuration_identifier = super().GetConfigurationIdentifier()
+        return (
+            f"{configuration_identifier:s}:lean={self._lean!s}:"
+            f"yaml_loader={self._yaml_loader.__name__:s}"
+        )
+
+    def ReadDocument(self, index_entry):
+        """Reads the artifact definition of a single document.
+
+        Args:
+          index_entry (DocumentIndexEntry): index entry of the document.
+
+        Returns:
+          ArtifactDefinition: an artifact definition.
+
+        Raises:
+          FormatError: if the format of the YAML artifact definition is not set
+              or incorrect.
+        """
+        with open(index_entry.filename, "rb") as file_object:
+            file_object.seek(index_entry.offset, os.SEEK_SET)
+            document_data = file_object.read(index_entry.size)
+
+        artifact_definitions = list(self.ReadFileObject(io.BytesIO(document_data)))
+        if len(artifact_definitions) != 1:
+            raise errors.FormatError(
+                f"Unable to read artifact definition: {index_entry.name:s} from: "
+                f"{index_entry.filename:s}."
+            )
+
+        return artifact_definitions[0]
+
+    def ReadDocumentIndex(self, filename):
+        """Reads an index of the documents in a file.
+
+        The index is built by scanning the file for document separators and
+        only parsing the name and aliases of each document, which is
+        considerably cheaper than reading the artifact definitions.
+
+        Args:
+          filename (str): name of the file to read from.
+
+        Returns:
+          list[DocumentIndexEntry]: document index entries.
+
+        Raises:
+          FormatError: if a document does not define a name.
+        """
+        index_entries = []
+
+        with open(filename, "rb") as file_object:
+            document_lines = []
+            document_offset = 0
+            offset = 0
+            for line in file_object:
+                if line.rstrip() == b"---":
+                    index_entry = self._ReadDocumentIndexEntry(
+                        filename, document_offset, document_lines
+                    )
+                    if index_entry:
+                        index_entries.append(index_entry)
+
+                    document_lines = []
+                    document_offset = offset + len(line)
+
+                else:
+                    document_lines.append(line)
+
+                offset += len(line)
+
+            index_entry = self._ReadDocumentIndexEntry(
+                filename, document_offset, document_lines
+            )
+            if index_entry:
+                index_entries.append(index_entry)
+
+        return index_entries
+
+    def ReadFile(self, filename):
+        """Reads artifact definitions from a file.
+
+        In lean mode the artifact definitions do not keep their description and
+        URLs in memory. Note that this only applies to artifact definitions read
+        from a file, since reading from a file-like object provides no means to
+        read the description and URLs later.
+
+        Args:
+          filename (str): name of the file to read from.
+
+        Yields:
+          ArtifactDefinition: an artifact definition.
+
+        Raises:
+          FormatError: if the format of the YAML artifact definition is not set
+              or incorrect.
+        """
+        if not self._lean:
+            yield from super().ReadFile(filename)
+            return
+
+        index_entries = {
+            index_entry.name: index_entry
+            for index_entry in self.ReadDocumentIndex(filename)
+        }
+
+        for artifact_definition in super().ReadFile(filename):
+            index_entry = index_entries.get(artifact_definition.name, None)
+            if not index_entry:
+                raise errors.FormatError(
+                    f"Missing document of artifact definition: "
+                    f"{artifact_definition.name:s} in: {filename:s}."
+                )
+
+            lean_artifact_definition = artifact.LeanArtifactDefinition(
+                artifact_definition.name,
+                self,
+                filename,
+                index_entry.offset,
+                index_entry.size,
+            )
+            lean_artifact_definition.aliases = artifact_definition.aliases
+            lean_artifact_definition.sources = artifact_definition.sources
+            lean_artifact_definition.supported_os = artifact_definition.supported_os
+
+            yield lean_artifact_definition
+
     def ReadFileObject(self, file_object):
         """Reads artifact definitions from a file-like object.
 
@@ -327,8 +1163,10 @@ class YamlArtifactsReader(ArtifactsReader):
           FormatError: if the format of the YAML artifact definition is not set
               or incorrect.
         """
+        import yaml  # pylint: disable=import-outside-toplevel
+
         # TODO: add try, except?
-        yaml_generator = yaml.safe_load_all(file_object)
+        yaml_generator = yaml.load_all(file_object, Loader=self._yaml_loader)
 
         last_artifact_definition = None
         for yaml_definition in yaml_generator:
@@ -346,5 +1184,8 @@ class YamlArtifactsReader(ArtifactsReader):
 
                 raise errors.FormatError(f"{error_location:s} {exception!s}")
 
+            if not artifact_definition:
+                continue
+
             yield artifact_definition
             last_artifact_definition = artifact_definition
@@ -1,9 +1,23 @@
 """The artifact definitions registry."""
 
+import collections
+import copy
+import gc
+import os
+import re
+import types
+
+from artifacts import artifact
 from artifacts import definitions
 from artifacts import errors
+from artifacts import graph
+from artifacts import schema
 from artifacts import source_type
 
+BUNDLED_DATA_PATH = os.path.join(os.path.dirname(__file__), "data")
+
+BUNDLED_SNAPSHOT_PATH = os.path.join(os.path.dirname(__file__), "data.pickle")
+
 
 class ArtifactDefinitionsRegistry:
     """Artifact definitions registry."""
@@ -23,21 +37,341 @@ class ArtifactDefinitionsRegistry:
         definitions.TYPE_INDICATOR_WMI_QUERY: source_type.WMIQuerySourceType,
     }
 
+    # Compiled validators per type indicator, where None represents a source
+    # type without schema.
+    _source_type_validators = {}
+
+    _PATH_VARIABLE_RE = re.compile(r"%%[^%]+%%")
+
     def __init__(self):
         """Initializes an artifact definitions registry."""
         super().__init__()
         self._artifact_definitions_by_alias = {}
         self._artifact_definitions_by_name = {}
-        self._artifact_name_references = set()
+        # Artifact definitions per lower case name per operating system.
+        self._artifact_definitions_by_operating_system = {}
+        self._artifact_groups_graph = None
+        self._artifact_name_references = collections.Counter()
         self._defined_artifact_names = set()
+        self._expanded_artifact_groups = {}
+        self._filtered_artifact_names = set()
+        # Artifact definitions and sources per lower case name and index of the
+        # source per operating system, path variable and type indicator.
+        self._sources_by_operating_system = {}
+        self._sources_by_path_variable = {}
+        self._sources_by_type_indicator = {}
+        self._version = 0
+
+    def _AddToSecondaryIndexes(self, artifact_definition):
+        """Adds an artifact definition to the secondary indexes.
+
+        Args:
+          artifact_definition (ArtifactDefinition): an artifact definition.
+        """
+        artifact_definition_name = artifact_definition.name.lower()
+
+        definition_operating_systems = set()
+        for source_index, source in enumerate(artifact_definition.sources):
+            lookup_key = (artifact_definition_name, source_index)
+            index_value = (artifact_definition, source)
+
+            operating_systems = self._GetSourceOperatingSystems(
+                artifact_definition, source
+            )
+            for operating_system in operating_systems:
+                self._sources_by_operating_system.setdefault(operating_system, {})[
+                    lookup_key
+                ] = index_value
+
+            for path_variable in self._GetSourcePathVariables(source):
+                self._sources_by_path_variable.setdefault(path_variable, {})[
+                    lookup_key
+                ] = index_value
+
+            self._sources_by_type_indicator.setdefault(source.type_indicator, {})[
+                lookup_key
+            ] = index_value
+
+            definition_operating_systems.update(operating_systems)
+
+        for operating_system in definition_operating_systems:
+            self._artifact_definitions_by_operating_system.setdefault(
+                operating_system, {}
+            )[artifact_definition_name] = artifact_definition
+
+    def _ChangeVersion(self):
+        """Changes the version of the registry after its definitions changed.
+
+        The memoized expansions of artifact groups are invalidated.
+        """
+        self._expanded_artifact_groups = {}
+        self._version += 1
+
+    def _CopyContainer(self, container):
+        """Copies a container with the registry state.
+
+        Nested dictionaries and sets are copied as well, other values, such as
+        the artifact definitions, are shared with the original container.
+
+        Args:
+          container (dict|set): container.
+
+        Returns:
+          dict|set: copy of the container.
+        """
+        if isinstance(container, set):
+            return set(container)
+
+        container_copy = container.copy()
+        for key, value in container.items():
+            if isinstance(value, (dict, set)):
+                container_copy[key] = self._CopyContainer(value)
+
+        return container_copy
+
+    def _DiscardIndexValue(self, secondary_index, index_key, lookup_key):
+        """Discards a value from a secondary index.
+
+        Args:
+          secondary_index (dict[str, dict[object, object]]): secondary index.
+          index_key (str): key of the secondary index, such as an operating
+              system.
+          lookup_key (object): key of the value, such as a lower case name of
+              an artifact definition.
+        """
+        index_values = secondary_index.get(index_key, None)
+        if index_values is not None:
+            index_values.pop(lookup_key, None)
+            if not index_values:
+                del secondary_index[index_key]
+
+    def _ExpandArtifactGroup(self, name, operating_systems, expansion_stack):
+        """Expands an artifact definition name into leaf artifact definitions.
+
+        Expansions are memoized per version of the registry, unless they are
+        incomplete because they were cut short by a cyclic reference to an
+        artifact group that is still being expanded.
+
+        Args:
+          name (str): name of the artifact definition.
+          operating_systems (frozenset[str]): operating systems to expand the
+              artifact definition for, where None represents all operating
+              systems.
+          expansion_stack (set[str]): lower case names of the artifact groups
+              that are being expanded.
+
+        Returns:
+          tuple[tuple[ArtifactDefinition], bool]: leaf artifact definitions and
+              True if the expansion is complete.
+        """
+        lookup_key = (name.lower(), operating_systems)
+        leaf_definitions = self._expanded_artifact_groups.get(lookup_key, None)
+        if leaf_definitions is not None:
+            return leaf_definitions, True
+
+        if lookup_key[0] in expansion_stack:
+            return (), False
+
+        artifact_definition = self.GetDefinitionByName(name)
+        if artifact_definition and operating_systems is not None:
+            artifact_definition = artifact_definition.FilterByOS(operating_systems)
+
+        if not artifact_definition:
+            return (), True
+
+        is_complete = True
+        leaf_definitions = {}
+
+        expansion_stack.add(lookup_key[0])
+        try:
+            for source in artifact_definition.sources:
+                if source.type_indicator != definitions.TYPE_INDICATOR_ARTIFACT_GROUP:
+                    leaf_definitions.setdefault(
+                        artifact_definition.name.lower(), artifact_definition
+                    )
+                    continue
+
+                for member_name in source.names:
+                    member_definitions, is_member_complete = self._ExpandArtifactGroup(
+                        member_name, operating_systems, expansion_stack
+                    )
+                    is_complete = is_complete and is_member_complete
+                    for member_definition in member_definitions:
+                        leaf_definitions.setdefault(
+                            member_definition.name.lower(), member_definition
+                        )
+
+        finally:
+            expansion_stack.discard(lookup_key[0])
+
+        leaf_definitions = tuple(leaf_definitions.values())
+        if is_complete:
+            self._expanded_artifact_groups[lookup_key] = leaf_definitions
+
+        return leaf_definitions, is_complete
+
+    def _GetSourceOperatingSystems(self, artifact_definition, source):
+        """Retrieves the operating systems a source applies to.
+
+        A source applies to the same operating systems as it would when the
+        artifact definition is filtered by operating system.
+
+        Args:
+          artifact_definition (ArtifactDefinition): an artifact definition.
+          source (SourceType): a source of the artifact definition.
+
+        Returns:
+          set[str]: operating systems, such as "Linux".
+        """
+        supported_os = source.supported_os or artifact_definition.supported_os
+        if source.type_indicator in definitions.WINDOWS_ONLY_TYPE_INDICATORS:
+            if supported_os and definitions.SUPPORTED_OS_WINDOWS not in supported_os:
+                return set()
+
+            return {definitions.SUPPORTED_OS_WINDOWS}
+
+        operating_systems = set(supported_os or definitions.SUPPORTED_OS)
+        if artifact_definition.supported_os:
+            operating_systems.intersection_update(artifact_definition.supported_os)
+
+        return operating_systems
+
+    def _GetSourcePathVariables(self, source):
+        """Retrieves the path variables used by a source.
+
+        Args:
+          source (SourceType): a source.
+
+        Returns:
+          set[str]: lower case path variables, such as "%%users.homedir%%".
+        """
+        if source.type_indicator in (
+            definitions.TYPE_INDICATOR_DIRECTORY,
+            definitions.TYPE_INDICATOR_FILE,
+            definitions.TYPE_INDICATOR_PATH,
+        ):
+            paths = source.paths
+        elif source.type_indicator == definitions.TYPE_INDICATOR_WINDOWS_REGISTRY_KEY:
+            paths = source.keys
+        elif source.type_indicator == definitions.TYPE_INDICATOR_WINDOWS_REGISTRY_VALUE:
+            paths = [pair["key"] for pair in source.key_value_pairs]
+        else:
+            return set()
+
+        return {
+            path_variable.lower()
+            for path in paths
+            if "%%" in path
+            for path_variable in self._PATH_VARIABLE_RE.findall(path)
+        }
+
+    def _RegisterDefinitions(
+        self, artifacts_reader, artifact_definitions, operating_systems=None
+    ):
+        """Registers artifact definitions read by an artifacts reader.
+
+        Artifact definitions filtered out by the registry or the artifacts
+        reader are tracked, so that artifacts groups that reference them are
+        not reported as referencing undefined artifacts.
+
+        Args:
+          artifacts_reader (ArtifactsReader): an artifacts reader.
+          artifact_definitions (iterable[ArtifactDefinition]): artifact
+              definitions.
+          operating_systems (Optional[set[str]]): operating systems, such as
+              "Linux", to register the artifact definitions for, where None
+              represents all operating systems.
+
+        Raises:
+          KeyError: if a duplicate artifact definition is encountered.
+        """
+        if operating_systems is not None:
+            operating_systems = frozenset(operating_systems)
+
+        for artifact_definition in artifact_definitions:
+            if operating_systems is not None:
+                filtered_definition = artifact_definition.FilterByOS(operating_systems)
+                if not filtered_definition:
+                    self._filtered_artifact_names.add(artifact_definition.name)
+                    continue
+
+                artifact_definition = filtered_definition
+
+            self.RegisterDefinition(artifact_definition)
+
+        self._filtered_artifact_names.update(
+            getattr(artifacts_reader, "filtered_artifact_names", set())
+        )
+
+    def _RemoveFromSecondaryIndexes(self, artifact_definition):
+        """Removes an artifact definition from the secondary indexes.
+
+        Args:
+          artifact_definition (ArtifactDefinition): registered artifact
+              definition.
+        """
+        artifact_definition_name = artifact_definition.name.lower()
+
+        for source_index, source in enumerate(artifact_definition.sources):
+            lookup_key = (artifact_definition_name, source_index)
+
+            operating_systems = self._GetSourceOperatingSystems(
+                artifact_definition, source
+            )
+            for operating_system in operating_systems:
+                self._DiscardIndexValue(
+                    self._sources_by_operating_system, operating_system, lookup_key
+                )
+                self._DiscardIndexValue(
+                    self._artifact_definitions_by_operating_system,
+                    operating_system,
+                    artifact_definition_name,
+                )
+
+            for path_variable in self._GetSourcePathVariables(source):
+                self._DiscardIndexValue(
+                    self._sources_by_path_variable, path_variable, lookup_key
+                )
+
+            self._DiscardIndexValue(
+                self._sources_by_type_indicator, source.type_indicator, lookup_key
+            )
+
+    def AnalyzeArtifactGroups(self):
+        """Analyzes the references between artifact groups.
+
+        The graph of the references is built on first use and from then on
+        updated incrementally when artifact definitions are registered or
+        deregistered.
+
+        Returns:
+          ArtifactGroupsAnalysis: analysis of the references between artifact
+              groups, with the strongly connected components, cycles, dangling
+              references and unreachable artifact groups.
+
+        Raises:
+          FormatError: if the format of an artifact definition is not set
+              or incorrect.
+        """
+        if self._artifact_groups_graph is None:
+            artifact_groups_graph = graph.ArtifactGroupsGraph()
+            artifact_groups_graph.Build(self.GetDefinitions())
+            self._artifact_groups_graph = artifact_groups_graph
+
+        # Artifact definitions that were filtered out by operating system are
+        # not dangling references.
+        ignored_names = {name.lower() for name in self._filtered_artifact_names}
+        return self._artifact_groups_graph.GetAnalysis(ignored_names=ignored_names)
 
     @classmethod
-    def CreateSourceType(cls, type_indicator, attributes):
+    def CreateSourceType(cls, type_indicator, attributes, validate=True):
         """Creates a source type object.
 
         Args:
           type_indicator (str): source type indicator.
           attributes (dict[str, object]): source attributes.
+          validate (Optional[bool]): True if the source attributes should be
+              validated, False if they are known to be valid.
 
         Returns:
           SourceType: a source type.
@@ -49,7 +383,23 @@ class ArtifactDefinitionsRegistry:
         if type_indicator not in cls._source_type_classes:
             raise errors.FormatError(f"Unsupported type indicator: {type_indicator:s}.")
 
-        return cls._source_type_classes[type_indicator](**attributes)
+        source_type_class = cls._source_type_classes[type_indicator]
+        if not validate:
+            return source_type_class.CreateWithoutValidation(attributes)
+
+        if type_indicator in cls._source_type_validators:
+            validator = cls._source_type_validators[type_indicator]
+        else:
+            validator = schema.ValidatorCompiler().Compile(source_type_class)
+            cls._source_type_validators[type_indicator] = validator
+
+        if validator:
+            source_object = validator(attributes)
+            if source_object is not None:
+                return source_object
+
+        # The constructor raises a detailed error if the attributes are invalid.
+        return source_type_class(**attributes)
 
     def DeregisterDefinition(self, artifact_definition):
         """Deregisters an artifact definition.
@@ -63,21 +413,42 @@ class ArtifactDefinitionsRegistry:
           KeyError: if an artifact definition is not set for the corresponding name.
         """
         artifact_definition_name = artifact_definition.name.lower()
-        if artifact_definition_name not in self._artifact_definitions_by_name:
+        registered_definition = self._artifact_definitions_by_name.get(
+            artifact_definition_name, None
+        )
+        if not registered_definition:
             raise KeyError(
                 f"Artifact definition not set for name: "
                 f"{artifact_definition.name:s}."
             )
 
-        for alias in artifact_definition.aliases:
+        # The registered artifact definition is used for all the bookkeeping,
+        # since the artifact definition passed, such as one that was read again
+        # from a changed file, can differ from it.
+        for alias in registered_definition.aliases:
             if alias.lower() not in self._artifact_definitions_by_alias:
                 raise KeyError(f"Artifact definition not set for alias: {alias:s}.")
 
+        self._ChangeVersion()
+
+        self._RemoveFromSecondaryIndexes(registered_definition)
+
         del self._artifact_definitions_by_name[artifact_definition_name]
+        self._defined_artifact_names.discard(registered_definition.name)
 
-        for alias in artifact_definition.aliases:
+        for alias in registered_definition.aliases:
             del self._artifact_definitions_by_alias[alias.lower()]
 
+        for source in registered_definition.sources:
+            if source.type_indicator == definitions.TYPE_INDICATOR_ARTIFACT_GROUP:
+                for name in source.names:
+                    self._artifact_name_references[name] -= 1
+                    if self._artifact_name_references[name] <= 0:
+                        del self._artifact_name_references[name]
+
+        if self._artifact_groups_graph is not None:
+            self._artifact_groups_graph.RemoveDefinition(registered_definition)
+
     @classmethod
     def DeregisterSourceType(cls, source_type_class):
         """Deregisters a source type.
@@ -98,6 +469,90 @@ class ArtifactDefinitionsRegistry:
             )
 
         del cls._source_type_classes[source_type_class.TYPE_INDICATOR]
+        cls._source_type_validators.pop(source_type_class.TYPE_INDICATOR, None)
+
+    def Freeze(self, gc_freeze=False):
+        """Freezes the registry.
+
+        The frozen registry contains compacted copies of the artifact
+        definitions and its state is stored in immutable containers. The
+        registry itself and its artifact definitions are left unchanged and can
+        still be used and modified. This is intended for a registry that is
+        loaded before forking worker processes, which then share the frozen
+        registry with the parent process, hence the registry itself should no
+        longer be referenced so that its memory is released before forking.
+
+        Args:
+          gc_freeze (Optional[bool]): True if all objects tracked by the garbage
+              collector, including the artifact definitions, should be moved to
+              its permanent generation, so that garbage collection in a forked
+              worker process does not write to, and thereby copy, the memory
+              pages with these objects.
+
+        Returns:
+          FrozenArtifactDefinitionsRegistry: read-only artifact definitions
+              registry with the artifact definitions of the registry.
+
+        Raises:
+          FormatError: if the format of an artifact definition is not set
+              or incorrect.
+        """
+        compact_registry = ArtifactDefinitionsRegistry()
+        for artifact_definition in self.GetDefinitions():
+            compact_registry.RegisterDefinition(artifact_definition.GetCompactCopy())
+
+        # pylint: disable=protected-access
+        compact_registry._filtered_artifact_names.update(self._filtered_artifact_names)
+
+        frozen_registry = FrozenArtifactDefinitionsRegistry(compact_registry)
+
+        if gc_freeze:
+            gc.collect()
+            gc.freeze()
+
+        return frozen_registry
+
+    def ExpandArtifactGroups(self, names, operating_systems=None):
+        """Expands artifact definition names into leaf artifact definitions.
+
+        Artifact groups are expanded recursively into the artifact definitions
+        with sources other than artifact groups. Every artifact definition is
+        returned once, in the order in which it is first encountered. Names
+        of undefined artifact definitions and cyclic references are ignored.
+
+        Args:
+          names (str|list[str]): name of an artifact definition, such as
+              "TriagePersistence", or names of artifact definitions.
+          operating_systems (Optional[set[str]]): operating systems, such as
+              "Linux", to expand the artifact definitions for, where None
+              represents all operating systems. Artifact definitions and
+              sources that do not apply to these operating systems are skipped.
+
+        Returns:
+          list[ArtifactDefinition]: leaf artifact definitions, which only
+              contain the sources that apply to the operating systems.
+
+        Raises:
+          FormatError: if the format of an artifact definition is not set
+              or incorrect.
+        """
+        if isinstance(names, str):
+            names = [names]
+
+        if operating_systems is not None:
+            operating_systems = frozenset(operating_systems)
+
+        leaf_definitions = {}
+        for name in names:
+            member_definitions, _ = self._ExpandArtifactGroup(
+                name, operating_systems, set()
+            )
+            for member_definition in member_definitions:
+                leaf_definitions.setdefault(
+                    member_definition.name.lower(), member_definition
+                )
+
+        return list(leaf_definitions.values())
 
     def GetDefinitionByAlias(self, alias):
         """Retrieves a specific artifact definition by alias.
@@ -135,13 +590,133 @@ class ArtifactDefinitionsRegistry:
         """
         yield from self._artifact_definitions_by_name.values()
 
+    def GetDefinitionsByOperatingSystem(self, operating_system):
+        """Retrieves the artifact definitions that apply to an operating system.
+
+        An artifact definition applies to an operating system if one of its
+        sources does, as when filtering it by operating system.
+
+        Args:
+          operating_system (str): operating system, such as "Linux".
+
+        Returns:
+          list[ArtifactDefinition]: artifact definitions, in the order in which
+              they were registered.
+        """
+        artifact_definitions = self._artifact_definitions_by_operating_system.get(
+            operating_system, {}
+        )
+        return list(artifact_definitions.values())
+
+    @classmethod
+    def GetSchemaIdentifier(cls):
+        """Retrieves an identifier of the layout of the artifact definitions.
+
+        The identifier changes when the attributes of the artifact definition
+        classes or of the registered source types change, so that persisted
+        artifact definitions with a different layout are not used.
+
+        Returns:
+          str: SHA-256 digest of the names, slots and schema attribute names of
+              the artifact definition and source type classes.
+        """
+        # The hashlib module is expensive to import and only needed by the
+        # persistent cache and snapshot, hence it is imported here.
+        import hashlib  # pylint: disable=import-outside-toplevel
+
+        classes = [artifact.ArtifactDefinition, artifact.LeanArtifactDefinition]
+        classes.extend(
+            source_type_class
+            for _, source_type_class in sorted(cls._source_type_classes.items())
+        )
+
+        schema_hash = hashlib.sha256()
+        for class_object in classes:
+            slots = [
+                name
+                for mro_class in class_object.__mro__
+                for name in vars(mro_class).get("__slots__", ())
+            ]
+            schema_attributes = vars(class_object).get("SCHEMA", None) or ()
+            class_layout = ":".join(
+                [
+                    f"{class_object.__module__:s}.{class_object.__qualname__:s}",
+                    ",".join(slots),
+                    ",".join(attribute.name for attribute in schema_attributes),
+                ]
+            )
+            schema_hash.update(f"{class_layout:s}\n".encode("utf-8"))
+
+        return schema_hash.hexdigest()
+
+    def GetSources(
+        self, operating_system=None, path_variable=None, type_indicator=None
+    ):
+        """Retrieves the sources that match the criteria.
+
+        The sources are looked up in the secondary indexes of the criteria,
+        without iterating over all the artifact definitions.
+
+        Args:
+          operating_system (Optional[str]): operating system the sources apply
+              to, such as "Linux", where None represents any.
+          path_variable (Optional[str]): path variable the paths or keys of the
+              sources use, such as "%%users.homedir%%", where None represents
+              any.
+          type_indicator (Optional[str]): type indicator of the sources, such
+              as "FILE", where None represents any.
+
+        Returns:
+          list[tuple[ArtifactDefinition, SourceType]]: artifact definitions and
+              sources, in the order in which the artifact definitions were
+              registered.
+        """
+        candidate_sources = []
+        if operating_system is not None:
+            candidate_sources.append(
+                self._sources_by_operating_system.get(operating_system, {})
+            )
+        if path_variable is not None:
+            candidate_sources.append(
+                self._sources_by_path_variable.get(path_variable.lower(), {})
+            )
+        if type_indicator is not None:
+            candidate_sources.append(
+                self._sources_by_type_indicator.get(type_indicator, {})
+            )
+
+        if not candidate_sources:
+            return [
+                (artifact_definition, source)
+                for artifact_definition in self.GetDefinitions()
+                for source in artifact_definition.sources
+            ]
+
+        # The smallest secondary index is iterated and the others are used to
+        # look up whether the sources match the other criteria.
+        candidate_sources.sort(key=len)
+        sources, other_sources = candidate_sources[0], candidate_sources[1:]
+
+        return [
+            index_value
+            for lookup_key, index_value in sources.items()
+            if all(lookup_key in other_index for other_index in other_sources)
+        ]
+
     def GetUndefinedArtifacts(self):
         """Retrieves the names of undefined artifacts used by artifact groups.
 
+        Names of artifact definitions that were filtered out by operating
+        system are not considered undefined.
+
         Returns:
           set[str]: undefined artifacts names.
         """
-        return self._artifact_name_references - self._defined_artifact_names
+        return (
+            set(self._artifact_name_references)
+            - self._defined_artifact_names
+            - self._filtered_artifact_names
+        )
 
     def RegisterDefinition(self, artifact_definition):
         """Registers an artifact definition.
@@ -172,6 +747,8 @@ class ArtifactDefinitionsRegistry:
                     f"Artifact definition alias: {alias:s} already used as name."
                 )
 
+        self._ChangeVersion()
+
         self._artifact_definitions_by_name[artifact_definition_name] = (
             artifact_definition
         )
@@ -184,6 +761,11 @@ class ArtifactDefinitionsRegistry:
             if source.type_indicator == definitions.TYPE_INDICATOR_ARTIFACT_GROUP:
                 self._artifact_name_references.update(source.names)
 
+        self._AddToSecondaryIndexes(artifact_definition)
+
+        if self._artifact_groups_graph is not None:
+            self._artifact_groups_graph.AddDefinition(artifact_definition)
+
     @classmethod
     def RegisterSourceType(cls, source_type_class):
         """Registers a source type.
@@ -204,6 +786,7 @@ class ArtifactDefinitionsRegistry:
             )
 
         cls._source_type_classes[source_type_class.TYPE_INDICATOR] = source_type_class
+        cls._source_type_validators.pop(source_type_class.TYPE_INDICATOR, None)
 
     @classmethod
     def RegisterSourceTypes(cls, source_type_classes):
@@ -217,7 +800,75 @@ class ArtifactDefinitionsRegistry:
         for source_type_class in source_type_classes:
             cls.RegisterSourceType(source_type_class)
 
-    def ReadFromDirectory(self, artifacts_reader, path, extension="yaml"):
+    def ReplaceDefinitions(
+        self,
+        removed_definitions,
+        added_definitions,
+        removed_filtered_names=None,
+        added_filtered_names=None,
+    ):
+        """Replaces artifact definitions.
+
+        The artifact definitions are first deregistered and registered on a copy
+        of the registry state, which then replaces the registry state at once.
+        Concurrent readers see either the previous or the new artifact
+        definitions, and the registry is left unchanged if an error is raised.
+
+        Args:
+          removed_definitions (list[ArtifactDefinition]): artifact definitions
+              to deregister.
+          added_definitions (list[ArtifactDefinition]): artifact definitions to
+              register.
+          removed_filtered_names (Optional[set[str]]): names of artifact
+              definitions that are no longer filtered out by the reader.
+          added_filtered_names (Optional[set[str]]): names of artifact
+              definitions that were filtered out by the reader.
+
+        Raises:
+          KeyError: if an artifact definition to deregister is not set or if
+              an artifact definition to register is already set for the
+              corresponding name or alias.
+        """
+        staging_registry = copy.copy(self)
+        for name, value in vars(self).items():
+            if isinstance(value, (dict, set)):
+                setattr(staging_registry, name, self._CopyContainer(value))
+
+        # The graph of the references between artifact groups is copied as
+        # well, so that the graph of the registry is left unchanged if an error
+        # is raised.
+        # pylint: disable=protected-access
+        if self._artifact_groups_graph is not None:
+            staging_registry._artifact_groups_graph = copy.deepcopy(
+                self._artifact_groups_graph
+            )
+
+        for artifact_definition in removed_definitions:
+            staging_registry.DeregisterDefinition(artifact_definition)
+
+        for artifact_definition in added_definitions:
+            staging_registry.RegisterDefinition(artifact_definition)
+
+        if removed_filtered_names:
+            staging_registry._filtered_artifact_names.difference_update(
+                removed_filtered_names
+            )
+        if added_filtered_names:
+            staging_registry._filtered_artifact_names.update(added_filtered_names)
+
+        # Updating the instance dictionary with a single call ensures other
+        # threads do not observe a partially replaced state.
+        self.__dict__.update(vars(staging_registry))
+
+    def ReadFromDirectory(
+        self,
+        artifacts_reader,
+        path,
+        extension="yaml",
+        cache=None,
+        number_of_workers=None,
+        operating_systems=None,
+    ):
         """Reads artifact definitions into the registry from files in a directory.
 
         This function does not recurse sub directories.
@@ -226,31 +877,711 @@ class ArtifactDefinitionsRegistry:
           artifacts_reader (ArtifactsReader): an artifacts reader.
           path (str): path of the directory to read from.
           extension (Optional[str]): extension of the filenames to read.
+          cache (Optional[ArtifactDefinitionsCache]): cache of validated artifact
+              definitions, where None represents no cache should be used.
+          number_of_workers (Optional[int]): number of worker processes to parse
+              the files with, where None or 1 represents parsing the files in
+              the current process. Ignored when a cache is used.
+          operating_systems (Optional[set[str]]): operating systems, such as
+              "Linux", to read the artifact definitions for, where None
+              represents all operating systems. Artifact definitions and
+              sources that do not apply to these operating systems are skipped.
 
         Raises:
           KeyError: if a duplicate artifact definition is encountered.
         """
-        for artifact_definition in artifacts_reader.ReadDirectory(
-            path, extension=extension
-        ):
-            self.RegisterDefinition(artifact_definition)
+        if cache:
+            artifact_definitions = cache.ReadDirectory(
+                artifacts_reader, path, extension=extension
+            )
+        else:
+            artifact_definitions = artifacts_reader.ReadDirectory(
+                path, extension=extension, number_of_workers=number_of_workers
+            )
+
+        self._RegisterDefinitions(
+            artifacts_reader, artifact_definitions, operating_systems=operating_systems
+        )
 
-    def ReadFromFile(self, artifacts_reader, filename):
+    def ReadFromFile(self, artifacts_reader, filename, operating_systems=None):
         """Reads artifact definitions into the registry from a file.
 
         Args:
           artifacts_reader (ArtifactsReader): an artifacts reader.
           filename (str): name of the file to read from.
+          operating_systems (Optional[set[str]]): operating systems, such as
+              "Linux", to read the artifact definitions for, where None
+              represents all operating systems.
         """
-        for artifact_definition in artifacts_reader.ReadFile(filename):
-            self.RegisterDefinition(artifact_definition)
+        self._RegisterDefinitions(
+            artifacts_reader,
+            artifacts_reader.ReadFile(filename),
+            operating_systems=operating_systems,
+        )
 
-    def ReadFileObject(self, artifacts_reader, file_object):
+    def ReadFileObject(self, artifacts_reader, file_object, operating_systems=None):
         """Reads artifact definitions into the registry from a file-like object.
 
         Args:
           artifacts_reader (ArtifactsReader): an artifacts reader.
           file_object (file): file-like object to read from.
+          operating_systems (Optional[set[str]]): operating systems, such as
+              "Linux", to read the artifact definitions for, where None
+              represents all operating systems.
         """
-        for artifact_definition in artifacts_reader.ReadFileObject(file_object):
-            self.RegisterDefinition(artifact_definition)
+        self._RegisterDefinitions(
+            artifacts_reader,
+            artifacts_reader.ReadFileObject(file_object),
+            operating_systems=operating_systems,
+        )
+
+    async def ReadFromDirectoriesAsync(
+        self,
+        artifacts_reader,
+        paths,
+        extension="yaml",
+        executor=None,
+        operating_systems=None,
+    ):
+        """Reads artifact definitions into the registry from many directories.
+
+        The files in the directories are read concurrently, see
+        ReadFromFilesAsync. This function does not recurse sub directories.
+
+        Args:
+          artifacts_reader (ArtifactsReader): an artifacts reader.
+          paths (list[str]): paths of the directories to read from.
+          extension (Optional[str]): extension of the filenames to read.
+          executor (Optional[concurrent.futures.Executor]): executor to list
+              the directories and read the files with, where None represents
+              the default executor of the event loop.
+          operating_systems (Optional[set[str]]): operating systems, such as
+              "Linux", to read the artifact definitions for, where None
+              represents all operating systems.
+
+        Raises:
+          FormatError: if the format of an artifact definition is not set
+              or incorrect.
+          KeyError: if a duplicate artifact definition is encountered.
+        """
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        event_loop = asyncio.get_running_loop()
+        directory_filenames = await asyncio.gather(
+            *[
+                event_loop.run_in_executor(
+                    executor, artifacts_reader.GetDirectoryFilenames, path, extension
+                )
+                for path in paths
+            ]
+        )
+
+        filenames = []
+        for artifact_files in directory_filenames:
+            filenames.extend(artifact_files)
+
+        await self.ReadFromFilesAsync(
+            artifacts_reader,
+            filenames,
+            executor=executor,
+            operating_systems=operating_systems,
+        )
+
+    async def ReadFromFilesAsync(
+        self, artifacts_reader, filenames, executor=None, operating_systems=None
+    ):
+        """Reads artifact definitions into the registry from many files.
+
+        The files are read and parsed concurrently by an executor, so that the
+        event loop is not blocked. The artifact definitions of a file are
+        registered as soon as the file and all the files before it have been
+        read, hence the order of registration, duplicate detection and which
+        error is raised do not depend on the order in which the files are
+        read. Files after the first file that cannot be read are not
+        registered.
+
+        Args:
+          artifacts_reader (ArtifactsReader): an artifacts reader.
+          filenames (list[str]): names of the files to read from.
+          executor (Optional[concurrent.futures.Executor]): executor to read
+              the files with, such as a thread or process pool, where None
+              represents the default executor of the event loop.
+          operating_systems (Optional[set[str]]): operating systems, such as
+              "Linux", to read the artifact definitions for, where None
+              represents all operating systems.
+
+        Raises:
+          FormatError: if the format of an artifact definition is not set
+              or incorrect.
+          KeyError: if a duplicate artifact definition is encountered.
+        """
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        tasks = [
+            asyncio.ensure_future(
+                artifacts_reader.ReadFileAsync(filename, executor=executor)
+            )
+            for filename in filenames
+        ]
+        try:
+            for filename, task in zip(filenames, tasks):
+                try:
+                    artifact_definitions = await task
+                except errors.FormatError as exception:
+                    raise errors.FormatError(
+                        f"Unable to read artifact definitions from: {filename:s} "
+                        f"with error: {exception!s}"
+                    )
+
+                self._RegisterDefinitions(
+                    artifacts_reader,
+                    artifact_definitions,
+                    operating_systems=operating_systems,
+                )
+
+        finally:
+            for task in tasks:
+                task.cancel()
+
+            # Retrieve the results of the remaining tasks so that their errors
+            # are not reported as never retrieved.
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class LazyArtifactDefinitionsRegistry(ArtifactDefinitionsRegistry):
+    """Artifact definitions registry that reads definitions on first access.
+
+    Reading from YAML files only builds an index of the names, aliases and
+    offsets of the documents in the files. An artifact definition is read when
+    it is first looked up. Functions that need all the artifact definitions,
+    such as GetDefinitions and GetUndefinedArtifacts, read the remaining
+    artifact definitions first.
+
+    Readers that do not support indexing, such as the JSON artifacts reader,
+    read the artifact definitions on registration.
+    """
+
+    def __init__(self):
+        """Initializes a lazy artifact definitions registry."""
+        super().__init__()
+        self._index_entries_by_alias = {}
+        self._index_entries_by_name = {}
+
+    def _CheckNameAndAliases(self, name, aliases):
+        """Checks that a name and aliases are not registered or indexed.
+
+        Args:
+          name (str): name of the artifact definition.
+          aliases (list[str]): aliases of the artifact definition.
+
+        Raises:
+          KeyError: if artifact definition is already set for the corresponding
+              name or alias.
+        """
+        name_lower = name.lower()
+        if (
+            name_lower in self._artifact_definitions_by_name
+            or name_lower in self._index_entries_by_name
+        ):
+            raise KeyError(f"Artifact definition already set for name: {name:s}.")
+
+        for alias in aliases:
+            alias_lower = alias.lower()
+            if (
+                alias_lower in self._artifact_definitions_by_alias
+                or alias_lower in self._index_entries_by_alias
+            ):
+                raise KeyError(f"Artifact definition already set for alias: {alias:s}.")
+
+            if (
+                alias_lower in self._artifact_definitions_by_name
+                or alias_lower in self._index_entries_by_name
+            ):
+                raise KeyError(
+                    f"Artifact definition alias: {alias:s} already used as name."
+                )
+
+    def _ReadIndexEntries(self):
+        """Reads and registers the artifact definitions of all index entries.
+
+        Raises:
+          FormatError: if the format of an artifact definition is not set
+              or incorrect.
+        """
+        for artifacts_reader, index_entry in list(self._index_entries_by_name.values()):
+            self._ReadIndexEntry(artifacts_reader, index_entry)
+
+    def _ReadIndexEntry(self, artifacts_reader, index_entry):
+        """Reads and registers the artifact definition of an index entry.
+
+        Args:
+          artifacts_reader (YamlArtifactsReader): an artifacts reader.
+          index_entry (DocumentIndexEntry): document index entry.
+
+        Raises:
+          FormatError: if the format of the artifact definition is not set
+              or incorrect, or does not match the index entry.
+        """
+        artifact_definition = artifacts_reader.ReadDocument(index_entry)
+        if artifact_definition.name != index_entry.name:
+            raise errors.FormatError(
+                f"Artifact definition: {artifact_definition.name:s} does not "
+                f"match indexed name: {index_entry.name:s}."
+            )
+
+        del self._index_entries_by_name[index_entry.name.lower()]
+        for alias in index_entry.aliases:
+            del self._index_entries_by_alias[alias.lower()]
+
+        # Reading an indexed artifact definition does not change the artifact
+        # definitions of the registry, hence its version is retained.
+        expanded_artifact_groups = self._expanded_artifact_groups
+        version = self._version
+
+        super().RegisterDefinition(artifact_definition)
+
+        self._expanded_artifact_groups = expanded_artifact_groups
+        self._version = version
+
+    def _RegisterIndexEntry(self, artifacts_reader, index_entry):
+        """Registers a document index entry.
+
+        Args:
+          artifacts_reader (YamlArtifactsReader): an artifacts reader.
+          index_entry (DocumentIndexEntry): document index entry.
+
+        Raises:
+          KeyError: if artifact definition is already set for the corresponding
+              name or alias.
+        """
+        self._CheckNameAndAliases(index_entry.name, index_entry.aliases)
+        self._ChangeVersion()
+
+        # The graph of the references between artifact groups only contains
+        # the artifact definitions that were read, hence it is rebuilt on use.
+        self._artifact_groups_graph = None
+
+        index_value = (artifacts_reader, index_entry)
+        self._index_entries_by_name[index_entry.name.lower()] = index_value
+        for alias in index_entry.aliases:
+            self._index_entries_by_alias[alias.lower()] = index_value
+
+    def _SupportsIndexing(self, artifacts_reader, operating_systems):
+        """Determines if artifact definitions can be read on first access.
+
+        Args:
+          artifacts_reader (ArtifactsReader): an artifacts reader.
+          operating_systems (set[str]): operating systems to read the artifact
+              definitions for, where None represents all operating systems.
+
+        Returns:
+          bool: True if the reader supports indexing and the artifact
+              definitions are not filtered by operating system, since which
+              artifact definitions apply is only known once they are read.
+        """
+        if operating_systems is not None:
+            return False
+
+        if getattr(artifacts_reader, "operating_systems", None) is not None:
+            return False
+
+        return hasattr(artifacts_reader, "ReadDocumentIndex")
+
+    def DeregisterDefinition(self, artifact_definition):
+        """Deregisters an artifact definition.
+
+        An artifact definition that was indexed but not yet read is removed
+        from the index without reading it.
+
+        Args:
+          artifact_definition (ArtifactDefinition): an artifact definition.
+
+        Raises:
+          KeyError: if an artifact definition is not set for the corresponding
+              name.
+        """
+        artifact_definition_name = artifact_definition.name.lower()
+        index_value = self._index_entries_by_name.get(artifact_definition_name, None)
+        if not index_value:
+            super().DeregisterDefinition(artifact_definition)
+            return
+
+        # An artifact definition that was not read is not part of the other
+        # registry state, such as the references to artifact definition names.
+        _, index_entry = index_value
+
+        self._ChangeVersion()
+
+        del self._index_entries_by_name[artifact_definition_name]
+        for alias in index_entry.aliases:
+            del self._index_entries_by_alias[alias.lower()]
+
+    def GetDefinitionByAlias(self, alias):
+        """Retrieves a specific artifact definition by alias.
+
+        Args:
+          alias (str): alias of the artifact definition.
+
+        Returns:
+          ArtifactDefinition: an artifact definition or None if not available.
+
+        Raises:
+          FormatError: if the format of the artifact definition is not set
+              or incorrect.
+        """
+        if alias:
+            index_value = self._index_entries_by_alias.get(alias.lower(), None)
+            if index_value:
+                self._ReadIndexEntry(*index_value)
+
+        return super().GetDefinitionByAlias(alias)
+
+    def GetDefinitionByName(self, name):
+        """Retrieves a specific artifact definition by name.
+
+        Args:
+          name (str): name of the artifact definition.
+
+        Returns:
+          ArtifactDefinition: an artifact definition or None if not available.
+
+        Raises:
+          FormatError: if the format of the artifact definition is not set
+              or incorrect.
+        """
+        if name:
+            index_value = self._index_entries_by_name.get(name.lower(), None)
+            if index_value:
+                self._ReadIndexEntry(*index_value)
+
+        return super().GetDefinitionByName(name)
+
+    def GetDefinitions(self):
+        """Retrieves the artifact definitions.
+
+        Yields:
+          ArtifactDefinition: artifact definition.
+
+        Raises:
+          FormatError: if the format of an artifact definition is not set
+              or incorrect.
+        """
+        self._ReadIndexEntries()
+        yield from super().GetDefinitions()
+
+    def GetDefinitionsByOperatingSystem(self, operating_system):
+        """Retrieves the artifact definitions that apply to an operating system.
+
+        Args:
+          operating_system (str): operating system, such as "Linux".
+
+        Returns:
+          list[ArtifactDefinition]: artifact definitions, in the order in which
+              they were registered.
+
+        Raises:
+          FormatError: if the format of an artifact definition is not set
+              or incorrect.
+        """
+        self._ReadIndexEntries()
+        return super().GetDefinitionsByOperatingSystem(operating_system)
+
+    def GetSources(
+        self, operating_system=None, path_variable=None, type_indicator=None
+    ):
+        """Retrieves the sources that match the criteria.
+
+        Args:
+          operating_system (Optional[str]): operating system the sources apply
+              to, such as "Linux", where None represents any.
+          path_variable (Optional[str]): path variable the paths or keys of the
+              sources use, such as "%%users.homedir%%", where None represents
+              any.
+          type_indicator (Optional[str]): type indicator of the sources, such
+              as "FILE", where None represents any.
+
+        Returns:
+          list[tuple[ArtifactDefinition, SourceType]]: artifact definitions and
+              sources, in the order in which the artifact definitions were
+              registered.
+
+        Raises:
+          FormatError: if the format of an artifact definition is not set
+              or incorrect.
+        """
+        self._ReadIndexEntries()
+        return super().GetSources(
+            operating_system=operating_system,
+            path_variable=path_variable,
+            type_indicator=type_indicator,
+        )
+
+    def GetUndefinedArtifacts(self):
+        """Retrieves the names of undefined artifacts used by artifact groups.
+
+        Returns:
+          set[str]: undefined artifacts names.
+
+        Raises:
+          FormatError: if the format of an artifact definition is not set
+              or incorrect.
+        """
+        self._ReadIndexEntries()
+        return super().GetUndefinedArtifacts()
+
+    def RegisterDefinition(self, artifact_definition):
+        """Registers an artifact definition.
+
+        Artifact definitions are identified based on their lower case name.
+
+        Args:
+          artifact_definition (ArtifactDefinition): an artifact definition.
+
+        Raises:
+          KeyError: if artifact definition is already set for the corresponding
+              name or alias.
+        """
+        self._CheckNameAndAliases(artifact_definition.name, artifact_definition.aliases)
+        super().RegisterDefinition(artifact_definition)
+
+    def ReadFromDirectory(
+        self,
+        artifacts_reader,
+        path,
+        extension="yaml",
+        cache=None,
+        number_of_workers=None,
+        operating_systems=None,
+    ):
+        """Reads artifact definitions into the registry from files in a directory.
+
+        This function does not recurse sub directories.
+
+        Args:
+          artifacts_reader (ArtifactsReader): an artifacts reader.
+          path (str): path of the directory to read from.
+          extension (Optional[str]): extension of the filenames to read.
+          cache (Optional[ArtifactDefinitionsCache]): cache of validated artifact
+              definitions, where None represents no cache should be used.
+              Ignored when the reader supports indexing.
+          number_of_workers (Optional[int]): number of worker processes to parse
+              the files with, where None or 1 represents parsing the files in
+              the current process. Ignored when the reader supports indexing.
+          operating_systems (Optional[set[str]]): operating systems, such as
+              "Linux", to read the artifact definitions for, where None
+              represents all operating systems. Filtering by operating system
+              requires the artifact definitions to be read on registration.
+
+        Raises:
+          FormatError: if a document does not define a name.
+          KeyError: if a duplicate artifact definition is encountered.
+        """
+        if not self._SupportsIndexing(artifacts_reader, operating_systems):
+            super().ReadFromDirectory(
+                artifacts_reader,
+                path,
+                extension=extension,
+                cache=cache,
+                number_of_workers=number_of_workers,
+                operating_systems=operating_systems,
+            )
+            return
+
+        for filename in artifacts_reader.GetDirectoryFilenames(
+            path, extension=extension
+        ):
+            self.ReadFromFile(artifacts_reader, filename)
+
+    def ReadFromFile(self, artifacts_reader, filename, operating_systems=None):
+        """Reads artifact definitions into the registry from a file.
+
+        Args:
+          artifacts_reader (ArtifactsReader): an artifacts reader.
+          filename (str): name of the file to read from.
+          operating_systems (Optional[set[str]]): operating systems, such as
+              "Linux", to read the artifact definitions for, where None
+              represents all operating systems. Filtering by operating system
+              requires the artifact definitions to be read on registration.
+
+        Raises:
+          FormatError: if a document does not define a name.
+          KeyError: if a duplicate artifact definition is encountered.
+        """
+        if not self._SupportsIndexing(artifacts_reader, operating_systems):
+            super().ReadFromFile(
+                artifacts_reader, filename, operating_systems=operating_systems
+            )
+            return
+
+        for index_entry in artifacts_reader.ReadDocumentIndex(filename):
+            self._RegisterIndexEntry(artifacts_reader, index_entry)
+
+
+class FrozenArtifactDefinitionsRegistry(ArtifactDefinitionsRegistry):
+    """Read-only artifact definitions registry.
+
+    The registry state is stored in immutable containers and the artifact
+    definitions in their compact representation. Functions that modify the
+    registry raise TypeError.
+    """
+
+    def __init__(self, artifact_registry):
+        """Initializes a frozen artifact definitions registry.
+
+        Args:
+          artifact_registry (ArtifactDefinitionsRegistry): artifact definitions
+              registry with the artifact definitions of the frozen registry,
+              which should be compacted.
+        """
+        super().__init__()
+        # pylint: disable=protected-access
+        self._artifact_definitions_by_alias = types.MappingProxyType(
+            dict(artifact_registry._artifact_definitions_by_alias)
+        )
+        self._artifact_definitions_by_name = types.MappingProxyType(
+            dict(artifact_registry._artifact_definitions_by_name)
+        )
+        self._artifact_name_references = types.MappingProxyType(
+            dict(artifact_registry._artifact_name_references)
+        )
+        self._defined_artifact_names = frozenset(
+            artifact_registry._defined_artifact_names
+        )
+        self._filtered_artifact_names = frozenset(
+            artifact_registry._filtered_artifact_names
+        )
+
+        for name in (
+            "_artifact_definitions_by_operating_system",
+            "_sources_by_operating_system",
+            "_sources_by_path_variable",
+            "_sources_by_type_indicator",
+        ):
+            secondary_index = {
+                index_key: types.MappingProxyType(dict(index_values))
+                for index_key, index_values in getattr(artifact_registry, name).items()
+            }
+            setattr(self, name, types.MappingProxyType(secondary_index))
+
+    def _RegisterDefinitions(
+        self, artifacts_reader, artifact_definitions, operating_systems=None
+    ):
+        """Registers artifact definitions read by an artifacts reader.
+
+        Args:
+          artifacts_reader (ArtifactsReader): an artifacts reader.
+          artifact_definitions (iterable[ArtifactDefinition]): artifact
+              definitions.
+          operating_systems (Optional[set[str]]): operating systems, such as
+              "Linux", to register the artifact definitions for, where None
+              represents all operating systems.
+
+        Raises:
+          TypeError: since the registry is read-only.
+        """
+        raise TypeError("Unable to register artifact definitions in frozen registry.")
+
+    def DeregisterDefinition(self, artifact_definition):
+        """Deregisters an artifact definition.
+
+        Args:
+          artifact_definition (ArtifactDefinition): an artifact definition.
+
+        Raises:
+          TypeError: since the registry is read-only.
+        """
+        raise TypeError(
+            f"Unable to deregister artifact definition: "
+            f"{artifact_definition.name:s} from frozen registry."
+        )
+
+    def Freeze(self, gc_freeze=False):
+        """Freezes the registry.
+
+        Args:
+          gc_freeze (Optional[bool]): True if all objects tracked by the garbage
+              collector should be moved to its permanent generation.
+
+        Returns:
+          FrozenArtifactDefinitionsRegistry: the registry itself.
+        """
+        if gc_freeze:
+            gc.collect()
+            gc.freeze()
+
+        return self
+
+    def RegisterDefinition(self, artifact_definition):
+        """Registers an artifact definition.
+
+        Args:
+          artifact_definition (ArtifactDefinition): an artifact definition.
+
+        Raises:
+          TypeError: since the registry is read-only.
+        """
+        raise TypeError(
+            f"Unable to register artifact definition: {artifact_definition.name:s} "
+            f"in frozen registry."
+        )
+
+    def ReplaceDefinitions(
+        self,
+        removed_definitions,
+        added_definitions,
+        removed_filtered_names=None,
+        added_filtered_names=None,
+    ):
+        """Replaces artifact definitions.
+
+        Args:
+          removed_definitions (list[ArtifactDefinition]): artifact definitions
+              to deregister.
+          added_definitions (list[ArtifactDefinition]): artifact definitions to
+              register.
+          removed_filtered_names (Optional[set[str]]): names of artifact
+              definitions that are no longer filtered out by the reader.
+          added_filtered_names (Optional[set[str]]): names of artifact
+              definitions that were filtered out by the reader.
+
+        Raises:
+          TypeError: since the registry is read-only.
+        """
+        raise TypeError("Unable to replace artifact definitions in frozen registry.")
+
+
+def LoadBundledDefinitions(verify=True):
+    """Loads the artifact definitions bundled with the package.
+
+    The definitions are loaded from the pre-validated snapshot that is generated
+    when the package is built. If the snapshot is not available or does not
+    match the bundled definitions files, such as in a source checkout, the
+    definitions files are read instead.
+
+    Args:
+      verify (Optional[bool]): True if the snapshot should only be used if it
+          matches the bundled definitions files.
+
+    Returns:
+      ArtifactDefinitionsRegistry: artifact definitions registry with the
+          bundled artifact definitions.
+    """
+    # The snapshot and reader modules depend on modules that are expensive to
+    # import and that are not needed by other uses of the registry, hence they
+    # are imported here.
+    # pylint: disable=import-outside-toplevel
+    from artifacts import reader
+    from artifacts import snapshot
+
+    artifact_registry = ArtifactDefinitionsRegistry()
+
+    definitions_snapshot = snapshot.ArtifactDefinitionsSnapshot(BUNDLED_SNAPSHOT_PATH)
+    artifact_definitions = definitions_snapshot.Read(BUNDLED_DATA_PATH, verify=verify)
+    if artifact_definitions is None:
+        artifacts_reader = reader.YamlArtifactsReader(compact=True)
+        artifact_definitions = artifacts_reader.ReadDirectory(BUNDLED_DATA_PATH)
+
+    for artifact_definition in artifact_definitions:
+        artifact_registry.RegisterDefinition(artifact_definition)
+
+    return artifact_registry
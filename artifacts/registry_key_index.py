@@ -0,0 +1,157 @@
+"""The index of the Windows Registry keys of artifact definitions.
+
+The index is a case-insensitive trie of the segments of the key paths of the
+Windows Registry key and value sources. Path variables, such as
+"%%users.sid%%", and globs, such as "*", match a single segment and a
+recursive glob, "**" or "**N", zero up to 10 or N segments. The key paths
+that start with "%%current_control_set%%" are indexed as
+"HKEY_LOCAL_MACHINE\\System\\CurrentControlSet" and numbered control sets,
+such as "ControlSet001", are looked up as "CurrentControlSet". Value names
+are matched case-insensitive with the same glob rules as key path segments.
+"""
+
+import re
+
+from artifacts import definitions
+from artifacts import path_index
+
+
+class WindowsRegistryKeyIndex(path_index.PathIndex):
+    """Index from Windows Registry key paths to the artifact definitions."""
+
+    _CONTROL_SET_RE = re.compile(r"^controlset[0-9]+$")
+
+    _CURRENT_CONTROL_SET = "%%current_control_set%%"
+
+    _CURRENT_CONTROL_SET_KEY_PATH = "HKEY_LOCAL_MACHINE\\System\\CurrentControlSet"
+
+    _VARIABLE_MATCHES_SEGMENTS = False
+
+    def __init__(self):
+        """Initializes a Windows Registry key index."""
+        super().__init__()
+        # Regular expression per glob value name, where None represents a
+        # literal value name.
+        self._value_name_res = {}
+
+    def _GetLookupSegments(self, key_path):
+        """Retrieves the segments of a key path to look up.
+
+        Args:
+          key_path (str): key path relative to the root of the Windows Registry.
+
+        Returns:
+          list[str]: lower case segments of the key path.
+        """
+        segments = self._GetSegments(key_path.lower(), "\\")
+        if (
+            len(segments) > 2
+            and segments[0] == "hkey_local_machine"
+            and segments[1] == "system"
+            and self._CONTROL_SET_RE.match(segments[2])
+        ):
+            segments[2] = "currentcontrolset"
+
+        return segments
+
+    def _GetRootNode(self):
+        """Retrieves the root node of the trie.
+
+        Returns:
+          PathIndexNode: root node of the trie.
+        """
+        root_node = self._root_nodes.get(("\\", True), None)
+        if not root_node:
+            root_node = path_index.PathIndexNode()
+            self._root_nodes[("\\", True)] = root_node
+
+        return root_node
+
+    def AddDefinition(self, artifact_definition):
+        """Adds the key paths of an artifact definition to the index.
+
+        Args:
+          artifact_definition (ArtifactDefinition): an artifact definition.
+        """
+        for source in artifact_definition.sources:
+            if source.type_indicator == definitions.TYPE_INDICATOR_WINDOWS_REGISTRY_KEY:
+                key_paths_and_value_names = [
+                    (key_path, None) for key_path in source.keys
+                ]
+            elif (
+                source.type_indicator
+                == definitions.TYPE_INDICATOR_WINDOWS_REGISTRY_VALUE
+            ):
+                key_paths_and_value_names = [
+                    (pair["key"], pair["value"]) for pair in source.key_value_pairs
+                ]
+            else:
+                continue
+
+            root_node = self._GetRootNode()
+            for key_path, value_name in key_paths_and_value_names:
+                indexed_key_path = key_path
+                if key_path.lower().startswith(self._CURRENT_CONTROL_SET):
+                    indexed_key_path = "".join(
+                        [
+                            self._CURRENT_CONTROL_SET_KEY_PATH,
+                            key_path[len(self._CURRENT_CONTROL_SET) :],
+                        ]
+                    )
+
+                if value_name is not None and value_name not in self._value_name_res:
+                    value_name_re = None
+                    has_wildcards = self._VARIABLE_RE.search(value_name) or (
+                        self._GLOB_CHARACTERS.intersection(value_name)
+                    )
+                    if has_wildcards:
+                        value_name_re = self._CompileGlob(value_name, True)
+                    self._value_name_res[value_name] = value_name_re
+
+                match = (artifact_definition, source, key_path, value_name)
+                self._AddPath(root_node, indexed_key_path, "\\", True, match)
+
+    def GetMatches(self, key_path, value_name=None):
+        """Retrieves the artifact definitions that cover a key or value.
+
+        Args:
+          key_path (str): key path relative to the root of the Windows Registry,
+              such as "HKEY_LOCAL_MACHINE\\System\\ControlSet001\\Services".
+          value_name (Optional[str]): value name, where None represents the key
+              and all its values.
+
+        Returns:
+          list[tuple[ArtifactDefinition, SourceType, str, str]]: artifact
+              definitions, sources, key paths and value names that match, where
+              the value name is None for the keys of Windows Registry key
+              sources, which cover all the values of the key.
+        """
+        root_node = self._root_nodes.get(("\\", True), None)
+        if not root_node:
+            return []
+
+        if value_name is not None:
+            value_name = value_name.lower()
+
+        matches = {}
+        for node in self._MatchSegments(root_node, self._GetLookupSegments(key_path)):
+            for match in node.matches:
+                artifact_definition, source, match_key_path, match_value_name = match
+                if value_name is not None and match_value_name is not None:
+                    value_name_re = self._value_name_res[match_value_name]
+                    if value_name_re:
+                        if not value_name_re.match(value_name):
+                            continue
+
+                    elif match_value_name.lower() != value_name:
+                        continue
+
+                lookup_key = (
+                    id(artifact_definition),
+                    id(source),
+                    match_key_path,
+                    match_value_name,
+                )
+                matches.setdefault(lookup_key, match)
+
+        return list(matches.values())
@@ -0,0 +1,203 @@
+"""The artifact definitions reloader."""
+
+import collections
+import os
+import threading
+
+
+class ArtifactDefinitionsReloader:
+    """Reloads changed artifact definitions files into a registry.
+
+    The reloader polls the modification time and size of the definitions files
+    in a directory and only reads the files that were added or changed since
+    the previous reload. The artifact definitions of changed and removed files
+    are replaced in the registry in a single step.
+
+    The reloader only tracks the artifact definitions it read itself, hence the
+    registry should not contain artifact definitions of the directory before
+    the first reload, otherwise registering them fails with a duplicate
+    artifact definition. The names of the artifact definitions that the reader
+    filtered out, for example by supported operating system, are tracked per
+    file as well, so that they are not reported as undefined by the registry.
+    A name is only removed from the filtered names of the registry when none
+    of the files filter it out anymore.
+    """
+
+    def __init__(self, artifact_registry, artifacts_reader, path, extension="yaml"):
+        """Initializes an artifact definitions reloader.
+
+        Args:
+          artifact_registry (ArtifactDefinitionsRegistry): artifact definitions
+              registry to reload the definitions into.
+          artifacts_reader (ArtifactsReader): an artifacts reader.
+          path (str): path of the directory with the definitions files.
+          extension (Optional[str]): extension of the filenames to read.
+        """
+        super().__init__()
+        self._artifact_registry = artifact_registry
+        self._artifacts_reader = artifacts_reader
+        self._definitions_per_file = {}
+        self._extension = extension
+        self._file_stats = {}
+        self._filtered_name_references = collections.Counter()
+        self._filtered_names_per_file = {}
+        self._lock = threading.Lock()
+        self._path = path
+
+    def _CompareFileStats(self, file_stats):
+        """Compares file stats with those of the last reload.
+
+        Args:
+          file_stats (dict[str, tuple[int, int, int]]): inode, modification time
+              in nanoseconds and size per name of definitions file.
+
+        Returns:
+          tuple[list[str], list[str]]: names of the added or changed files and
+              names of the removed files.
+        """
+        changed_files = [
+            filename
+            for filename, stat_values in file_stats.items()
+            if self._file_stats.get(filename, None) != stat_values
+        ]
+        removed_files = [
+            filename for filename in self._file_stats if filename not in file_stats
+        ]
+        return changed_files, removed_files
+
+    def _GetFileStats(self):
+        """Retrieves the stats of the definitions files in the directory.
+
+        Returns:
+          dict[str, tuple[int, int, int]]: inode, modification time in
+              nanoseconds and size per name of definitions file.
+        """
+        file_stats = {}
+        for filename in self._artifacts_reader.GetDirectoryFilenames(
+            self._path, extension=self._extension
+        ):
+            try:
+                stat_object = os.stat(filename)
+            except FileNotFoundError:
+                continue
+
+            file_stats[filename] = (
+                stat_object.st_ino,
+                stat_object.st_mtime_ns,
+                stat_object.st_size,
+            )
+
+        return file_stats
+
+    def _ReadFile(self, filename):
+        """Reads the artifact definitions from a definitions file.
+
+        Args:
+          filename (str): name of the definitions file.
+
+        Returns:
+          tuple[list[ArtifactDefinition], set[str]]: artifact definitions and
+              names of the artifact definitions that the reader filtered out.
+        """
+        # The reader accumulates the names of the filtered out artifact
+        # definitions of all the files it read, hence they are collected in
+        # a separate set while the file is read.
+        reader_filtered_names = self._artifacts_reader.filtered_artifact_names
+        self._artifacts_reader.filtered_artifact_names = set()
+        try:
+            artifact_definitions = list(self._artifacts_reader.ReadFile(filename))
+            filtered_names = self._artifacts_reader.filtered_artifact_names
+        finally:
+            reader_filtered_names.update(self._artifacts_reader.filtered_artifact_names)
+            self._artifacts_reader.filtered_artifact_names = reader_filtered_names
+
+        return artifact_definitions, filtered_names
+
+    def GetChangedFiles(self):
+        """Retrieves the definitions files that changed since the last reload.
+
+        Returns:
+          tuple[list[str], list[str]]: names of the added or changed files and
+              names of the removed files.
+        """
+        file_stats = self._GetFileStats()
+        return self._CompareFileStats(file_stats)
+
+    def Reload(self):
+        """Reloads the added, changed and removed definitions files.
+
+        All changed files are read before the registry is updated, hence if
+        reading fails the registry is left unchanged and the files are read
+        again on the next reload.
+
+        Returns:
+          list[str]: names of the added, changed or removed files.
+
+        Raises:
+          FormatError: if the format of an artifact definition is not set
+              or incorrect.
+          KeyError: if a duplicate artifact definition is encountered.
+        """
+        with self._lock:
+            file_stats = self._GetFileStats()
+            changed_files, removed_files = self._CompareFileStats(file_stats)
+
+            definitions_per_file = {}
+            filtered_names_per_file = {}
+            for filename in changed_files:
+                artifact_definitions, filtered_names = self._ReadFile(filename)
+                definitions_per_file[filename] = artifact_definitions
+                filtered_names_per_file[filename] = filtered_names
+
+            removed_definitions = []
+            filtered_name_references = collections.Counter(
+                self._filtered_name_references
+            )
+            for filename in changed_files + removed_files:
+                removed_definitions.extend(
+                    self._definitions_per_file.get(filename, None) or []
+                )
+                filtered_name_references.subtract(
+                    self._filtered_names_per_file.get(filename, None) or set()
+                )
+
+            added_definitions = []
+            for artifact_definitions in definitions_per_file.values():
+                added_definitions.extend(artifact_definitions)
+
+            for filtered_names in filtered_names_per_file.values():
+                filtered_name_references.update(filtered_names)
+
+            # A name can be filtered out in multiple files, hence it is only
+            # removed when no file filters it out anymore.
+            filtered_name_references = +filtered_name_references
+            removed_filtered_names = set(self._filtered_name_references).difference(
+                filtered_name_references
+            )
+            added_filtered_names = set(filtered_name_references).difference(
+                self._filtered_name_references
+            )
+
+            if (
+                removed_definitions
+                or added_definitions
+                or removed_filtered_names
+                or added_filtered_names
+            ):
+                self._artifact_registry.ReplaceDefinitions(
+                    removed_definitions,
+                    added_definitions,
+                    removed_filtered_names=removed_filtered_names,
+                    added_filtered_names=added_filtered_names,
+                )
+
+            for filename in removed_files:
+                del self._definitions_per_file[filename]
+                del self._filtered_names_per_file[filename]
+
+            self._definitions_per_file.update(definitions_per_file)
+            self._filtered_names_per_file.update(filtered_names_per_file)
+            self._filtered_name_references = filtered_name_references
+            self._file_stats = file_stats
+
+            return changed_files + removed_files
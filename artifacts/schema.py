@@ -0,0 +1,243 @@
+"""The source type schema and its compiled validators.
+
+A source type can declare the schema of its attributes, which is compiled
+into a single validation function per source type. The validation function
+creates the source type without calling its constructor if the attributes
+match the schema, and returns None otherwise. The caller then falls back to
+the constructor of the source type, which raises the detailed FormatError.
+"""
+
+
+class SchemaAttribute:
+    """Schema of a source type attribute or of a value in an attribute.
+
+    Attributes:
+      allow_empty (bool): True if a required value can be empty, where only
+          None represents a missing value.
+      attributes (tuple[SchemaAttribute]): schema of the key and value pairs
+          of a dictionary value, which must have exactly these keys.
+      default (object): default value of an optional attribute.
+      items (SchemaAttribute): schema of the items of a list value.
+      name (str): name of the attribute or key.
+      prefixes (tuple[str]): prefixes of which a string value must start with
+          one.
+      required (bool): True if the attribute is required.
+      value_type (type): exact type of the value, where values of a subclass
+          are left to the constructor of the source type.
+    """
+
+    __slots__ = (
+        "allow_empty",
+        "attributes",
+        "default",
+        "items",
+        "name",
+        "prefixes",
+        "required",
+        "value_type",
+    )
+
+    def __init__(
+        self,
+        name=None,
+        allow_empty=False,
+        attributes=None,
+        default=None,
+        items=None,
+        prefixes=None,
+        required=False,
+        value_type=None,
+    ):
+        """Initializes the schema of a source type attribute.
+
+        Args:
+          name (Optional[str]): name of the attribute or key.
+          allow_empty (Optional[bool]): True if a required value can be empty,
+              where only None represents a missing value.
+          attributes (Optional[tuple[SchemaAttribute]]): schema of the key and
+              value pairs of a dictionary value, which must have exactly these
+              keys.
+          default (Optional[object]): default value of an optional attribute.
+          items (Optional[SchemaAttribute]): schema of the items of a list value.
+          prefixes (Optional[tuple[str]]): prefixes of which a string value
+              must start with one.
+          required (Optional[bool]): True if the attribute is required.
+          value_type (Optional[type]): exact type of the value, where values
+              of a subclass are left to the constructor of the source type.
+        """
+        super().__init__()
+        self.allow_empty = allow_empty
+        self.attributes = attributes
+        self.default = default
+        self.items = items
+        self.name = name
+        self.prefixes = prefixes
+        self.required = required
+        self.value_type = value_type
+
+
+class ValidatorCompiler:
+    """Compiles the schema of a source type into a validation function."""
+
+    _FUNCTION_NAME = "ValidateAttributes"
+
+    def __init__(self):
+        """Initializes a validator compiler."""
+        super().__init__()
+        self._namespace = {}
+
+    def _AddConstant(self, value):
+        """Adds a constant to the namespace of the validation function.
+
+        Args:
+          value (object): value of the constant.
+
+        Returns:
+          str: name of the constant in the validation function.
+        """
+        name = f"_constant{len(self._namespace):d}"
+        self._namespace[name] = value
+        return name
+
+    def _GenerateValueChecks(self, schema_attribute, expression, indentation):
+        """Generates the checks of a value against the schema.
+
+        Args:
+          schema_attribute (SchemaAttribute): schema of the value.
+          expression (str): expression of the value in the validation function.
+          indentation (str): indentation of the generated lines.
+
+        Returns:
+          list[str]: lines of the validation function.
+        """
+        lines = []
+        if schema_attribute.value_type:
+            value_type = self._AddConstant(schema_attribute.value_type)
+            lines.extend(
+                [
+                    f"{indentation:s}if {expression:s}.__class__ is not "
+                    f"{value_type:s}:",
+                    f"{indentation:s}    return None",
+                ]
+            )
+
+        if schema_attribute.prefixes:
+            prefixes = self._AddConstant(tuple(schema_attribute.prefixes))
+            lines.extend(
+                [
+                    f"{indentation:s}if ({expression:s}.__class__ is not str or "
+                    f"not {expression:s}.startswith({prefixes:s})):",
+                    f"{indentation:s}    return None",
+                ]
+            )
+
+        if schema_attribute.attributes is not None:
+            keys = self._AddConstant(
+                frozenset(attribute.name for attribute in schema_attribute.attributes)
+            )
+            lines.extend(
+                [
+                    f"{indentation:s}if ({expression:s}.__class__ is not dict or "
+                    f"{{*{expression:s}}} != {keys:s}):",
+                    f"{indentation:s}    return None",
+                ]
+            )
+            for attribute in schema_attribute.attributes:
+                lines.extend(
+                    self._GenerateValueChecks(
+                        attribute, f"{expression:s}[{attribute.name!r}]", indentation
+                    )
+                )
+
+        if schema_attribute.items:
+            item_expression = f"item{len(indentation):d}"
+            item_lines = self._GenerateValueChecks(
+                schema_attribute.items, item_expression, f"{indentation:s}    "
+            )
+            if item_lines:
+                lines.append(
+                    f"{indentation:s}for {item_expression:s} in {expression:s}:"
+                )
+                lines.extend(item_lines)
+
+        return lines
+
+    def Compile(self, source_type_class):
+        """Compiles the schema of a source type into a validation function.
+
+        Only the schema defined by the source type class itself is used, since
+        a subclass can change the behavior of the constructor.
+
+        Args:
+          source_type_class (type): source type.
+
+        Returns:
+          function: validation function that takes the attributes of the source
+              type and returns the source type or None if the attributes do not
+              match the schema, or None if the source type has no schema.
+        """
+        schema = vars(source_type_class).get("SCHEMA", None)
+        if schema is None:
+            return None
+
+        self._namespace = {}
+        source_type_name = self._AddConstant(source_type_class)
+        attribute_names = self._AddConstant(
+            frozenset(schema_attribute.name for schema_attribute in schema)
+        )
+
+        indentation = "    "
+        lines = [
+            f"def {self._FUNCTION_NAME:s}(attributes):",
+            f"{indentation:s}if (attributes.__class__ is not dict or "
+            f"not {{*attributes}} <= {attribute_names:s}):",
+            f"{indentation:s}    return None",
+        ]
+        for index, schema_attribute in enumerate(schema):
+            value_expression = f"value{index:d}"
+            if schema_attribute.required:
+                default_value = "None"
+            else:
+                default_value = self._AddConstant(schema_attribute.default)
+
+            lines.append(
+                f"{indentation:s}{value_expression:s} = attributes["
+                f"{schema_attribute.name!r}] if {schema_attribute.name!r} in "
+                f"attributes else {default_value:s}"
+            )
+            if schema_attribute.required:
+                if schema_attribute.allow_empty:
+                    lines.append(f"{indentation:s}if {value_expression:s} is None:")
+                else:
+                    lines.append(f"{indentation:s}if not {value_expression:s}:")
+                lines.append(f"{indentation:s}    return None")
+
+            lines.extend(
+                self._GenerateValueChecks(
+                    schema_attribute, value_expression, indentation
+                )
+            )
+
+        lines.extend(
+            [
+                f"{indentation:s}source_object = {source_type_name:s}.__new__("
+                f"{source_type_name:s})",
+                f"{indentation:s}source_object.supported_os = []",
+            ]
+        )
+        for index, schema_attribute in enumerate(schema):
+            lines.append(
+                f"{indentation:s}source_object.{schema_attribute.name:s} = "
+                f"value{index:d}"
+            )
+
+        lines.append(f"{indentation:s}return source_object")
+
+        # The filename identifies the validator in tracebacks and profiles.
+        filename = f"<validator {source_type_class.__name__:s}>"
+        code = compile("\n".join(lines), filename, "exec")
+
+        namespace = dict(self._namespace)
+        # pylint: disable=exec-used
+        exec(code, namespace)  # nosec
+        return namespace[self._FUNCTION_NAME]
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Console script to build a snapshot of the bundled definitions."""
+
+import argparse
+import sys
+
+from artifacts import errors
+from artifacts import reader
+from artifacts import registry
+from artifacts import snapshot
+
+
+def BuildSnapshot(data_path, output_path):
+    """Builds a snapshot of the artifact definitions in a directory.
+
+    Args:
+      data_path (str): path of the directory that contains the artifact
+          definitions.
+      output_path (str): path of the snapshot file.
+
+    Raises:
+      Error: if the snapshot does not match the definitions files after it
+          was written.
+      FormatError: if the format of an artifact definition is not set
+          or incorrect.
+      OSError: if the snapshot cannot be written.
+    """
+    # The snapshot must be read with the same reader configuration as used by
+    # registry.LoadBundledDefinitions() when the snapshot cannot be used.
+    artifacts_reader = reader.YamlArtifactsReader(compact=True)
+    definitions_snapshot = snapshot.ArtifactDefinitionsSnapshot(output_path)
+    definitions_snapshot.Write(artifacts_reader, data_path)
+
+    # A snapshot that is not used is not an error at load time, hence it is
+    # checked here that the snapshot matches the definitions files.
+    if definitions_snapshot.Read(data_path) is None:
+        raise errors.Error(
+            f"Snapshot: {output_path:s} does not match the definitions files in: "
+            f"{data_path:s}."
+        )
+
+
+def Main():
+    """Entry point of console script to build a snapshot of the definitions.
+
+    Returns:
+      int: exit code that is provided to sys.exit().
+    """
+    args_parser = argparse.ArgumentParser(
+        description="Builds a snapshot of the bundled artifact definitions."
+    )
+    args_parser.add_argument(
+        "--data",
+        dest="data",
+        action="store",
+        metavar="PATH",
+        default=registry.BUNDLED_DATA_PATH,
+        help="path of the directory that contains the artifact definitions.",
+    )
+    args_parser.add_argument(
+        "--output",
+        dest="output",
+        action="store",
+        metavar="PATH",
+        default=registry.BUNDLED_SNAPSHOT_PATH,
+        help="path of the snapshot file.",
+    )
+    options = args_parser.parse_args()
+
+    try:
+        BuildSnapshot(options.data, options.output)
+    except (errors.Error, OSError) as exception:
+        print(f"Unable to build snapshot with error: {exception!s}")
+        return 1
+
+    print(f"Snapshot written to: {options.output:s}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(Main())
@@ -0,0 +1,183 @@
+"""The artifact definitions snapshot."""
+
+import glob
+import hashlib
+import os
+import pickle
+import tempfile
+
+import artifacts
+
+from artifacts import registry
+
+
+class ArtifactDefinitionsSnapshot:
+    """Pre-validated snapshot of the artifact definitions of a directory.
+
+    The snapshot stores the artifact definitions read from the definitions
+    files in a directory together with the SHA-256 digest of every file. The
+    snapshot is only used if the definitions files still match these digests,
+    which allows the definitions to be loaded without parsing and validation.
+
+    The snapshot consists of a header followed by the artifact definitions, so
+    that a snapshot written for a different layout of the definition classes is
+    rejected before the definitions are unpickled.
+    """
+
+    _FORMAT_VERSION = 2
+
+    def __init__(self, path):
+        """Initializes an artifact definitions snapshot.
+
+        Args:
+          path (str): path of the snapshot file.
+        """
+        super().__init__()
+        self._path = path
+
+    def _GetFileDigests(self, path, extension):
+        """Retrieves the digests of the definitions files in a directory.
+
+        Args:
+          path (str): path of the directory with the definitions files.
+          extension (str): extension of the filenames, where None represents
+              all files.
+
+        Returns:
+          dict[str, str]: SHA-256 digest per name of definitions file, without
+              the path of the directory.
+        """
+        if extension:
+            glob_spec = os.path.join(path, f"*.{extension:s}")
+        else:
+            glob_spec = os.path.join(path, "*")
+
+        file_digests = {}
+        for filename in sorted(glob.glob(glob_spec)):
+            with open(filename, "rb") as file_object:
+                file_digest = hashlib.sha256(file_object.read()).hexdigest()
+
+            file_digests[os.path.basename(filename)] = file_digest
+
+        return file_digests
+
+    def _IsCompatible(self, header, path, extension, verify):
+        """Determines if a snapshot header matches the modules and definitions.
+
+        Args:
+          header (dict[str, object]): snapshot header.
+          path (str): path of the directory with the definitions files the
+              snapshot was built from.
+          extension (str): extension of the filenames.
+          verify (bool): True if the snapshot should only be used if it
+              matches the definitions files in the directory.
+
+        Returns:
+          bool: True if the snapshot can be used.
+        """
+        if not isinstance(header, dict):
+            return False
+
+        if header.get("format_version") != self._FORMAT_VERSION:
+            return False
+
+        if header.get("artifacts_version") != artifacts.__version__:
+            return False
+
+        schema_identifier = registry.ArtifactDefinitionsRegistry.GetSchemaIdentifier()
+        if header.get("schema_identifier") != schema_identifier:
+            return False
+
+        if verify:
+            file_digests = self._GetFileDigests(path, extension)
+            if header.get("file_digests") != file_digests:
+                return False
+
+        return True
+
+    def Read(self, path, extension="yaml", verify=True):
+        """Reads the artifact definitions from the snapshot.
+
+        Args:
+          path (str): path of the directory with the definitions files the
+              snapshot was built from.
+          extension (Optional[str]): extension of the filenames.
+          verify (Optional[bool]): True if the snapshot should only be used if
+              it matches the definitions files in the directory.
+
+        Returns:
+          list[ArtifactDefinition]: artifact definitions or None if the snapshot
+              is not available, unreadable or does not match the definitions
+              files or the layout of the definition classes.
+        """
+        # Unpickling a snapshot that is corrupted or that was written by
+        # a different version of the modules can raise any exception.
+        try:
+            with open(self._path, "rb") as file_object:
+                header = pickle.load(file_object)
+                if not self._IsCompatible(header, path, extension, verify):
+                    return None
+
+                artifact_definitions = pickle.load(file_object)
+        except Exception:  # pylint: disable=broad-exception-caught
+            return None
+
+        if not isinstance(artifact_definitions, list):
+            return None
+
+        return artifact_definitions
+
+    def Write(self, artifacts_reader, path, extension="yaml"):
+        """Writes a snapshot of the artifact definitions in a directory.
+
+        The snapshot is written to a temporary file that replaces the previous
+        snapshot, so that concurrent readers never see a partially written
+        snapshot.
+
+        Args:
+          artifacts_reader (ArtifactsReader): an artifacts reader.
+          path (str): path of the directory with the definitions files.
+          extension (Optional[str]): extension of the filenames to read.
+
+        Raises:
+          FormatError: if the format of an artifact definition is not set
+              or incorrect.
+        """
+        # The digests are determined before reading the definitions files so
+        # that a change while writing causes the snapshot to be rejected.
+        file_digests = self._GetFileDigests(path, extension)
+
+        artifact_definitions = list(
+            artifacts_reader.ReadDirectory(path, extension=extension)
+        )
+
+        header = {
+            "artifacts_version": artifacts.__version__,
+            "file_digests": file_digests,
+            "format_version": self._FORMAT_VERSION,
+            "schema_identifier": (
+                registry.ArtifactDefinitionsRegistry.GetSchemaIdentifier()
+            ),
+        }
+
+        snapshot_path = os.path.dirname(os.path.abspath(self._path))
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            dir=snapshot_path, suffix=".tmp"
+        )
+        try:
+            with os.fdopen(file_descriptor, "wb") as file_object:
+                pickle.dump(header, file_object, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(
+                    artifact_definitions,
+                    file_object,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+
+            # The snapshot is installed with the package, hence it should not
+            # keep the owner only permissions of the temporary file.
+            os.chmod(temporary_path, 0o644)
+            os.replace(temporary_path, self._path)
+
+        finally:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
@@ -22,13 +22,108 @@ import abc
 
 from artifacts import definitions
 from artifacts import errors
+from artifacts import schema
+
+
+class KeyValuePair:
+    """Windows Registry key path and value name pair.
+
+    The pair supports item access with "key" and "value", like the dictionary
+    it replaces in a compacted Windows Registry value source type.
+
+    Attributes:
+      key (str): key path relative to the root of the Windows Registry.
+      value (str): value name.
+    """
+
+    __slots__ = ("key", "value")
+
+    def __init__(self, key, value):
+        """Initializes a key path and value name pair.
+
+        Args:
+          key (str): key path relative to the root of the Windows Registry.
+          value (str): value name.
+        """
+        super().__init__()
+        self.key = key
+        self.value = value
+
+    def __eq__(self, other):
+        """Determines if the pair is equal to another pair.
+
+        Args:
+          other (KeyValuePair|dict[str, str]): other pair.
+
+        Returns:
+          bool: True if the pairs are equal.
+        """
+        if isinstance(other, KeyValuePair):
+            return self.key == other.key and self.value == other.value
+
+        if isinstance(other, dict):
+            return other == self.AsDict()
+
+        return NotImplemented
+
+    def __getitem__(self, name):
+        """Retrieves the key path or value name.
+
+        Args:
+          name (str): "key" or "value".
+
+        Returns:
+          str: key path or value name.
+
+        Raises:
+          KeyError: if name is not "key" or "value".
+        """
+        if name == "key":
+            return self.key
+
+        if name == "value":
+            return self.value
+
+        raise KeyError(name)
+
+    def __hash__(self):
+        """Retrieves a hash of the pair.
+
+        Returns:
+          int: hash of the pair.
+        """
+        return hash((self.key, self.value))
+
+    def AsDict(self):
+        """Represents the pair as a dictionary.
+
+        Returns:
+          dict[str, str]: key path and value name.
+        """
+        return {"key": self.key, "value": self.value}
 
 
 class SourceType:
-    """Artifact definition source type interface."""
+    """Artifact definition source type interface.
+
+    Attributes:
+      supported_os (list[str]): supported operating systems.
+    """
+
+    # The attributes are stored in slots to reduce memory usage, while __dict__
+    # keeps supporting additional attributes set by source types that do not
+    # define slots.
+    __slots__ = ("__dict__", "supported_os")
+
+    # Schema of the source type attributes, which is used to create the source
+    # type with a compiled validator instead of the constructor. A source type
+    # without schema is always created with its constructor.
+    SCHEMA = None
 
     TYPE_INDICATOR = None
 
+    _default_attributes_per_class = {}
+
     def __init__(self):
         """Initializes an artifact definition source type.
 
@@ -40,11 +135,38 @@ class SourceType:
         if not self.TYPE_INDICATOR:
             raise errors.FormatError("Missing type indicator.")
 
+        self.supported_os = []
+
     @property
     def type_indicator(self):
         """str: type indicator."""
         return self.TYPE_INDICATOR
 
+    @classmethod
+    def _GetDefaultAttributes(cls):
+        """Retrieves the default attributes of the source type.
+
+        The default attributes are the attributes of the schema declared by the
+        source type itself with their default values.
+
+        Returns:
+          dict[str, object]: default source type attributes or None if the source
+              type does not declare a schema.
+        """
+        default_attributes = cls._default_attributes_per_class.get(cls, None)
+        if default_attributes is None:
+            source_type_schema = vars(cls).get("SCHEMA", None)
+            if source_type_schema is None:
+                return None
+
+            default_attributes = {
+                schema_attribute.name: schema_attribute.default
+                for schema_attribute in source_type_schema
+            }
+            cls._default_attributes_per_class[cls] = default_attributes
+
+        return default_attributes
+
     @abc.abstractmethod
     def AsDict(self):
         """Represents a source type as a dictionary.
@@ -53,10 +175,55 @@ class SourceType:
           dict[str, str]: source type attributes.
         """
 
+    @classmethod
+    def CreateWithoutValidation(cls, attributes):
+        """Creates a source type without validating its attributes.
+
+        This bypasses __init__ and is only intended for attributes that are
+        known to be valid, for example those of previously validated artifact
+        definitions. The attributes and their defaults are those of the schema
+        declared by the source type itself. A source type that does not declare
+        a schema, such as a subclass of a built-in source type, is created with
+        its constructor instead.
+
+        Args:
+          attributes (dict[str, object]): source attributes.
+
+        Returns:
+          SourceType: a source type.
+
+        Raises:
+          FormatError: if a source type without schema is created with its
+              constructor and required attributes are missing.
+        """
+        default_attributes = cls._GetDefaultAttributes()
+        if default_attributes is None:
+            return cls(**attributes)
+
+        source_object = cls.__new__(cls)
+        source_object.supported_os = []
+
+        for name, value in default_attributes.items():
+            setattr(source_object, name, attributes.get(name, value))
+
+        return source_object
+
+    def Compact(self):
+        """Converts the source type into a compact representation.
+
+        The lists of the source type are replaced by tuples, which use less
+        memory.
+        """
+        self.supported_os = tuple(self.supported_os)
+
 
 class ArtifactGroupSourceType(SourceType):
     """Artifact group source type."""
 
+    __slots__ = ("names",)
+
+    SCHEMA = (schema.SchemaAttribute("names", required=True),)
+
     TYPE_INDICATOR = definitions.TYPE_INDICATOR_ARTIFACT_GROUP
 
     def __init__(self, names=None):
@@ -80,12 +247,28 @@ class ArtifactGroupSourceType(SourceType):
         Returns:
           dict[str, str]: source type attributes.
         """
-        return {"names": self.names}
+        return {"names": list(self.names)}
+
+    def Compact(self):
+        """Converts the source type into a compact representation.
+
+        The lists of the source type are replaced by tuples, which use less
+        memory.
+        """
+        super().Compact()
+        self.names = tuple(self.names)
 
 
 class CommandSourceType(SourceType):
     """Command source type."""
 
+    __slots__ = ("args", "cmd")
+
+    SCHEMA = (
+        schema.SchemaAttribute("args", allow_empty=True, required=True),
+        schema.SchemaAttribute("cmd", allow_empty=True, required=True),
+    )
+
     TYPE_INDICATOR = definitions.TYPE_INDICATOR_COMMAND
 
     def __init__(self, args=None, cmd=None):
@@ -111,12 +294,28 @@ class CommandSourceType(SourceType):
         Returns:
           dict[str, str]: source type attributes.
         """
-        return {"cmd": self.cmd, "args": self.args}
+        return {"cmd": self.cmd, "args": list(self.args)}
+
+    def Compact(self):
+        """Converts the source type into a compact representation.
+
+        The lists of the source type are replaced by tuples, which use less
+        memory.
+        """
+        super().Compact()
+        self.args = tuple(self.args)
 
 
 class DirectorySourceType(SourceType):
     """Directory source type."""
 
+    __slots__ = ("paths", "separator")
+
+    SCHEMA = (
+        schema.SchemaAttribute("paths", required=True, value_type=list),
+        schema.SchemaAttribute("separator", default="/"),
+    )
+
     TYPE_INDICATOR = definitions.TYPE_INDICATOR_DIRECTORY
 
     def __init__(self, paths=None, separator="/"):
@@ -145,16 +344,32 @@ class DirectorySourceType(SourceType):
         Returns:
           dict[str, str]: source type attributes.
         """
-        source_type_attributes = {"paths": self.paths}
+        source_type_attributes = {"paths": list(self.paths)}
         if self.separator != "/":
             source_type_attributes["separator"] = self.separator
 
         return source_type_attributes
 
+    def Compact(self):
+        """Converts the source type into a compact representation.
+
+        The lists of the source type are replaced by tuples, which use less
+        memory.
+        """
+        super().Compact()
+        self.paths = tuple(self.paths)
+
 
 class FileSourceType(SourceType):
     """File source type."""
 
+    __slots__ = ("paths", "separator")
+
+    SCHEMA = (
+        schema.SchemaAttribute("paths", required=True, value_type=list),
+        schema.SchemaAttribute("separator", default="/"),
+    )
+
     TYPE_INDICATOR = definitions.TYPE_INDICATOR_FILE
 
     def __init__(self, paths=None, separator="/"):
@@ -183,16 +398,32 @@ class FileSourceType(SourceType):
         Returns:
           dict[str, str]: source type attributes.
         """
-        source_type_attributes = {"paths": self.paths}
+        source_type_attributes = {"paths": list(self.paths)}
         if self.separator != "/":
             source_type_attributes["separator"] = self.separator
 
         return source_type_attributes
 
+    def Compact(self):
+        """Converts the source type into a compact representation.
+
+        The lists of the source type are replaced by tuples, which use less
+        memory.
+        """
+        super().Compact()
+        self.paths = tuple(self.paths)
+
 
 class PathSourceType(SourceType):
     """Path source type."""
 
+    __slots__ = ("paths", "separator")
+
+    SCHEMA = (
+        schema.SchemaAttribute("paths", required=True, value_type=list),
+        schema.SchemaAttribute("separator", default="/"),
+    )
+
     TYPE_INDICATOR = definitions.TYPE_INDICATOR_PATH
 
     def __init__(self, paths=None, separator="/"):
@@ -221,16 +452,27 @@ class PathSourceType(SourceType):
         Returns:
           dict[str, str]: source type attributes.
         """
-        source_type_attributes = {"paths": self.paths}
+        source_type_attributes = {"paths": list(self.paths)}
         if self.separator != "/":
             source_type_attributes["separator"] = self.separator
 
         return source_type_attributes
 
+    def Compact(self):
+        """Converts the source type into a compact representation.
+
+        The lists of the source type are replaced by tuples, which use less
+        memory.
+        """
+        super().Compact()
+        self.paths = tuple(self.paths)
+
 
 class WindowsRegistryKeySourceType(SourceType):
     """Windows Registry key source type."""
 
+    __slots__ = ("keys",)
+
     TYPE_INDICATOR = definitions.TYPE_INDICATOR_WINDOWS_REGISTRY_KEY
 
     VALID_PREFIXES = [
@@ -240,6 +482,15 @@ class WindowsRegistryKeySourceType(SourceType):
         r"%%current_control_set%%",
     ]
 
+    SCHEMA = (
+        schema.SchemaAttribute(
+            "keys",
+            items=schema.SchemaAttribute(prefixes=VALID_PREFIXES),
+            required=True,
+            value_type=list,
+        ),
+    )
+
     def __init__(self, keys=None):
         """Initializes a source type.
 
@@ -268,7 +519,16 @@ class WindowsRegistryKeySourceType(SourceType):
         Returns:
           dict[str, str]: source type attributes.
         """
-        return {"keys": self.keys}
+        return {"keys": list(self.keys)}
+
+    def Compact(self):
+        """Converts the source type into a compact representation.
+
+        The lists of the source type are replaced by tuples, which use less
+        memory.
+        """
+        super().Compact()
+        self.keys = tuple(self.keys)
 
     @classmethod
     def ValidateKey(cls, key_path):
@@ -297,6 +557,24 @@ class WindowsRegistryKeySourceType(SourceType):
 class WindowsRegistryValueSourceType(SourceType):
     """Windows Registry value source type."""
 
+    __slots__ = ("key_value_pairs",)
+
+    SCHEMA = (
+        schema.SchemaAttribute(
+            "key_value_pairs",
+            items=schema.SchemaAttribute(
+                attributes=(
+                    schema.SchemaAttribute(
+                        "key", prefixes=WindowsRegistryKeySourceType.VALID_PREFIXES
+                    ),
+                    schema.SchemaAttribute("value"),
+                )
+            ),
+            required=True,
+            value_type=list,
+        ),
+    )
+
     TYPE_INDICATOR = definitions.TYPE_INDICATOR_WINDOWS_REGISTRY_VALUE
 
     def __init__(self, key_value_pairs=None):
@@ -340,7 +618,23 @@ class WindowsRegistryValueSourceType(SourceType):
         Returns:
           dict[str, str]: source type attributes.
         """
-        return {"key_value_pairs": self.key_value_pairs}
+        return {
+            "key_value_pairs": [
+                {"key": pair["key"], "value": pair["value"]}
+                for pair in self.key_value_pairs
+            ]
+        }
+
+    def Compact(self):
+        """Converts the source type into a compact representation.
+
+        The list of key path and value name dictionaries is replaced by a tuple
+        of key path and value name pairs, which use less memory.
+        """
+        super().Compact()
+        self.key_value_pairs = tuple(
+            KeyValuePair(pair["key"], pair["value"]) for pair in self.key_value_pairs
+        )
 
 
 class WMIQuerySourceType(SourceType):
@@ -351,6 +645,13 @@ class WMIQuerySourceType(SourceType):
       query (str): WMI query.
     """
 
+    __slots__ = ("base_object", "query")
+
+    SCHEMA = (
+        schema.SchemaAttribute("base_object"),
+        schema.SchemaAttribute("query", required=True),
+    )
+
     TYPE_INDICATOR = definitions.TYPE_INDICATOR_WMI_QUERY
 
     def __init__(self, base_object=None, query=None):
@@ -2,7 +2,7 @@
 
 import abc
 import json
-import yaml
+import os
 
 
 class BaseArtifactsWriter:
@@ -72,6 +72,94 @@ class JsonArtifactsWriter(ArtifactWriter):
         return json_data
 
 
+class JsonLinesArtifactsWriter(ArtifactWriter):
+    """JSON Lines artifacts writer.
+
+    The JSON Lines format stores one JSON encoded artifact definition per line.
+    """
+
+    def _FormatArtifactLines(self, artifacts):
+        """Formats artifacts as JSON Lines.
+
+        Args:
+          artifacts (iterable[ArtifactDefinition]): artifact definitions.
+
+        Yields:
+          str: JSON line of an artifact definition, including end-of-line.
+        """
+        for artifact in artifacts:
+            json_data = json.dumps(artifact.AsDict())
+            yield f"{json_data:s}\n"
+
+    def _IsMissingEndOfLine(self, filename):
+        """Determines if a non-empty file does not end with an end-of-line.
+
+        Args:
+          filename (str): name of the file.
+
+        Returns:
+          bool: True if the file is not empty and does not end with an
+              end-of-line.
+        """
+        try:
+            with open(filename, "rb") as file_object:
+                file_object.seek(0, os.SEEK_END)
+                if file_object.tell() == 0:
+                    return False
+
+                file_object.seek(-1, os.SEEK_END)
+                return file_object.read(1) != b"\n"
+
+        except FileNotFoundError:
+            return False
+
+    def FormatArtifacts(self, artifacts):
+        """Formats artifacts to desired output format.
+
+        Args:
+          artifacts (list[ArtifactDefinition]): artifact definitions.
+
+        Returns:
+          str: formatted string of artifact definition.
+        """
+        return "".join(self._FormatArtifactLines(artifacts))
+
+    def WriteArtifactsFile(self, artifacts, filename, append=False):
+        """Writes artifact definitions to a file.
+
+        The artifact definitions are written one line at a time, without
+        formatting all of them first.
+
+        Args:
+          artifacts (iterable[ArtifactDefinition]): artifact definitions to be
+              written.
+          filename (str): name of the file to write artifacts to.
+          append (Optional[bool]): True if the artifact definitions should be
+              appended to an existing file.
+        """
+        missing_end_of_line = append and self._IsMissingEndOfLine(filename)
+
+        mode = "a" if append else "w"
+        with open(filename, mode, encoding="utf-8") as file_object:
+            # Terminate the last line of the existing file, otherwise the first
+            # appended artifact definition is joined with it.
+            if missing_end_of_line:
+                file_object.write("\n")
+
+            self.WriteArtifactsFileObject(artifacts, file_object)
+
+    def WriteArtifactsFileObject(self, artifacts, file_object):
+        """Writes artifact definitions to a file-like object.
+
+        Args:
+          artifacts (iterable[ArtifactDefinition]): artifact definitions to be
+              written.
+          file_object (file): text file-like object to write artifacts to.
+        """
+        for line in self._FormatArtifactLines(artifacts):
+            file_object.write(line)
+
+
 class YamlArtifactsWriter(ArtifactWriter):
     """YAML artifacts writer interface."""
 
@@ -84,6 +172,8 @@ class YamlArtifactsWriter(ArtifactWriter):
         Returns:
           str: formatted string of artifact definition.
         """
+        import yaml  # pylint: disable=import-outside-toplevel
+
         # TODO: improve output formatting of yaml
         artifact_definitions = [artifact.AsDict() for artifact in artifacts]
         yaml_data = yaml.safe_dump_all(artifact_definitions)
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""Installation and deployment script."""
+
+import os
+import sys
+
+from setuptools import setup
+from setuptools.command.build_py import build_py
+
+
+class BuildPyCommand(build_py):
+    """Build command that generates the snapshot of the bundled definitions.
+
+    The snapshot is generated from the definitions files that are copied into
+    the build directory, so that every built package contains a snapshot that
+    matches its definitions files. A snapshot that cannot be generated fails
+    the build instead of silently falling back to reading the definitions files.
+    """
+
+    def run(self):
+        """Builds the Python modules and the snapshot."""
+        super().run()
+
+        if self.dry_run:
+            return
+
+        # The package is imported from the source directory, since it is not
+        # installed at build time.
+        sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+        # pylint: disable=import-outside-toplevel
+        from artifacts.scripts import build_snapshot
+
+        package_path = os.path.join(self.build_lib, "artifacts")
+        build_snapshot.BuildSnapshot(
+            os.path.join(package_path, "data"),
+            os.path.join(package_path, "data.pickle"),
+        )
+
+
+setup(cmdclass={"build_py": BuildPyCommand})
@@ -0,0 +1,269 @@
+"""Tests for the binary artifact definitions format."""
+
+import multiprocessing
+import os
+import unittest
+
+from artifacts import artifact
+from artifacts import binary
+from artifacts import errors
+from artifacts import reader
+from artifacts import registry
+from artifacts import source_type
+
+from tests import test_lib
+
+
+def _GetDefinitionFromSharedMemory(shared_memory_name, name):
+    """Retrieves an artifact definition from shared memory in a worker process.
+
+    Args:
+      shared_memory_name (str): name of the shared memory block.
+      name (str): name of the artifact definition.
+
+    Returns:
+      tuple[int, dict[str, object]]: number of artifact definitions and
+          attributes of the artifact definition.
+    """
+    binary_definitions = binary.BinaryArtifactDefinitionsSharedMemory()
+    binary_definitions.Open(shared_memory_name)
+    try:
+        artifact_definition = binary_definitions.GetDefinitionByName(name)
+        return (
+            binary_definitions.GetNumberOfDefinitions(),
+            artifact_definition.AsDict(),
+        )
+
+    finally:
+        binary_definitions.Close()
+
+
+class _InvalidBinaryArtifactDefinitionsSharedMemory(
+    binary.BinaryArtifactDefinitionsSharedMemory
+):
+    """Binary artifact definitions in shared memory that fail to set."""
+
+    def _SetBuffer(self, buffer):
+        """Sets the buffer with the binary formatted data.
+
+        Args:
+          buffer (object): object that supports the buffer protocol.
+
+        Raises:
+          FormatError: always.
+        """
+        raise errors.FormatError("Unsupported binary format signature.")
+
+
+class BinaryArtifactsWriterTest(test_lib.BaseTestCase):
+    """Tests for the binary artifacts writer."""
+
+    def testFormatArtifacts(self):
+        """Tests the FormatArtifacts function."""
+        test_file = self._GetTestFilePath(["definitions.yaml"])
+        self._SkipIfPathNotExists(test_file)
+
+        artifact_reader = reader.YamlArtifactsReader()
+        artifact_definitions = list(artifact_reader.ReadFile(test_file))
+
+        artifact_writer = binary.BinaryArtifactsWriter()
+        binary_data = artifact_writer.FormatArtifacts(artifact_definitions)
+
+        self.assertEqual(binary_data[:8], binary.BinaryFormatDefinitions.SIGNATURE)
+
+        # Formatting again should produce the same data.
+        self.assertEqual(
+            artifact_writer.FormatArtifacts(artifact_definitions), binary_data
+        )
+
+
+class BinaryArtifactDefinitionsFileTest(test_lib.BaseTestCase):
+    """Tests for the binary artifact definitions file."""
+
+    # pylint: disable=protected-access
+
+    def testOpenClose(self):
+        """Tests the Open and Close functions."""
+        artifact_reader = reader.YamlArtifactsReader()
+        artifact_definitions = list(artifact_reader.ReadDirectory(self._DATA_PATH))
+
+        with test_lib.TempDirectory() as temporary_directory:
+            binary_file = os.path.join(temporary_directory, "definitions.bin")
+
+            artifact_writer = binary.BinaryArtifactsWriter()
+            artifact_writer.WriteArtifactsFile(artifact_definitions, binary_file)
+
+            binary_definitions = binary.BinaryArtifactDefinitionsFile()
+            binary_definitions.Open(binary_file)
+
+            try:
+                self.assertEqual(
+                    binary_definitions.GetNumberOfDefinitions(),
+                    len(artifact_definitions),
+                )
+                self.assertEqual(len(binary_definitions._artifact_definitions), 0)
+
+                artifact_definition = binary_definitions.GetDefinitionByName(
+                    "TriagePersistence"
+                )
+                self.assertIsNotNone(artifact_definition)
+                self.assertEqual(artifact_definition.name, "TriagePersistence")
+                self.assertEqual(len(binary_definitions._artifact_definitions), 1)
+
+                artifact_definition = binary_definitions.GetDefinitionByAlias(
+                    "windowsmsofficeautosave"
+                )
+                self.assertIsNotNone(artifact_definition)
+                self.assertEqual(artifact_definition.name, "MicrosoftOfficeAutosave")
+
+                self.assertIsNone(binary_definitions.GetDefinitionByName("Bogus"))
+                self.assertIsNone(binary_definitions.GetDefinitionByAlias("Bogus"))
+
+                self.assertEqual(
+                    [
+                        artifact_definition.AsDict()
+                        for artifact_definition in binary_definitions.GetDefinitions()
+                    ],
+                    [
+                        artifact_definition.AsDict()
+                        for artifact_definition in artifact_definitions
+                    ],
+                )
+
+                self.assertEqual(binary_definitions.GetUndefinedArtifacts(), set())
+
+            finally:
+                binary_definitions.Close()
+
+    def testOpenWithoutValidation(self):
+        """Tests that the sources are read without validation."""
+        artifact_definition = artifact.ArtifactDefinition(
+            "Test", description="Test definition."
+        )
+        # The key path of this source does not pass validation.
+        source_object = (
+            source_type.WindowsRegistryKeySourceType.CreateWithoutValidation(
+                {"keys": ["HKEY_CURRENT_USER\\test"]}
+            )
+        )
+        source_object.supported_os = ["Windows"]
+        artifact_definition.sources.append(source_object)
+
+        with test_lib.TempDirectory() as temporary_directory:
+            binary_file = os.path.join(temporary_directory, "definitions.bin")
+
+            artifact_writer = binary.BinaryArtifactsWriter()
+            artifact_writer.WriteArtifactsFile([artifact_definition], binary_file)
+
+            binary_definitions = binary.BinaryArtifactDefinitionsFile()
+            binary_definitions.Open(binary_file)
+
+            try:
+                binary_definition = binary_definitions.GetDefinitionByName("Test")
+                self.assertIsNotNone(binary_definition)
+                self.assertEqual(
+                    binary_definition.AsDict(), artifact_definition.AsDict()
+                )
+
+            finally:
+                binary_definitions.Close()
+
+    def testOpenWithInvalidData(self):
+        """Tests the Open function with invalid data."""
+        with test_lib.TempDirectory() as temporary_directory:
+            binary_file = os.path.join(temporary_directory, "definitions.bin")
+            with open(binary_file, "wb") as file_object:
+                file_object.write(b"BOGUS" * 32)
+
+            binary_definitions = binary.BinaryArtifactDefinitionsFile()
+            with self.assertRaises(errors.FormatError):
+                binary_definitions.Open(binary_file)
+
+
+class BinaryArtifactDefinitionsSharedMemoryTest(test_lib.BaseTestCase):
+    """Tests for the binary artifact definitions in shared memory."""
+
+    def testCreateOpenClose(self):
+        """Tests the Create, Open and Close functions."""
+        artifact_registry = registry.ArtifactDefinitionsRegistry()
+        artifact_registry.ReadFromDirectory(
+            reader.YamlArtifactsReader(), self._DATA_PATH
+        )
+        artifact_definitions = list(artifact_registry.GetDefinitions())
+
+        published_definitions = binary.BinaryArtifactDefinitionsSharedMemory()
+        shared_memory_name = published_definitions.Create(
+            artifact_registry.GetDefinitions()
+        )
+        try:
+            self.assertIsNotNone(shared_memory_name)
+            self.assertEqual(published_definitions.name, shared_memory_name)
+
+            binary_definitions = binary.BinaryArtifactDefinitionsSharedMemory()
+            binary_definitions.Open(shared_memory_name)
+            try:
+                self.assertEqual(
+                    [
+                        artifact_definition.AsDict()
+                        for artifact_definition in binary_definitions.GetDefinitions()
+                    ],
+                    [
+                        artifact_definition.AsDict()
+                        for artifact_definition in artifact_definitions
+                    ],
+                )
+
+                artifact_definition = binary_definitions.GetDefinitionByAlias(
+                    "windowsmsofficeautosave"
+                )
+                self.assertIsNotNone(artifact_definition)
+                self.assertEqual(artifact_definition.name, "MicrosoftOfficeAutosave")
+
+            finally:
+                binary_definitions.Close()
+
+            with multiprocessing.Pool(1) as pool:
+                number_of_definitions, artifact_definition_values = pool.apply(
+                    _GetDefinitionFromSharedMemory,
+                    (shared_memory_name, "TriagePersistence"),
+                )
+
+            self.assertEqual(number_of_definitions, len(artifact_definitions))
+            self.assertEqual(
+                artifact_definition_values,
+                artifact_registry.GetDefinitionByName("TriagePersistence").AsDict(),
+            )
+
+        finally:
+            published_definitions.Close()
+            published_definitions.Unlink()
+
+        binary_definitions = binary.BinaryArtifactDefinitionsSharedMemory()
+        with self.assertRaises(FileNotFoundError):
+            binary_definitions.Open(shared_memory_name)
+
+    def testCreateWithInvalidData(self):
+        """Tests the Create function with data that cannot be set."""
+        artifact_registry = registry.ArtifactDefinitionsRegistry()
+        artifact_registry.ReadFromDirectory(
+            reader.YamlArtifactsReader(), self._DATA_PATH
+        )
+
+        published_definitions = _InvalidBinaryArtifactDefinitionsSharedMemory()
+        shared_memory_name = f"artifacts_test_{os.getpid():d}"
+
+        with self.assertRaises(errors.FormatError):
+            published_definitions.Create(
+                artifact_registry.GetDefinitions(), name=shared_memory_name
+            )
+
+        self.assertIsNone(published_definitions.name)
+
+        # The shared memory block is unlinked when Create fails.
+        binary_definitions = binary.BinaryArtifactDefinitionsSharedMemory()
+        with self.assertRaises(FileNotFoundError):
+            binary_definitions.Open(shared_memory_name)
+
+
+if __name__ == "__main__":
+    unittest.main()
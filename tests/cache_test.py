@@ -0,0 +1,218 @@
+"""Tests for the artifact definitions cache."""
+
+import os
+import shutil
+import unittest
+
+from artifacts import artifact
+from artifacts import cache
+from artifacts import reader
+from artifacts import registry
+
+from tests import test_lib
+
+
+class ArtifactDefinitionsCacheTest(test_lib.BaseTestCase):
+    """Tests for the artifact definitions cache."""
+
+    # pylint: disable=protected-access
+
+    def testReadFile(self):
+        """Tests the ReadFile function."""
+        test_file = self._GetTestFilePath(["definitions.yaml"])
+        self._SkipIfPathNotExists(test_file)
+
+        artifact_reader = reader.YamlArtifactsReader()
+        expected_definitions = [
+            artifact_definition.AsDict()
+            for artifact_definition in artifact_reader.ReadFile(test_file)
+        ]
+
+        with test_lib.TempDirectory() as temporary_directory:
+            cache_path = os.path.join(temporary_directory, "cache")
+            definitions_cache = cache.ArtifactDefinitionsCache(cache_path)
+
+            artifact_definitions = definitions_cache.ReadFile(
+                artifact_reader, test_file
+            )
+            self.assertEqual(
+                [
+                    artifact_definition.AsDict()
+                    for artifact_definition in artifact_definitions
+                ],
+                expected_definitions,
+            )
+
+            entry_path = definitions_cache._GetEntryPath(artifact_reader, test_file)
+            self.assertTrue(os.path.exists(entry_path))
+
+            cache_entry = definitions_cache._ReadEntry(entry_path)
+            self.assertIsNotNone(cache_entry)
+
+            artifact_definitions = definitions_cache.ReadFile(
+                artifact_reader, test_file
+            )
+            self.assertEqual(
+                [
+                    artifact_definition.AsDict()
+                    for artifact_definition in artifact_definitions
+                ],
+                expected_definitions,
+            )
+
+            definitions_cache.Clear()
+            self.assertFalse(os.path.exists(entry_path))
+
+    def testReadFileLean(self):
+        """Tests the ReadFile function with a lean artifacts reader."""
+        test_file = self._GetTestFilePath(["definitions.yaml"])
+        self._SkipIfPathNotExists(test_file)
+
+        artifact_reader = reader.YamlArtifactsReader()
+        lean_artifact_reader = reader.YamlArtifactsReader(lean=True)
+
+        with test_lib.TempDirectory() as temporary_directory:
+            cache_path = os.path.join(temporary_directory, "cache")
+            definitions_cache = cache.ArtifactDefinitionsCache(cache_path)
+
+            # Definitions read by a lean and a regular reader are cached
+            # separately.
+            self.assertNotEqual(
+                definitions_cache._GetEntryPath(artifact_reader, test_file),
+                definitions_cache._GetEntryPath(lean_artifact_reader, test_file),
+            )
+
+            for _ in range(2):
+                artifact_definitions = definitions_cache.ReadFile(
+                    lean_artifact_reader, test_file
+                )
+                self.assertEqual(len(artifact_definitions), 7)
+                for artifact_definition in artifact_definitions:
+                    self.assertIsInstance(
+                        artifact_definition, artifact.LeanArtifactDefinition
+                    )
+
+                artifact_definitions = definitions_cache.ReadFile(
+                    artifact_reader, test_file
+                )
+                for artifact_definition in artifact_definitions:
+                    self.assertNotIsInstance(
+                        artifact_definition, artifact.LeanArtifactDefinition
+                    )
+
+    def testReadEntryWithCorruptedEntry(self):
+        """Tests the _ReadEntry function with corrupted cache entries."""
+        test_file = self._GetTestFilePath(["definitions.yaml"])
+        self._SkipIfPathNotExists(test_file)
+
+        artifact_reader = reader.YamlArtifactsReader()
+
+        with test_lib.TempDirectory() as temporary_directory:
+            definitions_cache = cache.ArtifactDefinitionsCache(temporary_directory)
+            definitions_cache.ReadFile(artifact_reader, test_file)
+
+            entry_path = definitions_cache._GetEntryPath(artifact_reader, test_file)
+            with open(entry_path, "rb") as file_object:
+                entry_data = file_object.read()
+
+            for corrupted_data in (
+                b"",
+                b"corrupted",
+                b"\x80\xffcorrupted",
+                entry_data[: len(entry_data) // 2],
+                entry_data[:-1],
+            ):
+                with open(entry_path, "wb") as file_object:
+                    file_object.write(corrupted_data)
+
+                self.assertIsNone(definitions_cache._ReadEntry(entry_path))
+
+                artifact_definitions = definitions_cache.ReadFile(
+                    artifact_reader, test_file
+                )
+                self.assertEqual(len(artifact_definitions), 7)
+
+    def testReadEntryWithUntrustedEntry(self):
+        """Tests the _ReadEntry function with untrusted cache entries."""
+        test_file = self._GetTestFilePath(["definitions.yaml"])
+        self._SkipIfPathNotExists(test_file)
+
+        artifact_reader = reader.YamlArtifactsReader()
+
+        with test_lib.TempDirectory() as temporary_directory:
+            cache_path = os.path.join(temporary_directory, "cache")
+            definitions_cache = cache.ArtifactDefinitionsCache(cache_path)
+            definitions_cache.ReadFile(artifact_reader, test_file)
+
+            entry_path = definitions_cache._GetEntryPath(artifact_reader, test_file)
+            self.assertIsNotNone(definitions_cache._ReadEntry(entry_path))
+
+            os.chmod(entry_path, 0o666)
+            self.assertIsNone(definitions_cache._ReadEntry(entry_path))
+
+            os.chmod(entry_path, 0o600)
+            self.assertIsNotNone(definitions_cache._ReadEntry(entry_path))
+
+            os.chmod(cache_path, 0o777)
+            self.assertIsNone(definitions_cache._ReadEntry(entry_path))
+
+            artifact_definitions = definitions_cache.ReadFile(
+                artifact_reader, test_file
+            )
+            self.assertEqual(len(artifact_definitions), 7)
+
+    def testReadFileWithChangedFile(self):
+        """Tests the ReadFile function with a changed definitions file."""
+        test_file = self._GetTestFilePath(["definitions.yaml"])
+        self._SkipIfPathNotExists(test_file)
+
+        artifact_reader = reader.YamlArtifactsReader()
+
+        with test_lib.TempDirectory() as temporary_directory:
+            cache_path = os.path.join(temporary_directory, "cache")
+            definitions_cache = cache.ArtifactDefinitionsCache(cache_path)
+
+            definitions_file = os.path.join(temporary_directory, "definitions.yaml")
+            shutil.copyfile(test_file, definitions_file)
+
+            artifact_definitions = definitions_cache.ReadFile(
+                artifact_reader, definitions_file
+            )
+            self.assertEqual(len(artifact_definitions), 7)
+
+            with open(definitions_file, "r", encoding="utf-8") as file_object:
+                file_data = file_object.read()
+
+            # Remove the first definition from the definitions file.
+            documents = file_data.split("\n---\n")
+            file_data = "\n---\n".join(documents[:1] + documents[2:])
+            with open(definitions_file, "w", encoding="utf-8") as file_object:
+                file_object.write(file_data)
+
+            artifact_definitions = definitions_cache.ReadFile(
+                artifact_reader, definitions_file
+            )
+            self.assertEqual(len(artifact_definitions), 6)
+
+    def testReadFromDirectory(self):
+        """Tests reading into a registry using the cache."""
+        artifact_reader = reader.YamlArtifactsReader()
+
+        with test_lib.TempDirectory() as temporary_directory:
+            definitions_cache = cache.ArtifactDefinitionsCache(temporary_directory)
+
+            for _ in range(2):
+                artifact_registry = registry.ArtifactDefinitionsRegistry()
+                artifact_registry.ReadFromDirectory(
+                    artifact_reader, self._TEST_DATA_PATH, cache=definitions_cache
+                )
+
+                artifact_definitions = list(artifact_registry.GetDefinitions())
+                self.assertEqual(len(artifact_definitions), 7)
+
+                artifact_definition = artifact_registry.GetDefinitionByName("EventLogs")
+                self.assertIsNotNone(artifact_definition)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+"""Tests for the artifact definitions content fingerprint."""
+
+import os
+import shutil
+import unittest
+
+from artifacts import fingerprint
+from artifacts import reader
+
+from tests import test_lib
+
+
+class ArtifactDefinitionsFingerprintTest(test_lib.BaseTestCase):
+    """Tests for the artifact definitions content fingerprint."""
+
+    # pylint: disable=protected-access
+
+    def testGetContentDigest(self):
+        """Tests the _GetContentDigest function."""
+        test_file = self._GetTestFilePath(["definitions.yaml"])
+        self._SkipIfPathNotExists(test_file)
+
+        test_fingerprint = fingerprint.ArtifactDefinitionsFingerprint()
+        test_fingerprint._READ_SIZE = 16
+
+        expected_digest = test_fingerprint._GetContentDigest(test_file)
+
+        test_fingerprint = fingerprint.ArtifactDefinitionsFingerprint()
+        self.assertEqual(test_fingerprint._GetContentDigest(test_file), expected_digest)
+
+    def testComputeAndDiff(self):
+        """Tests the Compute and Diff functions."""
+        artifact_reader = reader.YamlArtifactsReader()
+
+        with test_lib.TempDirectory() as temporary_directory:
+            data_path = os.path.join(temporary_directory, "data")
+            shutil.copytree(self._DATA_PATH, data_path)
+
+            first_fingerprint = fingerprint.ArtifactDefinitionsFingerprint()
+            first_fingerprint.Compute(artifact_reader, data_path)
+
+            self.assertIsNotNone(first_fingerprint.digest)
+            self.assertIn("antivirus.yaml", first_fingerprint.file_fingerprints)
+            self.assertIn("Bit9LocalCache", first_fingerprint.GetDefinitionDigests())
+
+            # Changes that do not affect the artifact definitions, such as
+            # comments, do not change the fingerprint.
+            antivirus_file = os.path.join(data_path, "antivirus.yaml")
+            with open(antivirus_file, "a", encoding="utf-8") as file_object:
+                file_object.write("# Comment\n")
+
+            second_fingerprint = fingerprint.ArtifactDefinitionsFingerprint()
+            second_fingerprint.Compute(artifact_reader, data_path)
+
+            self.assertEqual(second_fingerprint.digest, first_fingerprint.digest)
+            self.assertFalse(first_fingerprint.Diff(second_fingerprint))
+
+            with open(antivirus_file, "r", encoding="utf-8") as file_object:
+                data = file_object.read()
+
+            data = data.replace(
+                "doc: Bit9 local cache database.", "doc: Bit9 cache database."
+            )
+            with open(antivirus_file, "w", encoding="utf-8") as file_object:
+                file_object.write(data)
+
+            os.remove(os.path.join(data_path, "applications.yaml"))
+            file_fingerprint = first_fingerprint.file_fingerprints["applications.yaml"]
+            removed_names = set(file_fingerprint.definition_digests)
+
+            second_fingerprint.Compute(artifact_reader, data_path)
+            self.assertNotEqual(second_fingerprint.digest, first_fingerprint.digest)
+
+            differences = first_fingerprint.Diff(second_fingerprint)
+            self.assertTrue(differences)
+            self.assertEqual(differences.changed, {"Bit9LocalCache"})
+            self.assertEqual(differences.removed, removed_names)
+            self.assertEqual(differences.added, set())
+
+            differences = second_fingerprint.Diff(first_fingerprint)
+            self.assertEqual(differences.changed, {"Bit9LocalCache"})
+            self.assertEqual(differences.removed, set())
+            self.assertEqual(differences.added, removed_names)
+
+    def testComputeWithPreviousFingerprint(self):
+        """Tests the Compute function with a previous fingerprint."""
+        artifact_reader = reader.YamlArtifactsReader()
+
+        with test_lib.TempDirectory() as temporary_directory:
+            data_path = os.path.join(temporary_directory, "data")
+            shutil.copytree(self._DATA_PATH, data_path)
+
+            previous_fingerprint = fingerprint.ArtifactDefinitionsFingerprint()
+            previous_fingerprint.Compute(artifact_reader, data_path)
+
+            antivirus_file = os.path.join(data_path, "antivirus.yaml")
+            with open(antivirus_file, "a", encoding="utf-8") as file_object:
+                file_object.write("# Comment\n")
+
+            test_fingerprint = fingerprint.ArtifactDefinitionsFingerprint()
+            test_fingerprint.Compute(
+                artifact_reader, data_path, previous_fingerprint=previous_fingerprint
+            )
+
+            self.assertEqual(test_fingerprint.digest, previous_fingerprint.digest)
+
+            # Only the changed file is read again.
+            file_fingerprints = test_fingerprint.file_fingerprints
+            previous_file_fingerprints = previous_fingerprint.file_fingerprints
+            for filename, file_fingerprint in file_fingerprints.items():
+                previous_file_fingerprint = previous_file_fingerprints[filename]
+                if filename == "antivirus.yaml":
+                    self.assertIsNot(file_fingerprint, previous_file_fingerprint)
+                else:
+                    self.assertIs(file_fingerprint, previous_file_fingerprint)
+
+            # Fingerprints of a differently configured reader are not reused.
+            artifact_reader = reader.YamlArtifactsReader(operating_systems={"Linux"})
+
+            test_fingerprint = fingerprint.ArtifactDefinitionsFingerprint()
+            test_fingerprint.Compute(
+                artifact_reader, data_path, previous_fingerprint=previous_fingerprint
+            )
+            self.assertNotEqual(test_fingerprint.digest, previous_fingerprint.digest)
+
+    def testComputeWithoutExtension(self):
+        """Tests the Compute function without an extension."""
+        test_file = self._GetTestFilePath(["definitions.yaml"])
+        self._SkipIfPathNotExists(test_file)
+
+        artifact_reader = reader.YamlArtifactsReader()
+
+        with test_lib.TempDirectory() as temporary_directory:
+            shutil.copyfile(
+                test_file, os.path.join(temporary_directory, "definitions.txt")
+            )
+
+            test_fingerprint = fingerprint.ArtifactDefinitionsFingerprint()
+            test_fingerprint.Compute(artifact_reader, temporary_directory)
+            self.assertEqual(test_fingerprint.file_fingerprints, {})
+
+            test_fingerprint.Compute(
+                artifact_reader, temporary_directory, extension=None
+            )
+            self.assertEqual(
+                list(test_fingerprint.file_fingerprints.keys()), ["definitions.txt"]
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
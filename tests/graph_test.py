@@ -0,0 +1,220 @@
+"""Tests for the graph of the references between artifact groups."""
+
+import random
+import unittest
+
+from artifacts import artifact
+from artifacts import definitions
+from artifacts import graph
+from artifacts import reader
+from artifacts import registry
+
+from tests import test_lib
+
+
+class ArtifactGroupsGraphTest(test_lib.BaseTestCase):
+    """Tests for the graph of the references between artifact groups."""
+
+    # pylint: disable=protected-access
+
+    def _CreateDefinition(self, name, member_names=None, paths=None):
+        """Creates an artifact definition.
+
+        Args:
+          name (str): name of the artifact definition.
+          member_names (Optional[list[str]]): names of the members of the
+              artifact group source.
+          paths (Optional[list[str]]): paths of the file source.
+
+        Returns:
+          ArtifactDefinition: an artifact definition.
+        """
+        artifact_definition = artifact.ArtifactDefinition(name)
+        if member_names:
+            artifact_definition.AppendSource(
+                definitions.TYPE_INDICATOR_ARTIFACT_GROUP, {"names": member_names}
+            )
+        if paths is not None:
+            artifact_definition.AppendSource(
+                definitions.TYPE_INDICATOR_FILE, {"paths": paths}
+            )
+        return artifact_definition
+
+    def _GetState(self, artifact_groups_graph):
+        """Retrieves the analysis state of a graph.
+
+        Args:
+          artifact_groups_graph (ArtifactGroupsGraph): graph.
+
+        Returns:
+          tuple[set[frozenset[str]], set[str], dict[str, list[str]], set[str]]:
+              strongly connected components, cycles, dangling references and
+              unreachable groups.
+        """
+        analysis = artifact_groups_graph.GetAnalysis()
+        return (
+            {frozenset(component) for component in analysis.components},
+            {frozenset(cycle) for cycle in analysis.cycles},
+            analysis.dangling_references,
+            set(analysis.unreachable_groups),
+        )
+
+    def testBuildAndGetAnalysis(self):
+        """Tests the Build and GetAnalysis functions."""
+        artifact_definitions = [
+            self._CreateDefinition("GroupA", member_names=["GroupB", "File1"]),
+            self._CreateDefinition("GroupB", member_names=["GroupC"]),
+            self._CreateDefinition("GroupC", member_names=["GroupA", "Bogus"]),
+            self._CreateDefinition("GroupD", member_names=["GroupD"]),
+            self._CreateDefinition("GroupE", member_names=["GroupD", "Missing"]),
+            self._CreateDefinition("File1", paths=["/file1"]),
+        ]
+
+        artifact_groups_graph = graph.ArtifactGroupsGraph()
+        artifact_groups_graph.Build(artifact_definitions)
+
+        analysis = artifact_groups_graph.GetAnalysis()
+        self.assertEqual(
+            analysis.components,
+            [["GroupA", "GroupB", "GroupC"], ["GroupD"], ["GroupE"], ["File1"]],
+        )
+        self.assertEqual(analysis.cycles, [["GroupA", "GroupB", "GroupC"], ["GroupD"]])
+        self.assertEqual(
+            analysis.dangling_references, {"GroupC": ["Bogus"], "GroupE": ["Missing"]}
+        )
+        self.assertEqual(analysis.unreachable_groups, ["GroupD", "GroupE"])
+
+        analysis = artifact_groups_graph.GetAnalysis(ignored_names={"missing"})
+        self.assertEqual(analysis.dangling_references, {"GroupC": ["Bogus"]})
+
+        with self.assertRaises(KeyError):
+            artifact_groups_graph.AddDefinition(artifact_definitions[0])
+
+    def testBuildWithDeeplyNestedGroups(self):
+        """Tests the Build function with deeply nested artifact groups."""
+        number_of_groups = 20000
+        artifact_definitions = [
+            self._CreateDefinition(
+                f"Group{index:d}",
+                member_names=[f"Group{(index + 1) % number_of_groups:d}"],
+            )
+            for index in range(number_of_groups)
+        ]
+
+        artifact_groups_graph = graph.ArtifactGroupsGraph()
+        artifact_groups_graph.Build(artifact_definitions)
+
+        analysis = artifact_groups_graph.GetAnalysis()
+        self.assertEqual(len(analysis.cycles), 1)
+        self.assertEqual(len(analysis.cycles[0]), number_of_groups)
+
+        artifact_groups_graph.RemoveDefinition(artifact_definitions[0])
+
+        analysis = artifact_groups_graph.GetAnalysis()
+        self.assertEqual(analysis.cycles, [])
+        self.assertEqual(len(analysis.components), number_of_groups - 1)
+
+    def testAddAndRemoveDefinition(self):
+        """Tests the AddDefinition and RemoveDefinition functions."""
+        random_generator = random.Random(1)
+
+        names = [f"Definition{index:d}" for index in range(40)]
+
+        artifact_groups_graph = graph.ArtifactGroupsGraph()
+        added_definitions = {}
+
+        for _ in range(400):
+            name = random_generator.choice(names)
+            artifact_definition = added_definitions.pop(name, None)
+            if artifact_definition:
+                artifact_groups_graph.RemoveDefinition(artifact_definition)
+
+            else:
+                member_names = random_generator.sample(
+                    names, random_generator.randint(0, 2)
+                )
+                paths = None
+                if random_generator.random() < 0.2:
+                    paths = ["/file"]
+
+                artifact_definition = self._CreateDefinition(
+                    name, member_names=member_names, paths=paths
+                )
+                artifact_groups_graph.AddDefinition(artifact_definition)
+                added_definitions[name] = artifact_definition
+
+            expected_graph = graph.ArtifactGroupsGraph()
+            expected_graph.Build(
+                [
+                    added_definitions[name]
+                    for name in artifact_groups_graph._names.values()
+                ]
+            )
+            self.assertEqual(
+                self._GetState(artifact_groups_graph), self._GetState(expected_graph)
+            )
+
+        with self.assertRaises(KeyError):
+            artifact_groups_graph.RemoveDefinition(self._CreateDefinition("Bogus"))
+
+
+class ArtifactDefinitionsRegistryAnalysisTest(test_lib.BaseTestCase):
+    """Tests for the analysis of artifact groups by the registry."""
+
+    def testAnalyzeArtifactGroups(self):
+        """Tests the AnalyzeArtifactGroups function."""
+        artifact_reader = reader.YamlArtifactsReader()
+
+        artifact_registry = registry.ArtifactDefinitionsRegistry()
+        artifact_registry.ReadFromDirectory(artifact_reader, self._DATA_PATH)
+
+        analysis = artifact_registry.AnalyzeArtifactGroups()
+        self.assertEqual(
+            len(analysis.components), len(list(artifact_registry.GetDefinitions()))
+        )
+        self.assertEqual(analysis.cycles, [])
+        self.assertEqual(analysis.dangling_references, {})
+        self.assertEqual(analysis.unreachable_groups, [])
+
+        group_definition = artifact.ArtifactDefinition("TestGroup")
+        group_definition.AppendSource(
+            definitions.TYPE_INDICATOR_ARTIFACT_GROUP,
+            {"names": ["TestGroup", "TestMissing"]},
+        )
+        artifact_registry.RegisterDefinition(group_definition)
+
+        analysis = artifact_registry.AnalyzeArtifactGroups()
+        self.assertEqual(analysis.cycles, [["TestGroup"]])
+        self.assertEqual(analysis.dangling_references, {"TestGroup": ["TestMissing"]})
+        self.assertEqual(analysis.unreachable_groups, ["TestGroup"])
+
+        missing_definition = artifact.ArtifactDefinition("TestMissing")
+        missing_definition.AppendSource(
+            definitions.TYPE_INDICATOR_FILE, {"paths": ["/missing"]}
+        )
+        artifact_registry.ReplaceDefinitions([], [missing_definition])
+
+        analysis = artifact_registry.AnalyzeArtifactGroups()
+        self.assertEqual(analysis.dangling_references, {})
+        self.assertEqual(analysis.unreachable_groups, [])
+
+        artifact_registry.DeregisterDefinition(group_definition)
+
+        analysis = artifact_registry.AnalyzeArtifactGroups()
+        self.assertEqual(analysis.cycles, [])
+
+    def testAnalyzeArtifactGroupsWithOperatingSystems(self):
+        """Tests the AnalyzeArtifactGroups function with operating systems."""
+        artifact_reader = reader.YamlArtifactsReader()
+
+        artifact_registry = registry.ArtifactDefinitionsRegistry()
+        artifact_registry.ReadFromDirectory(
+            artifact_reader, self._DATA_PATH, operating_systems={"Linux"}
+        )
+
+        analysis = artifact_registry.AnalyzeArtifactGroups()
+        self.assertEqual(analysis.dangling_references, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,165 @@
+"""Tests for the import time of the artifacts package."""
+
+import os
+import subprocess
+import sys
+import unittest
+
+from tests import test_lib
+
+
+class ImportTimeTest(test_lib.BaseTestCase):
+    """Tests for the import time of the artifacts package."""
+
+    # Modules that are expensive to import and should only be imported by the
+    # code paths that need them.
+    _DEFERRED_MODULES = frozenset(
+        [
+            "asyncio",
+            "concurrent.futures",
+            "hashlib",
+            "mmap",
+            "multiprocessing",
+            "pickle",
+            "tempfile",
+            "yaml",
+        ]
+    )
+
+    # Maximum cumulative import time of a module relative to the import time
+    # of the modules imported by the interpreter at startup, so that the budget
+    # does not depend on the speed of the machine.
+    _IMPORT_TIME_RATIO = 6.0
+
+    _MODULES = [
+        "artifacts.artifact",
+        "artifacts.definitions",
+        "artifacts.reader",
+        "artifacts.registry",
+        "artifacts.source_type",
+        "artifacts.writer",
+    ]
+
+    # Number of times the import time is measured, of which the minimum is
+    # used to reduce the effect of other activity on the machine.
+    _NUMBER_OF_MEASUREMENTS = 3
+
+    def _GetBaselineImportTime(self):
+        """Retrieves the import time of the interpreter startup modules.
+
+        Returns:
+          int: cumulative import time of the modules imported by the interpreter
+              at startup in microseconds.
+        """
+        baseline_import_time = None
+        for _ in range(self._NUMBER_OF_MEASUREMENTS):
+            process = self._RunInterpreter("pass")
+
+            import_time = 0
+            for line in process.stderr.splitlines():
+                _, _, values = line.partition("import time:")
+                if not values:
+                    continue
+
+                _, cumulative_time, name = values.split("|")
+                # Only the top-level imports are counted, since their cumulative
+                # import time includes that of the nested imports.
+                if cumulative_time.strip().isdigit() and not name.startswith("  "):
+                    import_time += int(cumulative_time)
+
+            if baseline_import_time is None or import_time < baseline_import_time:
+                baseline_import_time = import_time
+
+        return baseline_import_time
+
+    def _ImportModule(self, module_name):
+        """Imports a module in a new Python interpreter.
+
+        Args:
+          module_name (str): name of the module.
+
+        Returns:
+          tuple[int, set[str]]: cumulative import time of the module in
+              microseconds and names of the modules imported by the interpreter.
+        """
+        module_import_time = None
+        imported_modules = set()
+        for _ in range(self._NUMBER_OF_MEASUREMENTS):
+            process = self._RunInterpreter(
+                f"import sys, {module_name:s}; print(' '.join(sys.modules))"
+            )
+
+            import_time = None
+            for line in process.stderr.splitlines():
+                _, _, values = line.partition("import time:")
+                if not values:
+                    continue
+
+                _, cumulative_time, name = values.split("|")
+                if name.strip() == module_name:
+                    import_time = int(cumulative_time)
+
+            if import_time is not None and (
+                module_import_time is None or import_time < module_import_time
+            ):
+                module_import_time = import_time
+
+            imported_modules.update(process.stdout.split())
+
+        return module_import_time, imported_modules
+
+    def _RunInterpreter(self, code):
+        """Runs code in a new Python interpreter that reports the import time.
+
+        Args:
+          code (str): Python code to run.
+
+        Returns:
+          subprocess.CompletedProcess: completed process.
+        """
+        environment = dict(os.environ)
+        environment["PYTHONPATH"] = os.getcwd()
+
+        command = [sys.executable, "-X", "importtime", "-c", code]
+        return subprocess.run(
+            command,
+            capture_output=True,
+            check=True,
+            encoding="utf-8",
+            env=environment,
+        )
+
+    def testDeferredModules(self):
+        """Tests that expensive modules are not imported with the package."""
+        for module_name in self._MODULES:
+            _, imported_modules = self._ImportModule(module_name)
+
+            deferred_modules = self._DEFERRED_MODULES.intersection(imported_modules)
+            self.assertEqual(
+                deferred_modules, set(), f"imported by module: {module_name:s}"
+            )
+
+    def testImportTime(self):
+        """Tests the import time of the modules against the budget."""
+        baseline_import_time = self._GetBaselineImportTime()
+        self.assertGreater(baseline_import_time, 0)
+
+        import_time_budget = baseline_import_time * self._IMPORT_TIME_RATIO
+
+        for module_name in self._MODULES:
+            import_time, _ = self._ImportModule(module_name)
+
+            self.assertIsNotNone(import_time)
+            self.assertLessEqual(
+                import_time,
+                import_time_budget,
+                (
+                    f"import time of module: {module_name:s} exceeds budget of "
+                    f"{self._IMPORT_TIME_RATIO:.1f} times the import time of the "
+                    f"interpreter startup modules"
+                ),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
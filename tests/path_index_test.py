@@ -0,0 +1,211 @@
+"""Tests for the reverse index of the paths of artifact definitions."""
+
+import fnmatch
+import unittest
+
+from artifacts import artifact
+from artifacts import definitions
+from artifacts import path_index
+from artifacts import reader
+from artifacts import registry
+
+from tests import test_lib
+
+
+class PathIndexTest(test_lib.BaseTestCase):
+    """Tests for the reverse index of the paths of artifact definitions."""
+
+    # pylint: disable=protected-access
+
+    def _CreateDefinition(self, name, paths, separator="/", supported_os=None):
+        """Creates an artifact definition.
+
+        Args:
+          name (str): name of the artifact definition.
+          paths (list[str]): paths of the file source.
+          separator (Optional[str]): path segment separator of the file source.
+          supported_os (Optional[list[str]]): supported operating systems.
+
+        Returns:
+          ArtifactDefinition: an artifact definition.
+        """
+        artifact_definition = artifact.ArtifactDefinition(name)
+        artifact_definition.AppendSource(
+            definitions.TYPE_INDICATOR_FILE, {"paths": paths, "separator": separator}
+        )
+        artifact_definition.supported_os = supported_os or []
+        return artifact_definition
+
+    def _GetMatchedNames(self, test_index, path, separator="/"):
+        """Retrieves the names of the artifact definitions that match a path.
+
+        Args:
+          test_index (PathIndex): path index.
+          path (str): path.
+          separator (Optional[str]): path segment separator of the path.
+
+        Returns:
+          set[str]: names of the artifact definitions that match the path.
+        """
+        matches = test_index.GetMatches(path, separator=separator)
+        return {artifact_definition.name for artifact_definition, _, _ in matches}
+
+    def testGetSegments(self):
+        """Tests the _GetSegments function."""
+        test_index = path_index.PathIndex()
+
+        segments = test_index._GetSegments("/etc//passwd/", "/")
+        self.assertEqual(segments, ["", "etc", "passwd"])
+
+        segments = test_index._GetSegments("%%environ_systemroot%%\\win.ini", "\\")
+        self.assertEqual(segments, ["%%environ_systemroot%%", "win.ini"])
+
+    def testGetMatches(self):
+        """Tests the GetMatches function."""
+        test_index = path_index.PathIndex()
+        test_index.Build(
+            [
+                self._CreateDefinition("Passwd", ["/etc/passwd"]),
+                self._CreateDefinition("Logs", ["/var/log/*.log"]),
+                self._CreateDefinition("History", ["%%users.homedir%%/.bash_history"]),
+                self._CreateDefinition("UserLogs", ["/home/%%users.username%%.log"]),
+            ]
+        )
+
+        self.assertEqual(self._GetMatchedNames(test_index, "/etc/passwd"), {"Passwd"})
+        self.assertEqual(self._GetMatchedNames(test_index, "/etc/Passwd"), set())
+        self.assertEqual(self._GetMatchedNames(test_index, "/etc"), set())
+        self.assertEqual(
+            self._GetMatchedNames(test_index, "/var/log/syslog.log"), {"Logs"}
+        )
+        self.assertEqual(self._GetMatchedNames(test_index, "/var/log/a/b.log"), set())
+
+        # A path variable segment matches one or more segments.
+        self.assertEqual(
+            self._GetMatchedNames(test_index, "/home/alice/.bash_history"),
+            {"History"},
+        )
+        self.assertEqual(
+            self._GetMatchedNames(test_index, "/var/lib/user/.bash_history"),
+            {"History"},
+        )
+
+        # A path variable within a segment matches part of the segment.
+        self.assertEqual(
+            self._GetMatchedNames(test_index, "/home/alice.log"), {"UserLogs"}
+        )
+
+        matches = test_index.GetMatches("/etc/passwd")
+        self.assertEqual(len(matches), 1)
+        artifact_definition, source, pattern = matches[0]
+        self.assertEqual(artifact_definition.name, "Passwd")
+        self.assertIs(source, artifact_definition.sources[0])
+        self.assertEqual(pattern, "/etc/passwd")
+
+    def testGetMatchesWithRecursiveGlob(self):
+        """Tests the GetMatches function with recursive globs."""
+        test_index = path_index.PathIndex()
+        test_index.Build(
+            [
+                self._CreateDefinition("Default", ["/opt/**/app.conf"]),
+                self._CreateDefinition("Limited", ["/opt/**2/app.conf"]),
+            ]
+        )
+
+        self.assertEqual(
+            self._GetMatchedNames(test_index, "/opt/app.conf"), {"Default", "Limited"}
+        )
+        self.assertEqual(
+            self._GetMatchedNames(test_index, "/opt/a/b/app.conf"),
+            {"Default", "Limited"},
+        )
+        self.assertEqual(
+            self._GetMatchedNames(test_index, "/opt/a/b/c/app.conf"), {"Default"}
+        )
+
+        path = "/opt/" + "a/" * 11 + "app.conf"
+        self.assertEqual(self._GetMatchedNames(test_index, path), set())
+
+    def testGetMatchesWithSeparator(self):
+        """Tests the GetMatches function with different path segment separators."""
+        test_index = path_index.PathIndex()
+        test_index.Build(
+            [
+                self._CreateDefinition(
+                    "WinIni", ["%%environ_systemroot%%\\win.ini"], separator="\\"
+                ),
+                self._CreateDefinition(
+                    "Hosts",
+                    ["C:/Windows/System32/drivers/etc/hosts"],
+                    supported_os=[definitions.SUPPORTED_OS_WINDOWS],
+                ),
+                self._CreateDefinition("Profile", ["/Users/*/.profile"]),
+            ]
+        )
+
+        # Paths with the Windows path segment separator are case-insensitive.
+        self.assertEqual(
+            self._GetMatchedNames(test_index, "C:\\WINDOWS\\Win.INI", separator="\\"),
+            {"WinIni"},
+        )
+        self.assertEqual(self._GetMatchedNames(test_index, "C:/Windows/win.ini"), set())
+
+        # Paths of Windows only artifact definitions are case-insensitive.
+        self.assertEqual(
+            self._GetMatchedNames(test_index, "c:/windows/system32/DRIVERS/etc/hosts"),
+            {"Hosts"},
+        )
+        self.assertEqual(
+            self._GetMatchedNames(test_index, "/users/alice/.profile"), set()
+        )
+
+    def testGetMatchesWithBundledDefinitions(self):
+        """Tests the GetMatches function with the bundled artifact definitions."""
+        artifact_reader = reader.YamlArtifactsReader()
+        artifact_registry = registry.ArtifactDefinitionsRegistry()
+        artifact_registry.ReadFromDirectory(artifact_reader, self._DATA_PATH)
+
+        artifact_definitions = list(artifact_registry.GetDefinitions())
+
+        test_index = path_index.PathIndex()
+        test_index.Build(artifact_definitions)
+
+        names = self._GetMatchedNames(test_index, "/home/alice/.bash_history")
+        self.assertIn("BashShellHistoryFile", names)
+
+        names = self._GetMatchedNames(
+            test_index,
+            (
+                "C:\\ProgramData\\Symantec\\Symantec Endpoint Protection\\"
+                "12.1\\Quarantine\\1.vbn"
+            ),
+            separator="\\",
+        )
+        self.assertIn("SymantecAVQuarantine", names)
+
+        # The index matches at least the artifact definitions of which a path
+        # without path variables or recursive globs matches.
+        for path in ("/etc/passwd", "/var/log/wtmp", "/root/.bash_history"):
+            expected_names = set()
+            for artifact_definition in artifact_definitions:
+                for source in artifact_definition.sources:
+                    if source.type_indicator not in test_index._SOURCE_TYPE_INDICATORS:
+                        continue
+
+                    if source.separator != "/":
+                        continue
+
+                    for pattern in source.paths:
+                        if "%%" in pattern or "**" in pattern:
+                            continue
+
+                        if fnmatch.fnmatchcase(path, pattern):
+                            expected_names.add(artifact_definition.name)
+
+            names = self._GetMatchedNames(test_index, path)
+            self.assertTrue(expected_names)
+            self.assertTrue(expected_names.issubset(names))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,13 @@
 """Tests for the artifact definitions readers."""
 
 import io
+import os
+import pickle
+import shutil
 import unittest
 import yaml
 
+from artifacts import artifact
 from artifacts import definitions
 from artifacts import errors
 from artifacts import reader
@@ -14,6 +18,8 @@ from tests import test_lib
 class YamlArtifactsReaderTest(test_lib.BaseTestCase):
     """YAML artifacts reader tests."""
 
+    # pylint: disable=protected-access
+
     _DEFINITION_INVALID_SUPPORTED_OS_1 = """\
 name: BadSupportedOS
 doc: supported_os should be an array of strings.
@@ -284,6 +290,334 @@ supported_os: [Windows]
         artifact_definitions = list(artifact_reader.ReadDirectory(test_file))
         self.assertEqual(len(artifact_definitions), 7)
 
+    def testReadDirectoryWithWorkers(self):
+        """Tests the ReadDirectory function with worker processes."""
+        artifact_reader = reader.YamlArtifactsReader()
+
+        expected_artifact_definitions = [
+            artifact_definition.AsDict()
+            for artifact_definition in artifact_reader.ReadDirectory(self._DATA_PATH)
+        ]
+
+        artifact_definitions = [
+            artifact_definition.AsDict()
+            for artifact_definition in artifact_reader.ReadDirectory(
+                self._DATA_PATH, number_of_workers=4
+            )
+        ]
+        self.assertEqual(artifact_definitions, expected_artifact_definitions)
+
+    def testReadDirectoryWithWorkersAndErrors(self):
+        """Tests the ReadDirectory function with worker processes and errors."""
+        artifact_reader = reader.YamlArtifactsReader()
+
+        with test_lib.TempDirectory() as temporary_directory:
+            test_definitions = [
+                self._DEFINITION_INVALID_URLS,
+                self._DEFINITION_WITHOUT_DOC,
+                self._DEFINITION_WITH_EXTRA_KEY,
+            ]
+            for index, test_definition in enumerate(test_definitions):
+                test_file = os.path.join(temporary_directory, f"test{index:d}.yaml")
+                with open(test_file, "w", encoding="utf-8") as file_object:
+                    file_object.write(test_definition)
+
+            error_messages = []
+            for number_of_workers in (None, 2):
+                with self.assertRaises(errors.FormatError) as context_manager:
+                    _ = list(
+                        artifact_reader.ReadDirectory(
+                            temporary_directory, number_of_workers=number_of_workers
+                        )
+                    )
+
+                error_messages.append(str(context_manager.exception))
+
+        self.assertEqual(error_messages[0], error_messages[1])
+        self.assertEqual(
+            error_messages[0],
+            "At start Invalid artifact definition: BadUrls urls is not a list.",
+        )
+
+    def testReadDirectoryWithLibYAML(self):
+        """Tests the ReadDirectory function with and without libyaml."""
+        if not getattr(yaml, "__with_libyaml__", False):
+            raise unittest.SkipTest("PyYAML was built without libyaml")
+
+        artifact_reader = reader.YamlArtifactsReader(use_libyaml=False)
+        self.assertIs(artifact_reader._yaml_loader, yaml.SafeLoader)
+
+        expected_artifact_definitions = [
+            artifact_definition.AsDict()
+            for artifact_definition in artifact_reader.ReadDirectory(self._DATA_PATH)
+        ]
+
+        artifact_reader = reader.YamlArtifactsReader(use_libyaml=True)
+        self.assertIs(artifact_reader._yaml_loader, yaml.CSafeLoader)
+
+        artifact_definitions = [
+            artifact_definition.AsDict()
+            for artifact_definition in artifact_reader.ReadDirectory(self._DATA_PATH)
+        ]
+        self.assertEqual(artifact_definitions, expected_artifact_definitions)
+
+    def testReadDirectoryCompact(self):
+        """Tests the ReadDirectory function with compact artifact definitions."""
+        artifact_reader = reader.YamlArtifactsReader()
+
+        expected_artifact_definitions = [
+            artifact_definition.AsDict()
+            for artifact_definition in artifact_reader.ReadDirectory(self._DATA_PATH)
+        ]
+
+        artifact_reader = reader.YamlArtifactsReader(compact=True)
+
+        artifact_definitions = list(artifact_reader.ReadDirectory(self._DATA_PATH))
+        self.assertEqual(
+            [
+                artifact_definition.AsDict()
+                for artifact_definition in artifact_definitions
+            ],
+            expected_artifact_definitions,
+        )
+
+        for artifact_definition in artifact_definitions:
+            self.assertIsInstance(artifact_definition.sources, tuple)
+
+        # Additional attributes can be set on definitions and sources.
+        artifact_definition = artifact_definitions[0]
+        artifact_definition.test = "test123"
+        artifact_definition.sources[0].test = "test123"
+        self.assertEqual(vars(artifact_definition), {"test": "test123"})
+        self.assertEqual(vars(artifact_definition.sources[0]), {"test": "test123"})
+
+    def testReadDirectoryInternStrings(self):
+        """Tests the ReadDirectory function with interned strings."""
+        artifact_reader = reader.YamlArtifactsReader(compact=True, intern_strings=True)
+
+        artifact_definitions = list(artifact_reader.ReadDirectory(self._DATA_PATH))
+
+        paths_by_value = {}
+        supported_os_by_value = {}
+        for artifact_definition in artifact_definitions:
+            supported_os = artifact_definition.supported_os
+            self.assertIs(
+                supported_os_by_value.setdefault(supported_os, supported_os),
+                supported_os,
+            )
+
+            for source in artifact_definition.sources:
+                for path in getattr(source, "paths", None) or []:
+                    self.assertIs(paths_by_value.setdefault(path, path), path)
+
+        # Strings are not interned by default.
+        artifact_reader = reader.YamlArtifactsReader()
+
+        expected_artifact_definitions = [
+            artifact_definition.AsDict()
+            for artifact_definition in artifact_reader.ReadDirectory(self._DATA_PATH)
+        ]
+        self.assertEqual(
+            [
+                artifact_definition.AsDict()
+                for artifact_definition in artifact_definitions
+            ],
+            expected_artifact_definitions,
+        )
+
+    def testReadDirectoryTrusted(self):
+        """Tests the ReadDirectory function with trusted artifact definitions."""
+        artifact_reader = reader.YamlArtifactsReader()
+
+        expected_artifact_definitions = [
+            artifact_definition.AsDict()
+            for artifact_definition in artifact_reader.ReadDirectory(self._DATA_PATH)
+        ]
+
+        for compact in (False, True):
+            artifact_reader = reader.YamlArtifactsReader(compact=compact, trusted=True)
+
+            artifact_definitions = [
+                artifact_definition.AsDict()
+                for artifact_definition in artifact_reader.ReadDirectory(
+                    self._DATA_PATH
+                )
+            ]
+            self.assertEqual(artifact_definitions, expected_artifact_definitions)
+
+    def testReadDirectoryOperatingSystems(self):
+        """Tests the ReadDirectory function with operating systems."""
+        artifact_reader = reader.YamlArtifactsReader(operating_systems={"Linux"})
+
+        artifact_definitions = list(artifact_reader.ReadDirectory(self._DATA_PATH))
+        self.assertGreater(len(artifact_definitions), 0)
+        self.assertGreater(len(artifact_reader.filtered_artifact_names), 0)
+
+        names = set()
+        for artifact_definition in artifact_definitions:
+            names.add(artifact_definition.name)
+            if artifact_definition.supported_os:
+                self.assertIn("Linux", artifact_definition.supported_os)
+
+            for source in artifact_definition.sources:
+                self.assertNotIn(
+                    source.type_indicator, definitions.WINDOWS_ONLY_TYPE_INDICATORS
+                )
+                supported_os = source.supported_os or artifact_definition.supported_os
+                if supported_os:
+                    self.assertIn("Linux", supported_os)
+
+        self.assertTrue(names.isdisjoint(artifact_reader.filtered_artifact_names))
+
+        all_names = {
+            artifact_definition.name
+            for artifact_definition in reader.YamlArtifactsReader().ReadDirectory(
+                self._DATA_PATH
+            )
+        }
+        self.assertEqual(names | artifact_reader.filtered_artifact_names, all_names)
+
+        artifact_reader = reader.YamlArtifactsReader(operating_systems={"Linux"})
+        worker_artifact_definitions = list(
+            artifact_reader.ReadDirectory(self._DATA_PATH, number_of_workers=2)
+        )
+        self.assertEqual(len(worker_artifact_definitions), len(artifact_definitions))
+        self.assertEqual(artifact_reader.filtered_artifact_names, all_names - names)
+
+    def testReadFileObjectOperatingSystems(self):
+        """Tests the ReadFileObject function with operating systems."""
+        artifact_reader = reader.YamlArtifactsReader(operating_systems={"Darwin"})
+
+        test_file = self._GetTestFilePath(["definitions.yaml"])
+        self._SkipIfPathNotExists(test_file)
+
+        with open(test_file, "r", encoding="utf-8") as file_object:
+            artifact_definitions = list(artifact_reader.ReadFileObject(file_object))
+
+        names = [
+            artifact_definition.name for artifact_definition in artifact_definitions
+        ]
+        self.assertEqual(names, ["OSXLoadedKexts"])
+        self.assertIn(
+            "SecurityEventLogEvtxFile", artifact_reader.filtered_artifact_names
+        )
+
+    def testReadFileObjectTrusted(self):
+        """Tests the ReadFileObject function with trusted artifact definitions."""
+        artifact_reader = reader.YamlArtifactsReader(trusted=True)
+
+        file_object = io.StringIO(initial_value=self._DEFINITION_WITH_EXTRA_KEY)
+        artifact_definitions = list(artifact_reader.ReadFileObject(file_object))
+        self.assertEqual(len(artifact_definitions), 1)
+        self.assertEqual(artifact_definitions[0].name, "WithExtraKey")
+
+    def testReadFileLean(self):
+        """Tests the ReadFile function with lean artifact definitions."""
+        test_file = self._GetTestFilePath(["definitions.yaml"])
+        self._SkipIfPathNotExists(test_file)
+
+        artifact_reader = reader.YamlArtifactsReader()
+
+        expected_artifact_definitions = [
+            artifact_definition.AsDict()
+            for artifact_definition in artifact_reader.ReadFile(test_file)
+        ]
+
+        with test_lib.TempDirectory() as temporary_directory:
+            definitions_file = os.path.join(temporary_directory, "definitions.yaml")
+            shutil.copyfile(test_file, definitions_file)
+
+            artifact_reader = reader.YamlArtifactsReader(lean=True)
+
+            artifact_definitions = list(artifact_reader.ReadFile(definitions_file))
+            self.assertEqual(len(artifact_definitions), 7)
+
+            artifact_definition = artifact_definitions[0]
+            self.assertIsInstance(artifact_definition, artifact.LeanArtifactDefinition)
+            self.assertIsNone(
+                artifact.ArtifactDefinition.description.__get__(artifact_definition)
+            )
+            self.assertIsNone(
+                artifact.ArtifactDefinition.urls.__get__(artifact_definition)
+            )
+
+            # The deferred attributes are not read when pickling, additional
+            # attributes are kept.
+            artifact_definition.test = "test123"
+            artifact_definition = pickle.loads(pickle.dumps(artifact_definition))
+            self.assertIsNone(
+                artifact.ArtifactDefinition.description.__get__(artifact_definition)
+            )
+            self.assertEqual(artifact_definition.test, "test123")
+
+            # The deferred attributes are read once on first access and kept.
+            self.assertEqual(
+                artifact_definition.description,
+                expected_artifact_definitions[0]["doc"],
+            )
+            self.assertEqual(
+                artifact.ArtifactDefinition.description.__get__(artifact_definition),
+                expected_artifact_definitions[0]["doc"],
+            )
+            self.assertEqual(
+                artifact.ArtifactDefinition.urls.__get__(artifact_definition),
+                expected_artifact_definitions[0].get("urls", []),
+            )
+
+            artifact_definition.description = "Test description."
+            self.assertEqual(artifact_definition.description, "Test description.")
+
+            self.assertEqual(
+                [
+                    artifact_definition.AsDict()
+                    for artifact_definition in artifact_definitions
+                ],
+                expected_artifact_definitions,
+            )
+
+            unloaded_definitions = list(artifact_reader.ReadFile(definitions_file))
+
+            # Change the first definition in the definitions file.
+            with open(definitions_file, "r", encoding="utf-8") as file_object:
+                file_data = file_object.read()
+            file_data = file_data.replace(
+                f"name: {artifact_definitions[0].name:s}", "name: Changed", 1
+            )
+            with open(definitions_file, "w", encoding="utf-8") as file_object:
+                file_object.write(file_data)
+
+            # Loaded deferred attributes are not read again.
+            self.assertEqual(
+                artifact_definitions[0].description,
+                expected_artifact_definitions[0]["doc"],
+            )
+
+            with self.assertRaises(errors.FormatError):
+                _ = unloaded_definitions[0].description
+
+    def testReadFileObjectErrorsWithLibYAML(self):
+        """Tests the ReadFileObject function errors with and without libyaml."""
+        test_definitions = [
+            self._DEFINITION_INVALID_SUPPORTED_OS_1,
+            self._DEFINITION_INVALID_URLS,
+            self._DEFINITION_WITH_EXTRA_KEY,
+            self._DEFINITION_WITHOUT_DOC,
+            self._DEFINITION_WITHOUT_SOURCES,
+            "- not a dictionary\n",
+        ]
+        for test_definition in test_definitions:
+            error_messages = []
+            for use_libyaml in (False, True):
+                artifact_reader = reader.YamlArtifactsReader(use_libyaml=use_libyaml)
+
+                file_object = io.StringIO(initial_value=test_definition)
+                with self.assertRaises(errors.FormatError) as context_manager:
+                    _ = list(artifact_reader.ReadFileObject(file_object))
+
+                error_messages.append(str(context_manager.exception))
+
+            self.assertEqual(error_messages[0], error_messages[1])
+
     def testArtifactAsDict(self):
         """Tests the AsDict function."""
         test_file = self._GetTestFilePath(["definitions.yaml"])
@@ -317,6 +651,8 @@ supported_os: [Windows]
 class JsonArtifactsReaderTest(test_lib.BaseTestCase):
     """JSON artifacts reader tests."""
 
+    # pylint: disable=protected-access
+
     def testReadJsonFile(self):
         """Tests the ReadFile function."""
         test_file = self._GetTestFilePath(["definitions.json"])
@@ -328,6 +664,172 @@ class JsonArtifactsReaderTest(test_lib.BaseTestCase):
 
         self.assertEqual(len(artifact_definitions), 7)
 
+    def testReadJsonFileStreaming(self):
+        """Tests the ReadFile function in streaming mode."""
+        test_file = self._GetTestFilePath(["definitions.json"])
+        self._SkipIfPathNotExists(test_file)
+
+        artifact_reader = reader.JsonArtifactsReader()
+        expected_artifact_definitions = [
+            artifact_definition.AsDict()
+            for artifact_definition in artifact_reader.ReadFile(test_file)
+        ]
+
+        artifact_reader = reader.JsonArtifactsReader(streaming=True)
+        # Use a small read size to test values that span multiple reads.
+        artifact_reader._STREAMING_READ_SIZE = 7
+
+        artifact_definitions = [
+            artifact_definition.AsDict()
+            for artifact_definition in artifact_reader.ReadFile(test_file)
+        ]
+        self.assertEqual(artifact_definitions, expected_artifact_definitions)
+
+        with open(test_file, "rb") as file_object:
+            artifact_definitions = [
+                artifact_definition.AsDict()
+                for artifact_definition in artifact_reader.ReadFileObject(file_object)
+            ]
+
+        self.assertEqual(artifact_definitions, expected_artifact_definitions)
+
+    def testReadFileObjectStreamingErrors(self):
+        """Tests the ReadFileObject function in streaming mode with errors."""
+        artifact_reader = reader.JsonArtifactsReader(streaming=True)
+        artifact_reader._STREAMING_READ_SIZE = 7
+
+        test_definitions = [
+            ("", "At start Unexpected end of JSON data."),
+            ("{}", "At start JSON data is not an array."),
+            (
+                '[{"name": "NoDoc"}]',
+                "At start Invalid artifact definition: NoDoc " "missing description.",
+            ),
+            (
+                '[{"name": "Test", "doc": "Test.", "sources": [{"type": "ARTIFACT_'
+                'GROUP", "attributes": {"names": ["Other"]}}]}, {"name": "NoDoc"}]',
+                "After: Test Invalid artifact definition: NoDoc missing "
+                "description.",
+            ),
+            (
+                '[{"name": "Test", "doc": "Test.", "sources": [{"type": "ARTIFACT_'
+                'GROUP", "attributes": {"names": ["Other"]}}]} {}]',
+                "After: Test Invalid JSON data, expected separator at: {",
+            ),
+            ("[{}", "At start Missing artifact definition values."),
+        ]
+        for test_definition, expected_error_message in test_definitions:
+            file_object = io.StringIO(initial_value=test_definition)
+            with self.assertRaises(errors.FormatError) as context_manager:
+                _ = list(artifact_reader.ReadFileObject(file_object))
+
+            self.assertEqual(str(context_manager.exception), expected_error_message)
+
+    def testReadFileObjectStreamingTrailingData(self):
+        """Tests the ReadFileObject function with data after the array."""
+        for streaming in (False, True):
+            artifact_reader = reader.JsonArtifactsReader(streaming=streaming)
+            artifact_reader._STREAMING_READ_SIZE = 7
+
+            file_object = io.StringIO(initial_value="[] \n")
+            self.assertEqual(list(artifact_reader.ReadFileObject(file_object)), [])
+
+            for test_definition in ("[]x", "[]   \n  []"):
+                file_object = io.StringIO(initial_value=test_definition)
+                with self.assertRaises(errors.FormatError):
+                    _ = list(artifact_reader.ReadFileObject(file_object))
+
+    def testReadFileObjectStreamingMaximumElementSize(self):
+        """Tests the ReadFileObject function with an element that is too large."""
+        artifact_reader = reader.JsonArtifactsReader(streaming=True)
+        artifact_reader._STREAMING_MAXIMUM_ELEMENT_SIZE = 64
+        artifact_reader._STREAMING_READ_SIZE = 16
+
+        file_object = io.StringIO(initial_value='[{"name": "' + "A" * 1024)
+        with self.assertRaises(errors.FormatError) as context_manager:
+            _ = list(artifact_reader.ReadFileObject(file_object))
+
+        self.assertEqual(
+            str(context_manager.exception),
+            "At start Invalid JSON data, array element exceeds maximum size: 64.",
+        )
+
+        # Less data than the maximum element size is buffered.
+        self.assertLess(file_object.tell(), 128)
+
+
+class JsonLinesArtifactsReaderTest(test_lib.BaseTestCase):
+    """JSON Lines artifacts reader tests."""
+
+    def testReadFile(self):
+        """Tests the ReadFile function."""
+        test_file = self._GetTestFilePath(["definitions.jsonl"])
+        self._SkipIfPathNotExists(test_file)
+
+        artifact_reader = reader.JsonLinesArtifactsReader()
+
+        artifact_definitions = list(artifact_reader.ReadFile(test_file))
+        self.assertEqual(len(artifact_definitions), 7)
+
+        artifact_definition = artifact_definitions[0]
+        self.assertEqual(artifact_definition.name, "SecurityEventLogEvtx")
+
+    def testReadFileObjectErrors(self):
+        """Tests the ReadFileObject function with errors."""
+        artifact_reader = reader.JsonLinesArtifactsReader()
+
+        file_object = io.StringIO(
+            initial_value=(
+                '{"name": "Test", "doc": "Test.", "sources": [{"type": '
+                '"ARTIFACT_GROUP", "attributes": {"names": ["Other"]}}]}\n'
+                "\n"
+                "{bogus}\n"
+            )
+        )
+        with self.assertRaises(errors.FormatError) as context_manager:
+            _ = list(artifact_reader.ReadFileObject(file_object))
+
+        self.assertTrue(str(context_manager.exception).startswith("After: Test "))
+
+    def testReadFileRange(self):
+        """Tests the ReadFileRange function."""
+        test_file = self._GetTestFilePath(["definitions.jsonl"])
+        self._SkipIfPathNotExists(test_file)
+
+        artifact_reader = reader.JsonLinesArtifactsReader()
+
+        expected_names = [
+            artifact_definition.name
+            for artifact_definition in artifact_reader.ReadFile(test_file)
+        ]
+
+        for number_of_ranges in (1, 2, 3, 7, 50):
+            file_ranges = artifact_reader.GetFileRanges(test_file, number_of_ranges)
+            self.assertEqual(len(file_ranges), number_of_ranges)
+
+            names = []
+            for start_offset, end_offset in file_ranges:
+                names.extend(
+                    [
+                        artifact_definition.name
+                        for artifact_definition in artifact_reader.ReadFileRange(
+                            test_file, start_offset, end_offset
+                        )
+                    ]
+                )
+
+            self.assertEqual(names, expected_names)
+
+        # Test a range that starts at the start of the second line.
+        with open(test_file, "rb") as file_object:
+            start_offset = len(file_object.readline())
+
+        artifact_definitions = list(
+            artifact_reader.ReadFileRange(test_file, start_offset, start_offset + 1)
+        )
+        self.assertEqual(len(artifact_definitions), 1)
+        self.assertEqual(artifact_definitions[0].name, expected_names[1])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,233 @@
+"""Tests for the index of the Windows Registry keys of artifact definitions."""
+
+import unittest
+
+from artifacts import artifact
+from artifacts import definitions
+from artifacts import reader
+from artifacts import registry
+from artifacts import registry_key_index
+
+from tests import test_lib
+
+
+class WindowsRegistryKeyIndexTest(test_lib.BaseTestCase):
+    """Tests for the index of the Windows Registry keys of artifact definitions."""
+
+    # pylint: disable=protected-access
+
+    def _CreateTestIndex(self):
+        """Creates a Windows Registry key index for testing.
+
+        Returns:
+          WindowsRegistryKeyIndex: Windows Registry key index.
+        """
+        services_definition = artifact.ArtifactDefinition("Services")
+        services_definition.AppendSource(
+            definitions.TYPE_INDICATOR_WINDOWS_REGISTRY_KEY,
+            {"keys": ["%%current_control_set%%\\Services\\*"]},
+        )
+
+        run_definition = artifact.ArtifactDefinition("Run")
+        run_definition.AppendSource(
+            definitions.TYPE_INDICATOR_WINDOWS_REGISTRY_KEY,
+            {
+                "keys": [
+                    (
+                        "HKEY_USERS\\%%users.sid%%\\Software\\Microsoft\\Windows\\"
+                        "CurrentVersion\\Run"
+                    )
+                ]
+            },
+        )
+
+        domain_definition = artifact.ArtifactDefinition("Domain")
+        domain_definition.AppendSource(
+            definitions.TYPE_INDICATOR_WINDOWS_REGISTRY_VALUE,
+            {
+                "key_value_pairs": [
+                    {
+                        "key": (
+                            "HKEY_LOCAL_MACHINE\\System\\CurrentControlSet\\"
+                            "Services\\Tcpip\\Parameters"
+                        ),
+                        "value": "Domain",
+                    }
+                ]
+            },
+        )
+        domain_definition.Compact()
+
+        test_index = registry_key_index.WindowsRegistryKeyIndex()
+        test_index.Build([services_definition, run_definition, domain_definition])
+        return test_index
+
+    def _GetMatchedNames(self, test_index, key_path, value_name=None):
+        """Retrieves the names of the artifact definitions that match a key.
+
+        Args:
+          test_index (WindowsRegistryKeyIndex): Windows Registry key index.
+          key_path (str): key path.
+          value_name (Optional[str]): value name.
+
+        Returns:
+          set[str]: names of the artifact definitions that match the key.
+        """
+        matches = test_index.GetMatches(key_path, value_name=value_name)
+        return {artifact_definition.name for artifact_definition, _, _, _ in matches}
+
+    def testGetLookupSegments(self):
+        """Tests the _GetLookupSegments function."""
+        test_index = registry_key_index.WindowsRegistryKeyIndex()
+
+        segments = test_index._GetLookupSegments(
+            "HKEY_LOCAL_MACHINE\\SYSTEM\\ControlSet002\\Services"
+        )
+        self.assertEqual(
+            segments,
+            ["hkey_local_machine", "system", "currentcontrolset", "services"],
+        )
+
+        segments = test_index._GetLookupSegments("HKEY_USERS\\ControlSet001")
+        self.assertEqual(segments, ["hkey_users", "controlset001"])
+
+    def testGetMatches(self):
+        """Tests the GetMatches function."""
+        test_index = self._CreateTestIndex()
+
+        self.assertEqual(
+            self._GetMatchedNames(
+                test_index,
+                "HKEY_LOCAL_MACHINE\\System\\CurrentControlSet\\Services\\Foo",
+            ),
+            {"Services"},
+        )
+        self.assertEqual(
+            self._GetMatchedNames(
+                test_index, "hkey_local_machine\\SYSTEM\\ControlSet001\\services\\foo"
+            ),
+            {"Services"},
+        )
+        self.assertEqual(
+            self._GetMatchedNames(
+                test_index, "HKEY_LOCAL_MACHINE\\System\\CurrentControlSet\\Services"
+            ),
+            set(),
+        )
+
+        # A path variable matches a single segment.
+        key_path = (
+            "HKEY_USERS\\S-1-5-21-1-2-3-1001\\Software\\Microsoft\\Windows\\"
+            "CurrentVersion\\Run"
+        )
+        self.assertEqual(self._GetMatchedNames(test_index, key_path), {"Run"})
+
+        key_path = (
+            "HKEY_USERS\\S-1-5-21-1-2-3-1001\\Classes\\Software\\Microsoft\\"
+            "Windows\\CurrentVersion\\Run"
+        )
+        self.assertEqual(self._GetMatchedNames(test_index, key_path), set())
+
+        matches = test_index.GetMatches("HKEY_USERS\\.DEFAULT\\Software")
+        self.assertEqual(matches, [])
+
+    def testGetMatchesWithValueName(self):
+        """Tests the GetMatches function with a value name."""
+        test_index = self._CreateTestIndex()
+
+        key_path = "HKEY_LOCAL_MACHINE\\System\\ControlSet001\\Services\\Tcpip"
+        self.assertEqual(
+            self._GetMatchedNames(test_index, key_path, value_name="Start"),
+            {"Services"},
+        )
+
+        key_path = (
+            "HKEY_LOCAL_MACHINE\\System\\ControlSet001\\Services\\Tcpip\\Parameters"
+        )
+        self.assertEqual(self._GetMatchedNames(test_index, key_path), {"Domain"})
+        self.assertEqual(
+            self._GetMatchedNames(test_index, key_path, value_name="DOMAIN"),
+            {"Domain"},
+        )
+        self.assertEqual(
+            self._GetMatchedNames(test_index, key_path, value_name="Hostname"), set()
+        )
+
+        matches = test_index.GetMatches(key_path, value_name="domain")
+        self.assertEqual(len(matches), 1)
+        artifact_definition, source, matched_key_path, value_name = matches[0]
+        self.assertEqual(artifact_definition.name, "Domain")
+        self.assertIs(source, artifact_definition.sources[0])
+        self.assertEqual(
+            matched_key_path,
+            (
+                "HKEY_LOCAL_MACHINE\\System\\CurrentControlSet\\Services\\Tcpip\\"
+                "Parameters"
+            ),
+        )
+        self.assertEqual(value_name, "Domain")
+
+    def testGetMatchesWithValueNameGlob(self):
+        """Tests the GetMatches function with a value name glob."""
+        mru_definition = artifact.ArtifactDefinition("MRU")
+        mru_definition.AppendSource(
+            definitions.TYPE_INDICATOR_WINDOWS_REGISTRY_VALUE,
+            {
+                "key_value_pairs": [
+                    {
+                        "key": "HKEY_USERS\\%%users.sid%%\\Software\\MRU",
+                        "value": "Item *",
+                    }
+                ]
+            },
+        )
+
+        test_index = registry_key_index.WindowsRegistryKeyIndex()
+        test_index.Build([mru_definition])
+
+        key_path = "HKEY_USERS\\S-1-5-21-1-2-3-1001\\Software\\MRU"
+        self.assertEqual(
+            self._GetMatchedNames(test_index, key_path, value_name="Item 1"), {"MRU"}
+        )
+        self.assertEqual(
+            self._GetMatchedNames(test_index, key_path, value_name="ITEM 12"),
+            {"MRU"},
+        )
+        self.assertEqual(
+            self._GetMatchedNames(test_index, key_path, value_name="Max Display"),
+            set(),
+        )
+
+    def testGetMatchesWithBundledDefinitions(self):
+        """Tests the GetMatches function with the bundled artifact definitions."""
+        artifact_reader = reader.YamlArtifactsReader()
+        artifact_registry = registry.ArtifactDefinitionsRegistry()
+        artifact_registry.ReadFromDirectory(artifact_reader, self._DATA_PATH)
+
+        test_index = registry_key_index.WindowsRegistryKeyIndex()
+        test_index.Build(artifact_registry.GetDefinitions())
+
+        key_path = (
+            "HKEY_USERS\\S-1-5-21-1-2-3-1001\\Software\\Microsoft\\Windows\\"
+            "CurrentVersion\\Run\\Updater"
+        )
+        names = self._GetMatchedNames(test_index, key_path)
+        self.assertIn("WindowsRunKeys", names)
+
+        key_path = (
+            "HKEY_LOCAL_MACHINE\\Software\\Google\\Chrome\\Extensions\\"
+            "abcdefghijklmnop"
+        )
+        names = self._GetMatchedNames(test_index, key_path)
+        self.assertIn("ChromeExtensionRegistryKeys", names)
+
+        key_path = (
+            "HKEY_USERS\\S-1-5-21-1\\Software\\Microsoft\\Office\\16.0\\Word\\"
+            "File MRU"
+        )
+        names = self._GetMatchedNames(test_index, key_path, value_name="Item 1")
+        self.assertIn("MicrosoftOfficeMRU", names)
+
+
+if __name__ == "__main__":
+    unittest.main()
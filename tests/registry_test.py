@@ -1,11 +1,19 @@
 """Tests for the artifact definitions registry."""
 
+import asyncio
+import concurrent.futures
+import gc
 import io
+import os
+import shutil
 import unittest
 
+from artifacts import artifact
+from artifacts import definitions
 from artifacts import errors
 from artifacts import reader
 from artifacts import registry
+from artifacts.scripts import build_snapshot
 
 from tests import test_lib
 
@@ -75,6 +83,694 @@ class ArtifactDefinitionsRegistryTest(test_lib.BaseTestCase):
         with self.assertRaises(errors.FormatError):
             next(generator)
 
+    def testDeregisterDefinition(self):
+        """Tests the DeregisterDefinition function."""
+        test_file = self._GetTestFilePath(["definitions.yaml"])
+        self._SkipIfPathNotExists(test_file)
+
+        artifact_registry = registry.ArtifactDefinitionsRegistry()
+        artifact_registry.ReadFromFile(reader.YamlArtifactsReader(), test_file)
+
+        expected_undefined_artifacts = {
+            "ApplicationEventLog",
+            "ApplicationEventLogEvtx",
+            "SecurityEventLog",
+            "SecurityEventLogEvtx",
+            "SystemEventLog",
+            "SystemEventLogEvtx",
+        }
+        self.assertEqual(
+            artifact_registry.GetUndefinedArtifacts(), expected_undefined_artifacts
+        )
+
+        artifact_definition = artifact_registry.GetDefinitionByName("EventLogs")
+        artifact_registry.DeregisterDefinition(artifact_definition)
+
+        self.assertEqual(artifact_registry.GetUndefinedArtifacts(), set())
+
+    def testDeregisterDefinitionWithChangedDefinition(self):
+        """Tests the DeregisterDefinition function with a changed definition."""
+        test_file = self._GetTestFilePath(["definitions.yaml"])
+        self._SkipIfPathNotExists(test_file)
+
+        artifact_registry = registry.ArtifactDefinitionsRegistry()
+        artifact_registry.ReadFromFile(reader.YamlArtifactsReader(), test_file)
+
+        analysis = artifact_registry.AnalyzeArtifactGroups()
+        self.assertIn("EventLogs", analysis.dangling_references)
+
+        # The registered artifact definition is deregistered, not the changed
+        # artifact definition with the same name but without sources.
+        changed_definition = artifact.ArtifactDefinition("EventLogs")
+        artifact_registry.DeregisterDefinition(changed_definition)
+
+        self.assertIsNone(artifact_registry.GetDefinitionByName("EventLogs"))
+        self.assertEqual(artifact_registry.GetUndefinedArtifacts(), set())
+        self.assertEqual(
+            artifact_registry.GetSources(
+                type_indicator=definitions.TYPE_INDICATOR_ARTIFACT_GROUP
+            ),
+            [],
+        )
+
+        analysis = artifact_registry.AnalyzeArtifactGroups()
+        self.assertEqual(analysis.dangling_references, {})
+
+    def testReplaceDefinitions(self):
+        """Tests the ReplaceDefinitions function."""
+        test_file = self._GetTestFilePath(["definitions.yaml"])
+        self._SkipIfPathNotExists(test_file)
+
+        artifact_reader = reader.YamlArtifactsReader()
+
+        artifact_registry = registry.ArtifactDefinitionsRegistry()
+        artifact_registry.ReadFromFile(artifact_reader, test_file)
+
+        expected_undefined_artifacts = artifact_registry.GetUndefinedArtifacts()
+
+        artifact_definitions = list(artifact_registry.GetDefinitions())
+        replacement_definitions = list(artifact_reader.ReadFile(test_file))
+
+        artifact_registry.ReplaceDefinitions(
+            artifact_definitions[:2], replacement_definitions[:2]
+        )
+
+        definitions = list(artifact_registry.GetDefinitions())
+        self.assertEqual(len(definitions), 7)
+        self.assertIs(
+            artifact_registry.GetDefinitionByName(replacement_definitions[0].name),
+            replacement_definitions[0],
+        )
+        self.assertIs(
+            artifact_registry.GetDefinitionByAlias("SecurityEventLogEvtx"),
+            replacement_definitions[0],
+        )
+
+        # Registering a duplicate definition should leave the registry unchanged.
+        with self.assertRaises(KeyError):
+            artifact_registry.ReplaceDefinitions(
+                replacement_definitions[:1], replacement_definitions[1:3]
+            )
+
+        self.assertIs(
+            artifact_registry.GetDefinitionByName(replacement_definitions[0].name),
+            replacement_definitions[0],
+        )
+        self.assertEqual(
+            artifact_registry.GetUndefinedArtifacts(), expected_undefined_artifacts
+        )
+
+    def testReplaceDefinitionsWithArtifactGroupsGraph(self):
+        """Tests the ReplaceDefinitions function with an artifact groups graph."""
+        test_file = self._GetTestFilePath(["definitions.yaml"])
+        self._SkipIfPathNotExists(test_file)
+
+        artifact_reader = reader.YamlArtifactsReader()
+
+        artifact_registry = registry.ArtifactDefinitionsRegistry()
+        artifact_registry.ReadFromFile(artifact_reader, test_file)
+
+        analysis = artifact_registry.AnalyzeArtifactGroups()
+        expected_dangling_references = analysis.dangling_references
+
+        group_definition = artifact.ArtifactDefinition("TestGroup")
+        group_definition.AppendSource(
+            definitions.TYPE_INDICATOR_ARTIFACT_GROUP, {"names": ["TestMissing"]}
+        )
+        duplicate_definition = artifact_registry.GetDefinitionByName("EventLogs")
+
+        # Registering a duplicate definition should leave the graph unchanged.
+        with self.assertRaises(KeyError):
+            artifact_registry.ReplaceDefinitions(
+                [], [group_definition, duplicate_definition]
+            )
+
+        analysis = artifact_registry.AnalyzeArtifactGroups()
+        self.assertEqual(analysis.dangling_references, expected_dangling_references)
+
+        artifact_registry.ReplaceDefinitions([], [group_definition])
+
+        analysis = artifact_registry.AnalyzeArtifactGroups()
+        self.assertEqual(analysis.dangling_references["TestGroup"], ["TestMissing"])
+
+    def testReadFromDirectoryWithWorkers(self):
+        """Tests the ReadFromDirectory function with worker processes."""
+        artifact_reader = reader.YamlArtifactsReader()
+
+        artifact_registry = registry.ArtifactDefinitionsRegistry()
+        artifact_registry.ReadFromDirectory(artifact_reader, self._DATA_PATH)
+
+        expected_names = [
+            artifact_definition.name
+            for artifact_definition in artifact_registry.GetDefinitions()
+        ]
+
+        artifact_registry = registry.ArtifactDefinitionsRegistry()
+        artifact_registry.ReadFromDirectory(
+            artifact_reader, self._DATA_PATH, number_of_workers=4
+        )
+
+        names = [
+            artifact_definition.name
+            for artifact_definition in artifact_registry.GetDefinitions()
+        ]
+        self.assertEqual(names, expected_names)
+
+        with self.assertRaises(KeyError):
+            artifact_registry.ReadFromDirectory(
+                artifact_reader, self._DATA_PATH, number_of_workers=4
+            )
+
+    def testReadFromDirectoryOperatingSystems(self):
+        """Tests the ReadFromDirectory function with operating systems."""
+        artifact_reader = reader.YamlArtifactsReader()
+
+        artifact_registry = registry.ArtifactDefinitionsRegistry()
+        artifact_registry.ReadFromDirectory(artifact_reader, self._DATA_PATH)
+
+        expected_undefined_artifacts = artifact_registry.GetUndefinedArtifacts()
+        number_of_definitions = len(list(artifact_registry.GetDefinitions()))
+
+        artifact_registry = registry.ArtifactDefinitionsRegistry()
+        artifact_registry.ReadFromDirectory(
+            artifact_reader, self._DATA_PATH, operating_systems={"Linux"}
+        )
+
+        artifact_definitions = list(artifact_registry.GetDefinitions())
+        self.assertLess(len(artifact_definitions), number_of_definitions)
+        self.assertGreater(len(artifact_registry._filtered_artifact_names), 0)
+        self.assertEqual(
+            artifact_registry.GetUndefinedArtifacts(), expected_undefined_artifacts
+        )
+
+        # Filtering by the reader should give the same result.
+        artifact_reader = reader.YamlArtifactsReader(operating_systems={"Linux"})
+
+        lazy_registry = registry.LazyArtifactDefinitionsRegistry()
+        lazy_registry.ReadFromDirectory(artifact_reader, self._DATA_PATH)
+
+        self.assertEqual(
+            [
+                artifact_definition.AsDict()
+                for artifact_definition in lazy_registry.GetDefinitions()
+            ],
+            [
+                artifact_definition.AsDict()
+                for artifact_definition in artifact_definitions
+            ],
+        )
+        self.assertEqual(
+            lazy_registry._filtered_artifact_names,
+            artifact_registry._filtered_artifact_names,
+        )
+        self.assertEqual(
+            lazy_registry.GetUndefinedArtifacts(), expected_undefined_artifacts
+        )
+
+    def testReadFromDirectoriesAsync(self):
+        """Tests the ReadFromDirectoriesAsync function."""
+        artifact_reader = reader.YamlArtifactsReader()
+
+        with test_lib.TempDirectory() as temporary_directory:
+            # Spread the definitions files over multiple directories.
+            paths = [
+                os.path.join(temporary_directory, "first"),
+                os.path.join(temporary_directory, "second"),
+            ]
+            filenames = artifact_reader.GetDirectoryFilenames(self._DATA_PATH)
+            for index, path in enumerate(paths):
+                os.mkdir(path)
+                for filename in filenames[index :: len(paths)]:
+                    shutil.copy(filename, path)
+
+            artifact_registry = registry.ArtifactDefinitionsRegistry()
+            for path in paths:
+                artifact_registry.ReadFromDirectory(artifact_reader, path)
+
+            expected_names = [
+                artifact_definition.name
+                for artifact_definition in artifact_registry.GetDefinitions()
+            ]
+
+            with concurrent.futures.ThreadPoolExecutor(4) as thread_pool:
+                for executor in (None, thread_pool):
+                    artifact_registry = registry.ArtifactDefinitionsRegistry()
+                    asyncio.run(
+                        artifact_registry.ReadFromDirectoriesAsync(
+                            artifact_reader, paths, executor=executor
+                        )
+                    )
+
+                    names = [
+                        artifact_definition.name
+                        for artifact_definition in artifact_registry.GetDefinitions()
+                    ]
+                    self.assertEqual(names, expected_names)
+
+            with self.assertRaises(KeyError):
+                asyncio.run(
+                    artifact_registry.ReadFromFilesAsync(artifact_reader, filenames)
+                )
+
+    def testReadFromFilesAsyncWithErrors(self):
+        """Tests the ReadFromFilesAsync function with errors."""
+        test_file = self._GetTestFilePath(["definitions.yaml"])
+        self._SkipIfPathNotExists(test_file)
+
+        artifact_reader = reader.YamlArtifactsReader()
+
+        with test_lib.TempDirectory() as temporary_directory:
+            filenames = [test_file]
+            for index in range(2):
+                invalid_file = os.path.join(temporary_directory, f"test{index:d}.yaml")
+                with open(invalid_file, "w", encoding="utf-8") as file_object:
+                    file_object.write(f"name: Invalid{index:d}\nsources: []\n")
+                filenames.append(invalid_file)
+
+            artifact_registry = registry.ArtifactDefinitionsRegistry()
+            with self.assertRaisesRegex(errors.FormatError, "test0.yaml"):
+                asyncio.run(
+                    artifact_registry.ReadFromFilesAsync(artifact_reader, filenames)
+                )
+
+        # The files before the first file with an error are registered.
+        self.assertEqual(len(list(artifact_registry.GetDefinitions())), 7)
+
+    def testExpandArtifactGroups(self):
+        """Tests the ExpandArtifactGroups function."""
+        artifact_reader = reader.YamlArtifactsReader()
+
+        artifact_registry = registry.ArtifactDefinitionsRegistry()
+        artifact_registry.ReadFromDirectory(artifact_reader, self._DATA_PATH)
+
+        def _ExpandNames(names, expanded_names):
+            for name in names:
+                artifact_definition = artifact_registry.GetDefinitionByName(name)
+                if not artifact_definition or name in expanded_names:
+                    continue
+
+                expanded_names.add(name)
+                for source in artifact_definition.sources:
+                    if (
+                        source.type_indicator
+                        == definitions.TYPE_INDICATOR_ARTIFACT_GROUP
+                    ):
+                        _ExpandNames(source.names, expanded_names)
+
+        triage_names = [
+            artifact_definition.name
+            for artifact_definition in artifact_registry.GetDefinitions()
+            if artifact_definition.name.startswith("Triage")
+        ]
+
+        expanded_names = set()
+        _ExpandNames(triage_names, expanded_names)
+        expected_names = {
+            name
+            for name in expanded_names
+            if any(
+                source.type_indicator != definitions.TYPE_INDICATOR_ARTIFACT_GROUP
+                for source in artifact_registry.GetDefinitionByName(name).sources
+            )
+        }
+
+        leaf_definitions = artifact_registry.ExpandArtifactGroups(triage_names)
+        names = [artifact_definition.name for artifact_definition in leaf_definitions]
+        self.assertEqual(len(names), len(set(names)))
+        self.assertEqual(set(names), expected_names)
+
+        # Expanding the names one by one gives the same leaf definitions.
+        names = []
+        for name in triage_names:
+            for artifact_definition in artifact_registry.ExpandArtifactGroups(name):
+                if artifact_definition.name not in names:
+                    names.append(artifact_definition.name)
+
+        self.assertEqual(
+            names,
+            [artifact_definition.name for artifact_definition in leaf_definitions],
+        )
+
+        leaf_definitions = artifact_registry.ExpandArtifactGroups(
+            triage_names, operating_systems={"Linux"}
+        )
+        self.assertGreater(len(leaf_definitions), 0)
+        for artifact_definition in leaf_definitions:
+            for source in artifact_definition.sources:
+                supported_os = source.supported_os or artifact_definition.supported_os
+                if supported_os:
+                    self.assertIn("Linux", supported_os)
+
+        self.assertEqual(artifact_registry.ExpandArtifactGroups("Bogus"), [])
+
+    def testExpandArtifactGroupsWithChanges(self):
+        """Tests the ExpandArtifactGroups function with registry changes."""
+        artifact_reader = reader.YamlArtifactsReader()
+
+        artifact_registry = registry.ArtifactDefinitionsRegistry()
+        artifact_registry.ReadFileObject(
+            artifact_reader,
+            io.StringIO(
+                "name: GroupA\n"
+                "doc: Group A.\n"
+                "sources:\n"
+                "- type: ARTIFACT_GROUP\n"
+                "  attributes:\n"
+                "    names: [GroupB, FileA]\n"
+                "---\n"
+                "name: GroupB\n"
+                "doc: Group B.\n"
+                "sources:\n"
+                "- type: ARTIFACT_GROUP\n"
+                "  attributes:\n"
+                "    names: [GroupA, FileB, FileC]\n"
+                "---\n"
+                "name: FileA\n"
+                "doc: File A.\n"
+                "sources:\n"
+                "- type: FILE\n"
+                "  attributes:\n"
+                "    paths: ['/a']\n"
+                "---\n"
+                "name: FileB\n"
+                "doc: File B.\n"
+                "sources:\n"
+                "- type: FILE\n"
+                "  attributes:\n"
+                "    paths: ['/b']\n"
+            ),
+        )
+
+        # GroupA and GroupB reference each other.
+        for _ in range(2):
+            leaf_definitions = artifact_registry.ExpandArtifactGroups("GroupA")
+            self.assertEqual(
+                [artifact_definition.name for artifact_definition in leaf_definitions],
+                ["FileB", "FileA"],
+            )
+
+            leaf_definitions = artifact_registry.ExpandArtifactGroups("groupb")
+            self.assertEqual(
+                [artifact_definition.name for artifact_definition in leaf_definitions],
+                ["FileA", "FileB"],
+            )
+
+        # The expansions of groups in a cycle are not memoized.
+        self.assertEqual(
+            set(artifact_registry._expanded_artifact_groups),
+            {("filea", None), ("fileb", None)},
+        )
+
+        artifact_registry.ReadFileObject(
+            artifact_reader,
+            io.StringIO(
+                "name: FileC\n"
+                "doc: File C.\n"
+                "sources:\n"
+                "- type: FILE\n"
+                "  attributes:\n"
+                "    paths: ['/c']\n"
+            ),
+        )
+        self.assertEqual(len(artifact_registry._expanded_artifact_groups), 0)
+
+        leaf_definitions = artifact_registry.ExpandArtifactGroups("GroupA")
+        self.assertEqual(
+            [artifact_definition.name for artifact_definition in leaf_definitions],
+            ["FileB", "FileC", "FileA"],
+        )
+
+        artifact_registry.DeregisterDefinition(
+            artifact_registry.GetDefinitionByName("FileB")
+        )
+        leaf_definitions = artifact_registry.ExpandArtifactGroups("GroupA")
+        self.assertEqual(
+            [artifact_definition.name for artifact_definition in leaf_definitions],
+            ["FileC", "FileA"],
+        )
+
+    def _GetExpectedSources(
+        self, artifact_registry, operating_system=None, path_variable=None
+    ):
+        """Retrieves the expected sources by iterating over all definitions.
+
+        Args:
+          artifact_registry (ArtifactDefinitionsRegistry): artifact definitions
+              registry.
+          operating_system (Optional[str]): operating system the sources apply
+              to, where None represents any.
+          path_variable (Optional[str]): path variable the sources use, where
+              None represents any.
+
+        Returns:
+          list[tuple[str, str]]: names of the artifact definitions and type
+              indicators of the sources.
+        """
+        expected_sources = []
+        for artifact_definition in artifact_registry.GetDefinitions():
+            sources = artifact_definition.sources
+            if operating_system is not None:
+                filtered_definition = artifact_definition.FilterByOS({operating_system})
+                sources = filtered_definition.sources if filtered_definition else []
+
+            for source in sources:
+                if path_variable is not None:
+                    values = source.AsDict().get("paths", [])
+                    values += source.AsDict().get("keys", [])
+                    if not any(path_variable in value for value in values):
+                        continue
+
+                expected_sources.append(
+                    (artifact_definition.name, source.type_indicator)
+                )
+
+        return expected_sources
+
+    def _GetSourceNames(self, sources):
+        """Retrieves the names of the artifact definitions and sources.
+
+        Args:
+          sources (list[tuple[ArtifactDefinition, SourceType]]): artifact
+              definitions and sources.
+
+        Returns:
+          list[tuple[str, str]]: names of the artifact definitions and type
+              indicators of the sources.
+        """
+        return [
+            (artifact_definition.name, source.type_indicator)
+            for artifact_definition, source in sources
+        ]
+
+    def testGetDefinitionsByOperatingSystem(self):
+        """Tests the GetDefinitionsByOperatingSystem function."""
+        artifact_reader = reader.YamlArtifactsReader()
+
+        artifact_registry = registry.ArtifactDefinitionsRegistry()
+        artifact_registry.ReadFromDirectory(artifact_reader, self._DATA_PATH)
+
+        for operating_system in definitions.SUPPORTED_OS:
+            expected_names = [
+                artifact_definition.name
+                for artifact_definition in artifact_registry.GetDefinitions()
+                if artifact_definition.FilterByOS({operating_system})
+            ]
+            artifact_definitions = artifact_registry.GetDefinitionsByOperatingSystem(
+                operating_system
+            )
+            self.assertEqual(
+                [
+                    artifact_definition.name
+                    for artifact_definition in artifact_definitions
+                ],
+                expected_names,
+            )
+
+        artifact_definitions = artifact_registry.GetDefinitionsByOperatingSystem(
+            "Bogus"
+        )
+        self.assertEqual(artifact_definitions, [])
+
+    def testGetSources(self):
+        """Tests the GetSources function."""
+        artifact_reader = reader.YamlArtifactsReader()
+
+        artifact_registry = registry.ArtifactDefinitionsRegistry()
+        artifact_registry.ReadFromDirectory(artifact_reader, self._DATA_PATH)
+
+        sources = artifact_registry.GetSources(
+            operating_system=definitions.SUPPORTED_OS_LINUX,
+            type_indicator=definitions.TYPE_INDICATOR_FILE,
+        )
+        expected_sources = [
+            source
+            for source in self._GetExpectedSources(
+                artifact_registry, operating_system=definitions.SUPPORTED_OS_LINUX
+            )
+            if source[1] == definitions.TYPE_INDICATOR_FILE
+        ]
+        self.assertTrue(expected_sources)
+        self.assertEqual(self._GetSourceNames(sources), expected_sources)
+
+        sources = artifact_registry.GetSources(path_variable="%%USERS.LOCALAPPDATA%%")
+        expected_sources = self._GetExpectedSources(
+            artifact_registry, path_variable="%%users.localappdata%%"
+        )
+        self.assertTrue(expected_sources)
+        self.assertEqual(self._GetSourceNames(sources), expected_sources)
+
+        sources = artifact_registry.GetSources(
+            operating_system=definitions.SUPPORTED_OS_WINDOWS,
+            path_variable="%%users.sid%%",
+            type_indicator=definitions.TYPE_INDICATOR_WINDOWS_REGISTRY_KEY,
+        )
+        self.assertTrue(sources)
+        for artifact_definition, source in sources:
+            self.assertEqual(
+                source.type_indicator, definitions.TYPE_INDICATOR_WINDOWS_REGISTRY_KEY
+            )
+            self.assertTrue(any("%%users.sid%%" in key for key in source.keys))
+
+        sources = artifact_registry.GetSources()
+        self.assertEqual(
+            self._GetSourceNames(sources), self._GetExpectedSources(artifact_registry)
+        )
+
+        # The secondary indexes are updated when the definitions change.
+        artifact_definition = artifact_registry.GetDefinitionByName(
+            "BashShellHistoryFile"
+        )
+        artifact_registry.DeregisterDefinition(artifact_definition)
+
+        sources = artifact_registry.GetSources(path_variable="%%users.homedir%%")
+        self.assertNotIn(
+            "BashShellHistoryFile",
+            [artifact_definition.name for artifact_definition, _ in sources],
+        )
+
+        artifact_registry.ReplaceDefinitions([], [artifact_definition])
+
+        sources = artifact_registry.GetSources(path_variable="%%users.homedir%%")
+        self.assertEqual(
+            self._GetSourceNames(sources),
+            self._GetExpectedSources(
+                artifact_registry, path_variable="%%users.homedir%%"
+            ),
+        )
+
+        artifact_registry.ReplaceDefinitions(
+            list(artifact_registry.GetDefinitions()), []
+        )
+        self.assertEqual(artifact_registry._sources_by_operating_system, {})
+        self.assertEqual(artifact_registry._sources_by_path_variable, {})
+        self.assertEqual(artifact_registry._sources_by_type_indicator, {})
+        self.assertEqual(
+            artifact_registry._artifact_definitions_by_operating_system, {}
+        )
+
+    def testGetSourcesWithChanges(self):
+        """Tests the GetSources function with changes between queries."""
+        artifact_reader = reader.YamlArtifactsReader()
+
+        artifact_registry = registry.ArtifactDefinitionsRegistry()
+        artifact_registry.ReadFromDirectory(artifact_reader, self._DATA_PATH)
+
+        indexed_definitions = []
+        add_to_secondary_indexes = artifact_registry._AddToSecondaryIndexes
+
+        def _AddToSecondaryIndexes(artifact_definition):
+            """Adds an artifact definition to the secondary indexes."""
+            indexed_definitions.append(artifact_definition.name)
+            add_to_secondary_indexes(artifact_definition)
+
+        artifact_registry._AddToSecondaryIndexes = _AddToSecondaryIndexes
+
+        artifact_definition = artifact_registry.GetDefinitionByName(
+            "BashShellHistoryFile"
+        )
+        for _ in range(3):
+            artifact_registry.DeregisterDefinition(artifact_definition)
+
+            sources = artifact_registry.GetSources(
+                operating_system=definitions.SUPPORTED_OS_LINUX,
+                path_variable="%%users.homedir%%",
+            )
+            self.assertNotIn(
+                "BashShellHistoryFile",
+                [artifact_definition.name for artifact_definition, _ in sources],
+            )
+            self.assertNotIn(
+                artifact_definition,
+                artifact_registry.GetDefinitionsByOperatingSystem(
+                    definitions.SUPPORTED_OS_LINUX
+                ),
+            )
+
+            artifact_registry.RegisterDefinition(artifact_definition)
+
+            sources = artifact_registry.GetSources(
+                type_indicator=definitions.TYPE_INDICATOR_FILE
+            )
+            self.assertIn(
+                "BashShellHistoryFile",
+                [artifact_definition.name for artifact_definition, _ in sources],
+            )
+
+        # Only the registered artifact definition was added to the secondary
+        # indexes, which are not rebuilt by the queries.
+        self.assertEqual(indexed_definitions, ["BashShellHistoryFile"] * 3)
+
+    def testCreateSourceType(self):
+        """Tests the CreateSourceType function with compiled validators."""
+        artifact_reader = reader.YamlArtifactsReader()
+
+        for artifact_definition in artifact_reader.ReadDirectory(self._DATA_PATH):
+            for source in artifact_definition.sources:
+                attributes = source.AsDict()
+                source_type_class = type(source)
+
+                source_object = registry.ArtifactDefinitionsRegistry.CreateSourceType(
+                    source.type_indicator, attributes
+                )
+                self.assertIs(type(source_object), source_type_class)
+                self.assertEqual(
+                    source_object.AsDict(), source_type_class(**attributes).AsDict()
+                )
+
+        with self.assertRaises(errors.FormatError) as context_manager:
+            registry.ArtifactDefinitionsRegistry.CreateSourceType(
+                "REGISTRY_KEY", {"keys": ["HKEY_CURRENT_USER\\test"]}
+            )
+
+        self.assertEqual(
+            str(context_manager.exception),
+            "HKEY_CURRENT_USER\\ is not supported instead use: "
+            "HKEY_USERS\\%%users.sid%%\\",
+        )
+
+    def testGetSchemaIdentifier(self):
+        """Tests the GetSchemaIdentifier function."""
+        schema_identifier = registry.ArtifactDefinitionsRegistry.GetSchemaIdentifier()
+        self.assertEqual(len(schema_identifier), 64)
+
+        registry.ArtifactDefinitionsRegistry.RegisterSourceType(test_lib.TestSourceType)
+
+        try:
+            self.assertNotEqual(
+                registry.ArtifactDefinitionsRegistry.GetSchemaIdentifier(),
+                schema_identifier,
+            )
+
+        finally:
+            registry.ArtifactDefinitionsRegistry.DeregisterSourceType(
+                test_lib.TestSourceType
+            )
+
+        self.assertEqual(
+            registry.ArtifactDefinitionsRegistry.GetSchemaIdentifier(),
+            schema_identifier,
+        )
+
     def testSourceTypeFunctions(self):
         """Tests the source type functions."""
         number_of_source_types = len(
@@ -138,5 +834,391 @@ class ArtifactDefinitionsRegistryTest(test_lib.BaseTestCase):
         )
 
 
+class FrozenArtifactDefinitionsRegistryTest(test_lib.BaseTestCase):
+    """Tests for the frozen artifact definitions registry."""
+
+    # pylint: disable=protected-access
+
+    def testFreeze(self):
+        """Tests the Freeze function."""
+        test_file = self._GetTestFilePath(["definitions.yaml"])
+        self._SkipIfPathNotExists(test_file)
+
+        artifact_reader = reader.YamlArtifactsReader()
+
+        artifact_registry = registry.ArtifactDefinitionsRegistry()
+        artifact_registry.ReadFromFile(artifact_reader, test_file)
+
+        expected_definitions = [
+            artifact_definition.AsDict()
+            for artifact_definition in artifact_registry.GetDefinitions()
+        ]
+        expected_undefined_artifacts = artifact_registry.GetUndefinedArtifacts()
+        expected_sources = [
+            (artifact_definition.name, source.AsDict())
+            for artifact_definition, source in artifact_registry.GetSources(
+                operating_system=definitions.SUPPORTED_OS_WINDOWS
+            )
+        ]
+        expected_windows_names = [
+            artifact_definition.name
+            for artifact_definition in (
+                artifact_registry.GetDefinitionsByOperatingSystem(
+                    definitions.SUPPORTED_OS_WINDOWS
+                )
+            )
+        ]
+
+        frozen_registry = artifact_registry.Freeze()
+        self.assertIsInstance(
+            frozen_registry, registry.FrozenArtifactDefinitionsRegistry
+        )
+        self.assertIs(frozen_registry.Freeze(), frozen_registry)
+
+        artifact_definitions = list(frozen_registry.GetDefinitions())
+        self.assertEqual(
+            [
+                artifact_definition.AsDict()
+                for artifact_definition in artifact_definitions
+            ],
+            expected_definitions,
+        )
+        self.assertEqual(
+            frozen_registry.GetUndefinedArtifacts(), expected_undefined_artifacts
+        )
+
+        sources = frozen_registry.GetSources(
+            operating_system=definitions.SUPPORTED_OS_WINDOWS
+        )
+        self.assertEqual(
+            [
+                (artifact_definition.name, source.AsDict())
+                for artifact_definition, source in sources
+            ],
+            expected_sources,
+        )
+        for artifact_definition, source in sources:
+            self.assertIn(source, artifact_definition.sources)
+
+        artifact_definitions = frozen_registry.GetDefinitionsByOperatingSystem(
+            definitions.SUPPORTED_OS_WINDOWS
+        )
+        self.assertEqual(
+            [artifact_definition.name for artifact_definition in artifact_definitions],
+            expected_windows_names,
+        )
+
+        with self.assertRaises(TypeError):
+            frozen_registry._sources_by_type_indicator[definitions.TYPE_INDICATOR_FILE][
+                "test"
+            ] = None
+
+        artifact_definition = frozen_registry.GetDefinitionByName("EventLogs")
+        self.assertIsNotNone(artifact_definition)
+        self.assertIsInstance(artifact_definition.sources, tuple)
+        self.assertIsInstance(artifact_definition.sources[0].names, tuple)
+
+        # The artifact definitions of the registry itself are not compacted
+        # and can still be modified.
+        artifact_definition = artifact_registry.GetDefinitionByName("EventLogs")
+        self.assertIsNot(
+            artifact_definition, frozen_registry.GetDefinitionByName("EventLogs")
+        )
+        self.assertIsInstance(artifact_definition.sources, list)
+        self.assertIsInstance(artifact_definition.sources[0].names, list)
+
+        artifact_definition.AppendSource(
+            definitions.TYPE_INDICATOR_ARTIFACT_GROUP, {"names": ["TestMissing"]}
+        )
+        self.assertEqual(len(artifact_definition.sources), 2)
+        self.assertEqual(
+            len(frozen_registry.GetDefinitionByName("EventLogs").sources), 1
+        )
+
+        artifact_definition = frozen_registry.GetDefinitionByAlias(
+            "SecurityEventLogEvtx"
+        )
+        self.assertIsNotNone(artifact_definition)
+
+        with self.assertRaises(TypeError):
+            frozen_registry._artifact_definitions_by_name["test"] = None
+
+        with self.assertRaises(TypeError):
+            frozen_registry.DeregisterDefinition(artifact_definition)
+
+        with self.assertRaises(TypeError):
+            frozen_registry.RegisterDefinition(artifact_definition)
+
+        with self.assertRaises(TypeError):
+            frozen_registry.ReplaceDefinitions([artifact_definition], [])
+
+        with self.assertRaises(TypeError):
+            frozen_registry.ReadFromFile(artifact_reader, test_file)
+
+        self.assertEqual(len(list(frozen_registry.GetDefinitions())), 7)
+
+        lazy_registry = registry.LazyArtifactDefinitionsRegistry()
+        lazy_registry.ReadFromFile(artifact_reader, test_file)
+
+        try:
+            frozen_registry = lazy_registry.Freeze(gc_freeze=True)
+            self.assertGreater(gc.get_freeze_count(), 0)
+        finally:
+            gc.unfreeze()
+
+        self.assertEqual(
+            [
+                artifact_definition.AsDict()
+                for artifact_definition in frozen_registry.GetDefinitions()
+            ],
+            expected_definitions,
+        )
+
+
+class LoadBundledDefinitionsTest(test_lib.BaseTestCase):
+    """Tests for loading the bundled artifact definitions."""
+
+    def testLoadBundledDefinitions(self):
+        """Tests the LoadBundledDefinitions function."""
+        artifact_reader = reader.YamlArtifactsReader()
+        expected_definitions = sorted(
+            (
+                artifact_definition.AsDict()
+                for artifact_definition in artifact_reader.ReadDirectory(
+                    registry.BUNDLED_DATA_PATH
+                )
+            ),
+            key=lambda artifact_definition: artifact_definition["name"],
+        )
+
+        artifact_registry = registry.LoadBundledDefinitions()
+
+        artifact_definitions = sorted(
+            (
+                artifact_definition.AsDict()
+                for artifact_definition in artifact_registry.GetDefinitions()
+            ),
+            key=lambda artifact_definition: artifact_definition["name"],
+        )
+        self.assertEqual(artifact_definitions, expected_definitions)
+
+    def testLoadBundledDefinitionsFromSnapshot(self):
+        """Tests the LoadBundledDefinitions function with a snapshot."""
+        test_file = self._GetTestFilePath(["definitions.yaml"])
+        self._SkipIfPathNotExists(test_file)
+
+        bundled_data_path = registry.BUNDLED_DATA_PATH
+        bundled_snapshot_path = registry.BUNDLED_SNAPSHOT_PATH
+
+        with test_lib.TempDirectory() as temporary_directory:
+            data_path = os.path.join(temporary_directory, "data")
+            os.mkdir(data_path)
+            shutil.copy(test_file, data_path)
+
+            snapshot_path = os.path.join(temporary_directory, "data.pickle")
+            build_snapshot.BuildSnapshot(data_path, snapshot_path)
+
+            # The definitions file is removed so that the definitions can only
+            # have been loaded from the snapshot.
+            os.remove(os.path.join(data_path, "definitions.yaml"))
+
+            registry.BUNDLED_DATA_PATH = data_path
+            registry.BUNDLED_SNAPSHOT_PATH = snapshot_path
+            try:
+                artifact_registry = registry.LoadBundledDefinitions(verify=False)
+                self.assertEqual(len(list(artifact_registry.GetDefinitions())), 7)
+
+                # A snapshot that does not match the definitions files is not
+                # used.
+                artifact_registry = registry.LoadBundledDefinitions()
+                self.assertEqual(list(artifact_registry.GetDefinitions()), [])
+
+            finally:
+                registry.BUNDLED_DATA_PATH = bundled_data_path
+                registry.BUNDLED_SNAPSHOT_PATH = bundled_snapshot_path
+
+
+class LazyArtifactDefinitionsRegistryTest(test_lib.BaseTestCase):
+    """Tests for the lazy artifact definitions registry."""
+
+    # pylint: disable=protected-access
+
+    def testDeregisterDefinition(self):
+        """Tests the DeregisterDefinition function."""
+        artifact_reader = reader.YamlArtifactsReader()
+
+        artifact_registry = registry.LazyArtifactDefinitionsRegistry()
+        artifact_registry.ReadFromDirectory(artifact_reader, self._TEST_DATA_PATH)
+
+        # Deregister artifact definitions that were indexed but not read.
+        artifact_registry.DeregisterDefinition(artifact.ArtifactDefinition("EventLogs"))
+        artifact_registry.DeregisterDefinition(
+            artifact.ArtifactDefinition("SecurityEventLogEvtxFile")
+        )
+
+        self.assertEqual(len(artifact_registry._index_entries_by_name), 5)
+        self.assertEqual(len(artifact_registry._index_entries_by_alias), 0)
+        self.assertEqual(len(artifact_registry._artifact_definitions_by_name), 0)
+
+        self.assertIsNone(artifact_registry.GetDefinitionByName("EventLogs"))
+        self.assertIsNone(
+            artifact_registry.GetDefinitionByAlias("SecurityEventLogEvtx")
+        )
+
+        with self.assertRaises(KeyError):
+            artifact_registry.DeregisterDefinition(
+                artifact.ArtifactDefinition("EventLogs")
+            )
+
+        # Deregister an artifact definition that was read.
+        artifact_definition = artifact_registry.GetDefinitionByName("CurrentControlSet")
+        self.assertIsNotNone(artifact_definition)
+        artifact_registry.DeregisterDefinition(artifact_definition)
+
+        names = [
+            artifact_definition.name
+            for artifact_definition in artifact_registry.GetDefinitions()
+        ]
+        self.assertEqual(len(names), 4)
+        self.assertNotIn("EventLogs", names)
+        self.assertNotIn("CurrentControlSet", names)
+        self.assertNotIn("SecurityEventLogEvtxFile", names)
+        self.assertEqual(artifact_registry.GetUndefinedArtifacts(), set())
+
+    def testGetDefinitionByName(self):
+        """Tests the GetDefinitionByName function."""
+        artifact_reader = reader.YamlArtifactsReader()
+
+        artifact_registry = registry.LazyArtifactDefinitionsRegistry()
+        artifact_registry.ReadFromDirectory(artifact_reader, self._TEST_DATA_PATH)
+
+        self.assertEqual(len(artifact_registry._index_entries_by_name), 7)
+        self.assertEqual(len(artifact_registry._artifact_definitions_by_name), 0)
+
+        artifact_definition = artifact_registry.GetDefinitionByName("EventLogs")
+        self.assertIsNotNone(artifact_definition)
+        self.assertEqual(artifact_definition.name, "EventLogs")
+
+        self.assertEqual(len(artifact_registry._index_entries_by_name), 6)
+        self.assertEqual(len(artifact_registry._artifact_definitions_by_name), 1)
+
+        artifact_definition = artifact_registry.GetDefinitionByName("eventlogs")
+        self.assertIsNotNone(artifact_definition)
+
+        artifact_definition = artifact_registry.GetDefinitionByName("Bogus")
+        self.assertIsNone(artifact_definition)
+
+    def testGetDefinitionByAlias(self):
+        """Tests the GetDefinitionByAlias function."""
+        artifact_reader = reader.YamlArtifactsReader()
+
+        artifact_registry = registry.LazyArtifactDefinitionsRegistry()
+        artifact_registry.ReadFromDirectory(artifact_reader, self._TEST_DATA_PATH)
+
+        artifact_definition = artifact_registry.GetDefinitionByAlias(
+            "SecurityEventLogEvtx"
+        )
+        self.assertIsNotNone(artifact_definition)
+        self.assertEqual(artifact_definition.name, "SecurityEventLogEvtxFile")
+
+        self.assertEqual(len(artifact_registry._index_entries_by_alias), 0)
+        self.assertEqual(len(artifact_registry._artifact_definitions_by_name), 1)
+
+    def testGetDefinitions(self):
+        """Tests the GetDefinitions and GetUndefinedArtifacts functions."""
+        artifact_reader = reader.YamlArtifactsReader()
+
+        artifact_registry = registry.ArtifactDefinitionsRegistry()
+        artifact_registry.ReadFromDirectory(artifact_reader, self._DATA_PATH)
+
+        expected_definitions = sorted(
+            [
+                artifact_definition.AsDict()
+                for artifact_definition in artifact_registry.GetDefinitions()
+            ],
+            key=lambda definition: definition["name"],
+        )
+        expected_undefined_artifacts = artifact_registry.GetUndefinedArtifacts()
+
+        artifact_registry = registry.LazyArtifactDefinitionsRegistry()
+        artifact_registry.ReadFromDirectory(artifact_reader, self._DATA_PATH)
+
+        artifact_definition = artifact_registry.GetDefinitionByName("TriagePersistence")
+        self.assertIsNotNone(artifact_definition)
+
+        undefined_artifacts = artifact_registry.GetUndefinedArtifacts()
+        self.assertEqual(undefined_artifacts, expected_undefined_artifacts)
+
+        definitions = sorted(
+            [
+                artifact_definition.AsDict()
+                for artifact_definition in artifact_registry.GetDefinitions()
+            ],
+            key=lambda definition: definition["name"],
+        )
+        self.assertEqual(definitions, expected_definitions)
+
+    def testGetSources(self):
+        """Tests the GetSources and GetDefinitionsByOperatingSystem functions."""
+        artifact_reader = reader.YamlArtifactsReader()
+
+        artifact_registry = registry.ArtifactDefinitionsRegistry()
+        artifact_registry.ReadFromDirectory(artifact_reader, self._DATA_PATH)
+
+        expected_sources = sorted(
+            (artifact_definition.name, source.type_indicator)
+            for artifact_definition, source in artifact_registry.GetSources(
+                operating_system=definitions.SUPPORTED_OS_DARWIN,
+                path_variable="%%users.homedir%%",
+            )
+        )
+        expected_names = sorted(
+            artifact_definition.name
+            for artifact_definition in artifact_registry.GetDefinitionsByOperatingSystem(
+                definitions.SUPPORTED_OS_DARWIN
+            )
+        )
+
+        artifact_registry = registry.LazyArtifactDefinitionsRegistry()
+        artifact_registry.ReadFromDirectory(artifact_reader, self._DATA_PATH)
+
+        sources = sorted(
+            (artifact_definition.name, source.type_indicator)
+            for artifact_definition, source in artifact_registry.GetSources(
+                operating_system=definitions.SUPPORTED_OS_DARWIN,
+                path_variable="%%users.homedir%%",
+            )
+        )
+        self.assertTrue(sources)
+        self.assertEqual(sources, expected_sources)
+
+        names = sorted(
+            artifact_definition.name
+            for artifact_definition in artifact_registry.GetDefinitionsByOperatingSystem(
+                definitions.SUPPORTED_OS_DARWIN
+            )
+        )
+        self.assertEqual(names, expected_names)
+
+    def testRegisterDefinition(self):
+        """Tests the RegisterDefinition function."""
+        test_file = self._GetTestFilePath(["definitions.yaml"])
+        self._SkipIfPathNotExists(test_file)
+
+        artifact_reader = reader.YamlArtifactsReader()
+
+        artifact_registry = registry.LazyArtifactDefinitionsRegistry()
+        artifact_registry.ReadFromFile(artifact_reader, test_file)
+
+        artifact_definitions = list(artifact_reader.ReadFile(test_file))
+
+        # Definitions that are indexed but not read yet are already registered.
+        with self.assertRaises(KeyError):
+            artifact_registry.RegisterDefinition(artifact_definitions[0])
+
+        with self.assertRaises(KeyError):
+            artifact_registry.ReadFromFile(artifact_reader, test_file)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,224 @@
+"""Tests for the artifact definitions reloader."""
+
+import os
+import shutil
+import unittest
+
+from artifacts import errors
+from artifacts import reader
+from artifacts import registry
+from artifacts import reloader
+
+from tests import test_lib
+
+
+class ArtifactDefinitionsReloaderTest(test_lib.BaseTestCase):
+    """Tests for the artifact definitions reloader."""
+
+    _GROUP_DEFINITION = """\
+name: TestGroup
+doc: Test group.
+sources:
+- type: ARTIFACT_GROUP
+  attributes:
+    names: [EventLogs, TestMissing]
+"""
+
+    _FILTERED_DEFINITIONS = """\
+name: TestWindows
+doc: Test Windows file.
+sources:
+- type: FILE
+  attributes:
+    paths: ['%%environ_systemroot%%\\test.txt']
+    separator: '\\'
+supported_os: [Windows]
+---
+name: TestLinuxGroup
+doc: Test group.
+sources:
+- type: ARTIFACT_GROUP
+  attributes:
+    names: [TestWindows]
+supported_os: [Linux]
+"""
+
+    _INVALID_DEFINITION = """\
+name: TestInvalid
+sources:
+- type: ARTIFACT_GROUP
+  attributes:
+    names: [EventLogs]
+"""
+
+    def _WriteFile(self, path, data):
+        """Writes a file and ensures its modification time changes.
+
+        Args:
+          path (str): path of the file.
+          data (str): data of the file.
+        """
+        modification_time = None
+        if os.path.exists(path):
+            modification_time = os.stat(path).st_mtime_ns
+
+        with open(path, "w", encoding="utf-8") as file_object:
+            file_object.write(data)
+
+        if modification_time is not None:
+            os.utime(path, ns=(modification_time + 1000, modification_time + 1000))
+
+    def testReload(self):
+        """Tests the Reload function."""
+        test_file = self._GetTestFilePath(["definitions.yaml"])
+        self._SkipIfPathNotExists(test_file)
+
+        artifact_reader = reader.YamlArtifactsReader()
+        artifact_registry = registry.ArtifactDefinitionsRegistry()
+
+        with test_lib.TempDirectory() as temporary_directory:
+            shutil.copy(test_file, temporary_directory)
+
+            definitions_reloader = reloader.ArtifactDefinitionsReloader(
+                artifact_registry, artifact_reader, temporary_directory
+            )
+
+            changed_files = definitions_reloader.Reload()
+            self.assertEqual(len(changed_files), 1)
+            self.assertEqual(len(list(artifact_registry.GetDefinitions())), 7)
+
+            undefined_artifacts = artifact_registry.GetUndefinedArtifacts()
+
+            changed_files = definitions_reloader.Reload()
+            self.assertEqual(changed_files, [])
+
+            # Add a file.
+            group_file = os.path.join(temporary_directory, "group.yaml")
+            self._WriteFile(group_file, self._GROUP_DEFINITION)
+
+            changed_files, removed_files = definitions_reloader.GetChangedFiles()
+            self.assertEqual(changed_files, [group_file])
+            self.assertEqual(removed_files, [])
+
+            changed_files = definitions_reloader.Reload()
+            self.assertEqual(changed_files, [group_file])
+            self.assertEqual(len(list(artifact_registry.GetDefinitions())), 8)
+            self.assertEqual(
+                artifact_registry.GetUndefinedArtifacts(),
+                undefined_artifacts | {"TestMissing"},
+            )
+
+            # Change a file.
+            self._WriteFile(
+                group_file, self._GROUP_DEFINITION.replace("TestMissing", "Other")
+            )
+
+            definitions_reloader.Reload()
+            self.assertEqual(len(list(artifact_registry.GetDefinitions())), 8)
+            self.assertEqual(
+                artifact_registry.GetUndefinedArtifacts(),
+                undefined_artifacts | {"Other"},
+            )
+
+            # Change a file into an invalid file.
+            self._WriteFile(group_file, self._INVALID_DEFINITION)
+
+            with self.assertRaises(errors.FormatError):
+                definitions_reloader.Reload()
+
+            self.assertIsNotNone(artifact_registry.GetDefinitionByName("TestGroup"))
+            self.assertEqual(
+                artifact_registry.GetUndefinedArtifacts(),
+                undefined_artifacts | {"Other"},
+            )
+
+            # Remove a file.
+            os.remove(group_file)
+
+            changed_files = definitions_reloader.Reload()
+            self.assertEqual(changed_files, [group_file])
+            self.assertEqual(len(list(artifact_registry.GetDefinitions())), 7)
+            self.assertIsNone(artifact_registry.GetDefinitionByName("TestGroup"))
+            self.assertEqual(
+                artifact_registry.GetUndefinedArtifacts(), undefined_artifacts
+            )
+
+    def testReloadWithFilteredDefinitions(self):
+        """Tests the Reload function with filtered artifact definitions."""
+        artifact_reader = reader.YamlArtifactsReader(operating_systems={"Linux"})
+        artifact_registry = registry.ArtifactDefinitionsRegistry()
+
+        with test_lib.TempDirectory() as temporary_directory:
+            test_file = os.path.join(temporary_directory, "filtered.yaml")
+            self._WriteFile(test_file, self._FILTERED_DEFINITIONS)
+
+            definitions_reloader = reloader.ArtifactDefinitionsReloader(
+                artifact_registry, artifact_reader, temporary_directory
+            )
+
+            definitions_reloader.Reload()
+            self.assertIsNotNone(
+                artifact_registry.GetDefinitionByName("TestLinuxGroup")
+            )
+            self.assertIsNone(artifact_registry.GetDefinitionByName("TestWindows"))
+            self.assertEqual(artifact_registry.GetUndefinedArtifacts(), set())
+            self.assertEqual(artifact_reader.filtered_artifact_names, {"TestWindows"})
+
+            # Change the file so that the definition is no longer filtered out.
+            self._WriteFile(
+                test_file, self._FILTERED_DEFINITIONS.replace("[Windows]", "[Linux]")
+            )
+
+            definitions_reloader.Reload()
+            self.assertIsNotNone(artifact_registry.GetDefinitionByName("TestWindows"))
+
+            # Remove the file.
+            os.remove(test_file)
+
+            definitions_reloader.Reload()
+            self.assertEqual(list(artifact_registry.GetDefinitions()), [])
+            self.assertEqual(artifact_registry._filtered_artifact_names, set())
+
+    def testReloadWithFilteredDefinitionsInMultipleFiles(self):
+        """Tests the Reload function with a name filtered out in multiple files."""
+        artifact_reader = reader.YamlArtifactsReader(operating_systems={"Linux"})
+        artifact_registry = registry.ArtifactDefinitionsRegistry()
+
+        with test_lib.TempDirectory() as temporary_directory:
+            test_file = os.path.join(temporary_directory, "filtered.yaml")
+            self._WriteFile(test_file, self._FILTERED_DEFINITIONS)
+
+            other_test_file = os.path.join(temporary_directory, "other.yaml")
+            self._WriteFile(
+                other_test_file, self._FILTERED_DEFINITIONS.split("\n---\n")[0]
+            )
+
+            definitions_reloader = reloader.ArtifactDefinitionsReloader(
+                artifact_registry, artifact_reader, temporary_directory
+            )
+
+            definitions_reloader.Reload()
+            self.assertEqual(
+                artifact_registry._filtered_artifact_names, {"TestWindows"}
+            )
+
+            # Remove the file that also filters out the definition.
+            os.remove(other_test_file)
+
+            definitions_reloader.Reload()
+            self.assertEqual(
+                artifact_registry._filtered_artifact_names, {"TestWindows"}
+            )
+            self.assertEqual(artifact_registry.GetUndefinedArtifacts(), set())
+
+            # Change the file so that the definition is no longer filtered out.
+            self._WriteFile(
+                test_file, self._FILTERED_DEFINITIONS.replace("[Windows]", "[Linux]")
+            )
+
+            definitions_reloader.Reload()
+            self.assertEqual(artifact_registry._filtered_artifact_names, set())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+"""Tests for the source type schema and its compiled validators."""
+
+import unittest
+
+from artifacts import schema
+from artifacts import source_type
+
+from tests import test_lib
+
+
+class ValidatorCompilerTest(test_lib.BaseTestCase):
+    """Tests for the validator compiler."""
+
+    def testCompile(self):
+        """Tests the Compile function."""
+        compiler = schema.ValidatorCompiler()
+
+        validator = compiler.Compile(source_type.PathSourceType)
+        self.assertIsNotNone(validator)
+
+        source_object = validator({"paths": ["test"]})
+        self.assertIsInstance(source_object, source_type.PathSourceType)
+        self.assertEqual(source_object.paths, ["test"])
+        self.assertEqual(source_object.separator, "/")
+        self.assertEqual(source_object.supported_os, [])
+
+        source_object = validator({"paths": ["test"], "separator": "\\\\"})
+        self.assertEqual(source_object.separator, "\\\\")
+
+        self.assertIsNone(validator(None))
+        self.assertIsNone(validator({}))
+        self.assertIsNone(validator({"paths": "test"}))
+        self.assertIsNone(validator({"paths": ["test"], "bogus": "test"}))
+
+        validator = compiler.Compile(test_lib.TestSourceType)
+        self.assertIsNone(validator)
+
+    def testCompileWithItems(self):
+        """Tests the Compile function with schema of items."""
+        compiler = schema.ValidatorCompiler()
+
+        validator = compiler.Compile(source_type.WindowsRegistryValueSourceType)
+        self.assertIsNotNone(validator)
+
+        key_value_pair = {"key": "HKEY_LOCAL_MACHINE\\\\test", "value": "test"}
+        source_object = validator({"key_value_pairs": [key_value_pair]})
+        self.assertIsInstance(source_object, source_type.WindowsRegistryValueSourceType)
+        self.assertEqual(source_object.key_value_pairs, [key_value_pair])
+
+        key_value_pair = {"key": "HKEY_CURRENT_USER\\\\test", "value": "test"}
+        self.assertIsNone(validator({"key_value_pairs": [key_value_pair]}))
+
+        key_value_pair = {"key": "HKEY_LOCAL_MACHINE\\\\test"}
+        self.assertIsNone(validator({"key_value_pairs": [key_value_pair]}))
+
+        self.assertIsNone(validator({"key_value_pairs": ["test"]}))
+
+    def testCompileWithSubclass(self):
+        """Tests the Compile function with a subclass without schema."""
+
+        class TestPathSourceType(source_type.PathSourceType):
+            """Class that implements a test path source type."""
+
+            TYPE_INDICATOR = "TEST_PATH"
+
+        compiler = schema.ValidatorCompiler()
+
+        validator = compiler.Compile(TestPathSourceType)
+        self.assertIsNone(validator)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+"""Tests for the artifact definitions snapshot."""
+
+import os
+import shutil
+import unittest
+
+from artifacts import reader
+from artifacts import registry
+from artifacts import snapshot
+
+from tests import test_lib
+
+
+class ArtifactDefinitionsSnapshotTest(test_lib.BaseTestCase):
+    """Tests for the artifact definitions snapshot."""
+
+    # pylint: disable=protected-access
+
+    def testRead(self):
+        """Tests the Read function."""
+        test_file = self._GetTestFilePath(["definitions.yaml"])
+        self._SkipIfPathNotExists(test_file)
+
+        artifact_reader = reader.YamlArtifactsReader(compact=True)
+        expected_definitions = [
+            artifact_definition.AsDict()
+            for artifact_definition in artifact_reader.ReadFile(test_file)
+        ]
+
+        with test_lib.TempDirectory() as temporary_directory:
+            data_path = os.path.join(temporary_directory, "data")
+            os.mkdir(data_path)
+
+            definitions_file = os.path.join(data_path, "definitions.yaml")
+            shutil.copyfile(test_file, definitions_file)
+
+            snapshot_path = os.path.join(temporary_directory, "data.pickle")
+            definitions_snapshot = snapshot.ArtifactDefinitionsSnapshot(snapshot_path)
+
+            artifact_definitions = definitions_snapshot.Read(data_path)
+            self.assertIsNone(artifact_definitions)
+
+            definitions_snapshot.Write(artifact_reader, data_path)
+
+            artifact_definitions = definitions_snapshot.Read(data_path)
+            self.assertIsNotNone(artifact_definitions)
+            self.assertEqual(
+                [
+                    artifact_definition.AsDict()
+                    for artifact_definition in artifact_definitions
+                ],
+                expected_definitions,
+            )
+
+            with open(definitions_file, "a", encoding="utf-8") as file_object:
+                file_object.write("\n")
+
+            artifact_definitions = definitions_snapshot.Read(data_path)
+            self.assertIsNone(artifact_definitions)
+
+            artifact_definitions = definitions_snapshot.Read(data_path, verify=False)
+            self.assertIsNotNone(artifact_definitions)
+
+    def testReadWithCorruptedSnapshot(self):
+        """Tests the Read function with a corrupted snapshot."""
+        with test_lib.TempDirectory() as temporary_directory:
+            snapshot_path = os.path.join(temporary_directory, "data.pickle")
+            # Unpickling this data raises ValueError.
+            with open(snapshot_path, "wb") as file_object:
+                file_object.write(b"Inot-a-number\n.")
+
+            definitions_snapshot = snapshot.ArtifactDefinitionsSnapshot(snapshot_path)
+
+            artifact_definitions = definitions_snapshot.Read(temporary_directory)
+            self.assertIsNone(artifact_definitions)
+
+    def testReadWithChangedSchema(self):
+        """Tests the Read function with a changed definitions schema."""
+        test_file = self._GetTestFilePath(["definitions.yaml"])
+        self._SkipIfPathNotExists(test_file)
+
+        artifact_reader = reader.YamlArtifactsReader(compact=True)
+
+        with test_lib.TempDirectory() as temporary_directory:
+            data_path = os.path.join(temporary_directory, "data")
+            os.mkdir(data_path)
+
+            definitions_file = os.path.join(data_path, "definitions.yaml")
+            shutil.copyfile(test_file, definitions_file)
+
+            snapshot_path = os.path.join(temporary_directory, "data.pickle")
+            definitions_snapshot = snapshot.ArtifactDefinitionsSnapshot(snapshot_path)
+            definitions_snapshot.Write(artifact_reader, data_path)
+
+            registry.ArtifactDefinitionsRegistry.RegisterSourceType(
+                test_lib.TestSourceType
+            )
+
+            try:
+                artifact_definitions = definitions_snapshot.Read(data_path)
+                self.assertIsNone(artifact_definitions)
+
+            finally:
+                registry.ArtifactDefinitionsRegistry.DeregisterSourceType(
+                    test_lib.TestSourceType
+                )
+
+            artifact_definitions = definitions_snapshot.Read(data_path)
+            self.assertIsNotNone(artifact_definitions)
+
+    def testGetFileDigests(self):
+        """Tests the _GetFileDigests function."""
+        definitions_snapshot = snapshot.ArtifactDefinitionsSnapshot("data.pickle")
+
+        file_digests = definitions_snapshot._GetFileDigests(
+            self._TEST_DATA_PATH, "yaml"
+        )
+        self.assertIn("definitions.yaml", file_digests)
+        self.assertEqual(len(file_digests["definitions.yaml"]), 64)
+
+
+if __name__ == "__main__":
+    unittest.main()
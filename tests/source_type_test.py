@@ -8,9 +8,87 @@ from artifacts import source_type
 from tests import test_lib
 
 
+class KeyValuePairTest(test_lib.BaseTestCase):
+    """Class to test the Windows Registry key path and value name pair."""
+
+    def testEqual(self):
+        """Tests the __eq__ function."""
+        key_value_pair = source_type.KeyValuePair("HKEY_LOCAL_MACHINE\\test", "test")
+
+        self.assertEqual(
+            key_value_pair,
+            source_type.KeyValuePair("HKEY_LOCAL_MACHINE\\test", "test"),
+        )
+        self.assertEqual(
+            key_value_pair, {"key": "HKEY_LOCAL_MACHINE\\test", "value": "test"}
+        )
+        self.assertNotEqual(
+            key_value_pair, {"key": "HKEY_LOCAL_MACHINE\\test", "value": "bogus"}
+        )
+
+    def testGetItem(self):
+        """Tests the __getitem__ function."""
+        key_value_pair = source_type.KeyValuePair("HKEY_LOCAL_MACHINE\\test", "test")
+
+        self.assertEqual(key_value_pair["key"], "HKEY_LOCAL_MACHINE\\test")
+        self.assertEqual(key_value_pair["value"], "test")
+
+        with self.assertRaises(KeyError):
+            _ = key_value_pair["bogus"]
+
+
 class SourceTypeTest(test_lib.BaseTestCase):
     """Class to test the artifact source type."""
 
+    # pylint: disable=protected-access
+
+    def testGetDefaultAttributes(self):
+        """Tests the _GetDefaultAttributes function."""
+        default_attributes = source_type.PathSourceType._GetDefaultAttributes()
+        self.assertEqual(default_attributes, {"paths": None, "separator": "/"})
+
+    def testCreateWithoutValidation(self):
+        """Tests the CreateWithoutValidation function."""
+        source_object = source_type.PathSourceType.CreateWithoutValidation(
+            {"paths": ["test"]}
+        )
+        self.assertIsInstance(source_object, source_type.PathSourceType)
+        self.assertEqual(source_object.paths, ["test"])
+        self.assertEqual(source_object.separator, "/")
+        self.assertEqual(source_object.supported_os, [])
+
+        source_object = (
+            source_type.WindowsRegistryKeySourceType.CreateWithoutValidation(
+                {"keys": ["HKEY_CURRENT_USER\\test"]}
+            )
+        )
+        self.assertEqual(source_object.keys, ["HKEY_CURRENT_USER\\test"])
+
+    def testCreateWithoutValidationWithoutSchema(self):
+        """Tests the CreateWithoutValidation function without schema."""
+
+        class TestSourceType(source_type.PathSourceType):
+            """Source type with keyword arguments and without schema."""
+
+            __slots__ = ("mode",)
+
+            def __init__(self, *, mode="read", **kwargs):
+                """Initializes a source type."""
+                super().__init__(**kwargs)
+                self.mode = mode
+
+        self.assertIsNone(TestSourceType._GetDefaultAttributes())
+
+        source_object = TestSourceType.CreateWithoutValidation({"paths": ["test"]})
+        self.assertIsInstance(source_object, TestSourceType)
+        self.assertEqual(source_object.mode, "read")
+        self.assertEqual(source_object.paths, ["test"])
+        self.assertEqual(source_object.separator, "/")
+
+        # The constructor enforces the invariants of the source type.
+        with self.assertRaises(errors.FormatError):
+            TestSourceType.CreateWithoutValidation({})
+
 
 class ArtifactGroupSourceTypeTest(test_lib.BaseTestCase):
     """Class to test the artifact group source type."""
@@ -49,6 +127,15 @@ class PathSourceTypeTest(test_lib.BaseTestCase):
         with self.assertRaises(errors.FormatError):
             source_type.PathSourceType(paths="test")
 
+    def testCompact(self):
+        """Tests the Compact function."""
+        source_object = source_type.PathSourceType(paths=["test"], separator="\\")
+        source_object.Compact()
+
+        self.assertEqual(source_object.paths, ("test",))
+        self.assertEqual(source_object.supported_os, ())
+        self.assertEqual(source_object.AsDict(), {"paths": ["test"], "separator": "\\"})
+
 
 class WindowsRegistryKeySourceTypeTest(test_lib.BaseTestCase):
     """Class to test the Windows Registry keys source type."""
@@ -76,6 +163,21 @@ class WindowsRegistryValueSourceTypeTest(test_lib.BaseTestCase):
         with self.assertRaises(errors.FormatError):
             source_type.WindowsRegistryValueSourceType(key_value_pairs=key_value_pair)
 
+    def testCompact(self):
+        """Tests the Compact function."""
+        key_value_pair = {"key": "HKEY_LOCAL_MACHINE\\test", "value": "test"}
+        source_object = source_type.WindowsRegistryValueSourceType(
+            key_value_pairs=[key_value_pair]
+        )
+        source_object.Compact()
+
+        self.assertIsInstance(source_object.key_value_pairs, tuple)
+        self.assertIsInstance(
+            source_object.key_value_pairs[0], source_type.KeyValuePair
+        )
+        self.assertEqual(source_object.key_value_pairs[0], key_value_pair)
+        self.assertEqual(source_object.AsDict(), {"key_value_pairs": [key_value_pair]})
+
 
 class WMIQuerySourceTypeTest(test_lib.BaseTestCase):
     """Class to test the WMI query source type."""
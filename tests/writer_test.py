@@ -45,6 +45,67 @@ class ArtifactsWriterTest(test_lib.BaseTestCase):
             artifact_reader, artifact_writer, "definitions.json"
         )
 
+    def testJsonLinesWriter(self):
+        """Tests conversion with the JsonLinesArtifactsWriter."""
+        artifact_reader = reader.JsonLinesArtifactsReader()
+        artifact_writer = writer.JsonLinesArtifactsWriter()
+        self._TestArtifactsConversion(
+            artifact_reader, artifact_writer, "definitions.jsonl"
+        )
+
+    def testJsonLinesWriterAppend(self):
+        """Tests appending with the JsonLinesArtifactsWriter."""
+        test_file = self._GetTestFilePath(["definitions.jsonl"])
+        self._SkipIfPathNotExists(test_file)
+
+        artifact_reader = reader.JsonLinesArtifactsReader()
+        artifact_writer = writer.JsonLinesArtifactsWriter()
+
+        artifact_definitions = list(artifact_reader.ReadFile(test_file))
+
+        with test_lib.TempDirectory() as temporary_directory:
+            output_file = os.path.join(temporary_directory, "definitions.jsonl")
+
+            artifact_writer.WriteArtifactsFile(artifact_definitions[:3], output_file)
+            artifact_writer.WriteArtifactsFile(
+                artifact_definitions[3:], output_file, append=True
+            )
+
+            converted_artifact_definitions = list(artifact_reader.ReadFile(output_file))
+
+        self.assertListEqual(
+            [artifact.AsDict() for artifact in artifact_definitions],
+            [artifact.AsDict() for artifact in converted_artifact_definitions],
+        )
+
+    def testJsonLinesWriterAppendWithoutEndOfLine(self):
+        """Tests appending to a file without end-of-line."""
+        test_file = self._GetTestFilePath(["definitions.jsonl"])
+        self._SkipIfPathNotExists(test_file)
+
+        artifact_reader = reader.JsonLinesArtifactsReader()
+        artifact_writer = writer.JsonLinesArtifactsWriter()
+
+        artifact_definitions = list(artifact_reader.ReadFile(test_file))
+
+        with test_lib.TempDirectory() as temporary_directory:
+            output_file = os.path.join(temporary_directory, "definitions.jsonl")
+
+            file_data = artifact_writer.FormatArtifacts(artifact_definitions[:3])
+            with open(output_file, "w", encoding="utf-8") as file_object:
+                file_object.write(file_data.rstrip("\n"))
+
+            artifact_writer.WriteArtifactsFile(
+                artifact_definitions[3:], output_file, append=True
+            )
+
+            converted_artifact_definitions = list(artifact_reader.ReadFile(output_file))
+
+        self.assertListEqual(
+            [artifact.AsDict() for artifact in artifact_definitions],
+            [artifact.AsDict() for artifact in converted_artifact_definitions],
+        )
+
     def testYamlWriter(self):
         """Tests conversion with the YamlArtifactsWriter."""
         artifact_reader = reader.YamlArtifactsReader()